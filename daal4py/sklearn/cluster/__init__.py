@@ -17,4 +17,5 @@
 
 from .k_means import KMeans
 from .dbscan import DBSCAN
-__all__ = ['KMeans', 'DBSCAN']
+from .minibatch_k_means import MiniBatchKMeans
+__all__ = ['KMeans', 'DBSCAN', 'MiniBatchKMeans']
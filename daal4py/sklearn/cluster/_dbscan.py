@@ -16,6 +16,7 @@
 
 import numpy as np
 from scipy import sparse as sp
+from scipy.sparse.csgraph import connected_components
 
 from sklearn.utils import check_array
 from sklearn.utils.validation import _check_sample_weight
@@ -26,13 +27,19 @@ import daal4py
 from daal4py.sklearn._utils import (
     make2d, getFPType, get_patch_message, PatchingConditionsChain)
 import logging
+import warnings
 
 from .._device_offload import support_usm_ndarray
 from .._utils import sklearn_check_version
 
+try:
+    from onedal.neighbors import NearestNeighbors as onedal_NearestNeighbors
+    _onedal_neighbors_available = True
+except ImportError:
+    _onedal_neighbors_available = False
 
-def _daal_dbscan(X, eps=0.5, min_samples=5, sample_weight=None):
-    ww = make2d(sample_weight) if sample_weight is not None else None
+
+def _daal_dbscan_distributed(X, eps=0.5, min_samples=5):
     XX = make2d(X)
 
     fpt = getFPType(XX)
@@ -41,7 +48,28 @@ def _daal_dbscan(X, eps=0.5, min_samples=5, sample_weight=None):
         fptype=fpt,
         epsilon=float(eps),
         minObservations=int(min_samples),
-        memorySavingMode=False,
+        distributed=True
+    )
+
+    # the distributed algorithm returns the assignments of the local
+    # observations only and does not compute core indices
+    daal_res = alg.compute(XX)
+    return daal_res.assignments.ravel().astype(np.intc)
+
+
+def _daal_dbscan(X, eps=0.5, min_samples=5, sample_weight=None,
+                 memory_saving=False):
+    ww = make2d(sample_weight) if sample_weight is not None else None
+    # CSR matrices are passed to oneDAL as CSR numeric tables without a copy
+    XX = X if sp.isspmatrix_csr(X) else make2d(X)
+
+    fpt = getFPType(XX)
+    alg = daal4py.dbscan(
+        method='defaultDense',
+        fptype=fpt,
+        epsilon=float(eps),
+        minObservations=int(min_samples),
+        memorySavingMode=bool(memory_saving),
         resultsToCompute="computeCoreIndices"
     )
 
@@ -55,6 +83,72 @@ def _daal_dbscan(X, eps=0.5, min_samples=5, sample_weight=None):
     return (core_ind, assignments)
 
 
+def _with_self_loops(graph):
+    """Copy of a sparse neighbors graph where each sample is its own neighbor,
+    as in the stock estimator"""
+    graph = graph.copy()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", sp.SparseEfficiencyWarning)
+        graph.setdiag(graph.diagonal())
+    return graph
+
+
+def _dbscan_precomputed(X, eps=0.5, min_samples=5, sample_weight=None):
+    """DBSCAN on a square distance matrix or a sparse (radius) neighbors graph.
+
+    Clusters are the connected components of the graph of core samples.
+    Border samples join the cluster of the lowest labeled adjacent core
+    sample, which is where the sequential expansion of the stock estimator
+    puts them as well. This only holds for a symmetric neighborhood relation:
+    on an asymmetric graph, such as a kNN graph, the stock expansion depends
+    on the order of the samples, and None is returned instead.
+    """
+    if X.shape[0] != X.shape[1]:
+        raise ValueError(
+            f"Precomputed matrix must be square. "
+            f"Input is a {X.shape[0]}x{X.shape[1]} matrix.")
+    n_samples = X.shape[0]
+
+    if sp.issparse(X):
+        # only stored entries are neighbors, stored zeros included; the
+        # index arrays are copied as eliminate_zeros rewrites them in place
+        adjacency = sp.csr_matrix(
+            (X.data <= eps, X.indices, X.indptr), shape=X.shape, copy=True)
+    else:
+        adjacency = sp.csr_matrix(X <= eps)
+    adjacency.eliminate_zeros()
+    if (adjacency != adjacency.T).nnz > 0:
+        return None
+
+    if sample_weight is None:
+        n_neighbors = np.diff(adjacency.indptr)
+    else:
+        n_neighbors = adjacency @ sample_weight
+    core = n_neighbors >= min_samples
+    core_ind = np.flatnonzero(core)
+
+    labels = np.full(n_samples, -1, dtype=np.intp)
+    if core_ind.size == 0:
+        return core_ind, labels
+
+    # components are numbered in order of their lowest core sample,
+    # which is the order in which the stock estimator seeds clusters
+    core_adjacency = adjacency[core_ind][:, core_ind]
+    _, core_labels = connected_components(
+        core_adjacency, directed=True, connection='weak')
+    labels[core_ind] = core_labels
+
+    core_edges = adjacency[core_ind].tocoo()
+    border = ~core[core_edges.col]
+    border_labels = np.full(n_samples, np.iinfo(np.intp).max, dtype=np.intp)
+    np.minimum.at(border_labels, core_edges.col[border],
+                  core_labels[core_edges.row[border]])
+    is_border = border_labels != np.iinfo(np.intp).max
+    labels[is_border] = border_labels[is_border]
+
+    return core_ind, labels
+
+
 class DBSCAN(DBSCAN_original):
     """Perform DBSCAN clustering from vector array or distance matrix.
 
@@ -85,6 +179,9 @@ class DBSCAN(DBSCAN_original):
         If metric is "precomputed", X is assumed to be a distance matrix and
         must be square. X may be a :term:`Glossary <sparse graph>`, in which
         case only "nonzero" elements may be considered neighbors for DBSCAN.
+        A radius neighbors graph built by the oneDAL neighbors backend
+        (``onedal.neighbors.NearestNeighbors.radius_neighbors_graph``) can be
+        passed this way.
 
         .. versionadded:: 0.17
            metric *precomputed* to accept precomputed sparse matrix.
@@ -100,7 +197,9 @@ class DBSCAN(DBSCAN_original):
         See NearestNeighbors module documentation for details.
 
         If algorithm is set to 'daal', Intel(R) oneAPI Data Analytics Library
-        will be used.
+        will be used. If algorithm is set to 'kd_tree' with a euclidean metric,
+        the neighborhoods are found with the k-d tree search of the oneDAL
+        neighbors backend when the onedal package is available.
 
     leaf_size : int, optional (default = 30)
         Leaf size passed to BallTree or cKDTree. This can affect the speed
@@ -118,6 +217,21 @@ class DBSCAN(DBSCAN_original):
         ``-1`` means using all processors. See :term:`Glossary <n_jobs>`
         for more details.
 
+    memory_saving : bool, optional (default = False)
+        If True, Intel(R) oneAPI Data Analytics Library does not keep the
+        neighborhoods of all observations in memory but recomputes them when
+        clusters are expanded. Memory use then stays linear in the number of
+        samples, at the cost of computing distances more than once. Useful
+        for large dense data where the neighborhoods would not fit in memory.
+
+    distributed : bool, optional (default = False)
+        Cluster in SPMD mode: every rank passes its shard of the data and
+        the ranks compute one clustering together (see daal4py.daalinit).
+        labels_ are those of the local shard and use cluster ids which are
+        consistent across ranks. core_sample_indices_ and components_ are
+        not computed in this mode. Only the 'euclidean' metric without
+        sample weights is supported.
+
     Attributes
     ----------
     core_sample_indices_ : array, shape = [n_core_samples]
@@ -197,6 +311,8 @@ class DBSCAN(DBSCAN_original):
         leaf_size=30,
         p=None,
         n_jobs=None,
+        memory_saving=False,
+        distributed=False,
     ):
         self.eps = eps
         self.min_samples = min_samples
@@ -206,6 +322,8 @@ class DBSCAN(DBSCAN_original):
         self.leaf_size = leaf_size
         self.p = p
         self.n_jobs = n_jobs
+        self.memory_saving = memory_saving
+        self.distributed = distributed
 
     @support_usm_ndarray()
     def fit(self, X, y=None, sample_weight=None):
@@ -242,6 +360,64 @@ class DBSCAN(DBSCAN_original):
         if sample_weight is not None:
             sample_weight = _check_sample_weight(sample_weight, X)
 
+        if self.distributed:
+            self._fit_distributed(X, sample_weight)
+            return self
+
+        if self.metric == 'precomputed':
+            # oneDAL takes no distance matrices, the clusters are found as
+            # connected components of the neighbors graph with scipy
+            logging.info("sklearn.cluster.DBSCAN.fit: running the SciPy "
+                         "connected components version for a precomputed metric")
+            X = check_array(X, accept_sparse='csr', dtype=[np.float64, np.float32])
+            if sp.issparse(X):
+                X = _with_self_loops(X)
+            result = _dbscan_precomputed(
+                X,
+                self.eps,
+                self.min_samples,
+                sample_weight=sample_weight
+            )
+            if result is not None:
+                core_ind, assignments = result
+                self.core_sample_indices_ = core_ind
+                self.labels_ = assignments
+                self.components_ = X[core_ind].copy()
+                self.n_features_in_ = X.shape[1]
+                return self
+            logging.info("sklearn.cluster.DBSCAN.fit: the precomputed neighbors "
+                         "graph is not symmetric, " + get_patch_message("sklearn"))
+            return super().fit(X, y, sample_weight=sample_weight)
+
+        euclidean = self.metric == 'euclidean' or \
+            (self.metric == 'minkowski' and self.p == 2)
+        if self.algorithm == 'kd_tree' and euclidean and \
+                _onedal_neighbors_available and not sp.issparse(X):
+            # oneDAL DBSCAN has no k-d tree method, the radius graph is built
+            # with the oneDAL k-d tree search and clustered with scipy
+            logging.info("sklearn.cluster.DBSCAN.fit: running the SciPy "
+                         "connected components version on a oneDAL k-d tree "
+                         "radius neighbors graph")
+            X = check_array(X, dtype=[np.float64, np.float32])
+            graph = onedal_NearestNeighbors(algorithm='kd_tree').fit(
+                X, None).radius_neighbors_graph(radius=self.eps)
+            result = _dbscan_precomputed(
+                _with_self_loops(graph),
+                self.eps,
+                self.min_samples,
+                sample_weight=sample_weight
+            )
+            if result is not None:
+                core_ind, assignments = result
+                self.core_sample_indices_ = core_ind
+                self.labels_ = assignments
+                self.components_ = np.take(X, core_ind, axis=0)
+                self.n_features_in_ = X.shape[1]
+                return self
+            logging.info("sklearn.cluster.DBSCAN.fit: the radius neighbors "
+                         "graph is not symmetric, " + get_patch_message("sklearn"))
+            return super().fit(X, y, sample_weight=sample_weight)
+
         _patching_status = PatchingConditionsChain(
             "sklearn.cluster.DBSCAN.fit")
         _dal_ready = _patching_status.and_conditions([
@@ -250,26 +426,53 @@ class DBSCAN(DBSCAN_original):
                 "Only 'auto' and 'brute' algorithms are supported"),
             (self.metric == 'euclidean' or (self.metric == 'minkowski' and self.p == 2),
                 f"'{self.metric}' (p={self.p}) metric is not supported. "
-                "Only 'euclidean' or 'minkowski' with p=2 metrics are supported."),
-            (not sp.issparse(X), "X is sparse. Sparse input is not supported.")
+                "Only 'euclidean', 'minkowski' with p=2 or 'precomputed' "
+                "metrics are supported.")
         ])
 
         _patching_status.write_log()
         if _dal_ready:
-            X = check_array(X, accept_sparse='csr', dtype=[np.float64, np.float32])
+            X = check_array(X, accept_sparse='csr', dtype=[np.float64, np.float32],
+                            accept_large_sparse=False)
             core_ind, assignments = _daal_dbscan(
                 X,
                 self.eps,
                 self.min_samples,
-                sample_weight=sample_weight
+                sample_weight=sample_weight,
+                memory_saving=self.memory_saving
             )
             self.core_sample_indices_ = core_ind
             self.labels_ = assignments
-            self.components_ = np.take(X, core_ind, axis=0)
+            if sp.issparse(X):
+                self.components_ = X[core_ind].copy()
+            else:
+                self.components_ = np.take(X, core_ind, axis=0)
             self.n_features_in_ = X.shape[1]
             return self
         return super().fit(X, y, sample_weight=sample_weight)
 
+    def _fit_distributed(self, X, sample_weight):
+        # all ranks have to take the same path, so there is no fallback
+        if self.algorithm not in ['auto', 'brute']:
+            raise ValueError(
+                f"'{self.algorithm}' algorithm is not supported in distributed "
+                "mode. Only 'auto' and 'brute' algorithms are supported.")
+        euclidean = self.metric == 'euclidean' or \
+            (self.metric == 'minkowski' and self.p == 2)
+        if not euclidean:
+            raise ValueError(
+                f"'{self.metric}' (p={self.p}) metric is not supported in "
+                "distributed mode. Only 'euclidean' or 'minkowski' with p=2 "
+                "metrics are supported.")
+        if sp.issparse(X):
+            raise ValueError("Sparse input is not supported in distributed mode.")
+        if sample_weight is not None:
+            raise ValueError("Sample weights are not supported in distributed mode.")
+
+        X = check_array(X, dtype=[np.float64, np.float32])
+        self.labels_ = _daal_dbscan_distributed(X, self.eps, self.min_samples)
+        self.n_features_in_ = X.shape[1]
+
     @support_usm_ndarray()
     def fit_predict(self, X, y=None, sample_weight=None):
         """
@@ -0,0 +1,205 @@
+#===============================================================================
+# Copyright 2022 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+
+import numpy as np
+from scipy import sparse as sp
+
+from sklearn.cluster import MiniBatchKMeans as MiniBatchKMeans_original
+from sklearn.utils import check_random_state
+from sklearn.utils.validation import _check_sample_weight, check_is_fitted
+
+from .._utils import sklearn_check_version, PatchingConditionsChain
+from .._device_offload import support_usm_ndarray
+from ._k_means_0_23 import (
+    _daal4py_k_means_predict,
+    _daal4py_weighted_labels_inertia,
+    _weighted_cluster_sums)
+
+
+def _daal4py_mini_batch_step(X, sample_weight, centers, weight_sums,
+                             random_state, random_reassign=False,
+                             reassignment_ratio=0.01, verbose=False):
+    """Incremental update of the centers with one mini-batch.
+
+    The batch is assigned to the current centers by oneDAL; the weighted
+    per-cluster sums of the batch are then folded into the running means.
+    centers and weight_sums are updated in place.
+    """
+    n_samples = X.shape[0]
+    n_clusters = centers.shape[0]
+    labels = _daal4py_k_means_predict(X, n_clusters, centers)[0]
+
+    batch_sums, batch_weights = _weighted_cluster_sums(
+        X, labels, sample_weight, n_clusters)
+
+    updated = batch_weights > 0
+    new_weight_sums = weight_sums[updated] + batch_weights[updated]
+    center_sums = centers[updated] * weight_sums[updated, np.newaxis]
+    center_sums += batch_sums[updated]
+    centers[updated] = center_sums / new_weight_sums[:, np.newaxis]
+    weight_sums[updated] = new_weight_sums
+
+    # Reassign clusters that have very low weight, as the stock implementation
+    if random_reassign and reassignment_ratio > 0:
+        to_reassign = weight_sums < reassignment_ratio * weight_sums.max()
+
+        # pick at most .5 * batch_size samples as new centers
+        if to_reassign.sum() > 0.5 * n_samples:
+            indices_dont_reassign = np.argsort(weight_sums)[int(0.5 * n_samples):]
+            to_reassign[indices_dont_reassign] = False
+        n_reassigns = to_reassign.sum()
+
+        if n_reassigns:
+            new_centers = random_state.choice(
+                n_samples, replace=False, size=n_reassigns)
+            if verbose:
+                print(f"[MiniBatchKMeans] Reassigning {n_reassigns} cluster centers.")
+            new_rows = X[new_centers]
+            centers[to_reassign] = new_rows.toarray() if sp.issparse(new_rows) \
+                else new_rows
+
+        # reset counts of reassigned centers, but don't reset them too small
+        # to avoid instant reassignment
+        weight_sums[to_reassign] = np.min(weight_sums[~to_reassign])
+
+
+class MiniBatchKMeans(MiniBatchKMeans_original):
+    __doc__ = MiniBatchKMeans_original.__doc__
+
+    @support_usm_ndarray()
+    def partial_fit(self, X, y=None, sample_weight=None):
+        """Update k means estimate on a single mini-batch X.
+
+        The first call initializes the centers with the stock implementation,
+        later batches are assigned to the centers by oneDAL.
+
+        Parameters
+        ----------
+        X : {array-like, sparse matrix} of shape (n_samples, n_features)
+            Training instances to cluster. It must be noted that the data
+            will be converted to C ordering, which will cause a memory copy
+            if the given data is not C-contiguous.
+            If a sparse matrix is passed, a copy will be made if it's not in
+            CSR format.
+
+        y : Ignored
+            Not used, present here for API consistency by convention.
+
+        sample_weight : array-like of shape (n_samples,), default=None
+            The weights for each observation in X. If None, all observations
+            are assigned equal weight.
+
+        Returns
+        -------
+        self : object
+            Return updated estimator.
+        """
+        has_centers = hasattr(self, "cluster_centers_")
+
+        _patching_status = PatchingConditionsChain(
+            "sklearn.cluster.MiniBatchKMeans.partial_fit")
+        _dal_ready = _patching_status.and_conditions([
+            (sklearn_check_version('1.0'),
+                "Scikit-learn versions older than 1.0 are not supported."),
+            (has_centers and hasattr(self, '_counts'),
+                "The centers are not initialized yet.")
+        ])
+        _patching_status.write_log()
+
+        if not _dal_ready:
+            return super().partial_fit(X, y, sample_weight=sample_weight)
+
+        X = self._validate_data(
+            X,
+            accept_sparse="csr",
+            dtype=[np.float64, np.float32],
+            order="C",
+            accept_large_sparse=False,
+            reset=False,
+        )
+        # fit() leaves these unset, as in the stock partial_fit
+        self._random_state = getattr(
+            self, "_random_state", check_random_state(self.random_state))
+        self.n_steps_ = getattr(self, "n_steps_", 0)
+        self._n_since_last_reassign = getattr(self, "_n_since_last_reassign", 0)
+        sample_weight = _check_sample_weight(sample_weight, X, dtype=X.dtype)
+        centers = self.cluster_centers_.astype(X.dtype, copy=False)
+
+        _daal4py_mini_batch_step(
+            X,
+            sample_weight=sample_weight,
+            centers=centers,
+            weight_sums=self._counts,
+            random_state=self._random_state,
+            random_reassign=self._random_reassign(),
+            reassignment_ratio=self.reassignment_ratio,
+            verbose=self.verbose,
+        )
+        self.cluster_centers_ = centers
+
+        if self.compute_labels:
+            self.labels_, self.inertia_ = _daal4py_weighted_labels_inertia(
+                X, sample_weight, self.cluster_centers_)
+
+        self.n_steps_ += 1
+        return self
+
+    @support_usm_ndarray()
+    def predict(self, X, sample_weight=None):
+        """Predict the closest cluster each sample in X belongs to.
+
+        In the vector quantization literature, `cluster_centers_` is called
+        the code book and each value returned by `predict` is the index of
+        the closest code in the code book.
+
+        Parameters
+        ----------
+        X : {array-like, sparse matrix} of shape (n_samples, n_features)
+            New data to predict.
+
+        sample_weight : array-like of shape (n_samples,), default=None
+            The weights for each observation in X. If None, all observations
+            are assigned equal weight.
+
+        Returns
+        -------
+        labels : ndarray of shape (n_samples,)
+            Index of the cluster each sample belongs to.
+        """
+        check_is_fitted(self)
+
+        _patching_status = PatchingConditionsChain(
+            "sklearn.cluster.MiniBatchKMeans.predict")
+        _dal_ready = _patching_status.and_conditions([
+            (sklearn_check_version('1.0'),
+                "Scikit-learn versions older than 1.0 are not supported.")
+        ])
+        _patching_status.write_log()
+
+        if not _dal_ready:
+            return super().predict(X, sample_weight=sample_weight)
+
+        X = self._validate_data(
+            X,
+            accept_sparse="csr",
+            dtype=[np.float64, np.float32],
+            order="C",
+            accept_large_sparse=False,
+            reset=False,
+        )
+        centers = self.cluster_centers_.astype(X.dtype, copy=False)
+        return _daal4py_k_means_predict(X, self.n_clusters, centers)[0]
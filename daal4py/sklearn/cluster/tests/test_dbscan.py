@@ -16,6 +16,7 @@
 
 import numpy as np
 import pytest
+from scipy import sparse as sp
 from sklearn.cluster import DBSCAN as DBSCAN_SKLEARN
 from daal4py.sklearn.cluster import DBSCAN as DBSCAN_DAAL
 
@@ -102,3 +103,80 @@ def _test_across_grid_parameter_numpy_gen(metric, use_weights: bool):
 def test_across_grid_parameter_numpy_gen(metric, use_weights: bool):
     _test_across_grid_parameter_numpy_gen(
         metric=metric, use_weights=use_weights)
+
+
+@pytest.mark.parametrize('use_weights', USE_WEIGHTS)
+def test_dbscan_sparse(use_weights: bool):
+    rng = np.random.RandomState(0)
+    data = rng.uniform(size=(500, 20))
+    data[data < 0.7] = 0.0
+    weights = rng.uniform(size=500) if use_weights else None
+    X = sp.csr_matrix(data)
+
+    daal_dbscan = DBSCAN_DAAL(eps=1.2, min_samples=5).fit(X, sample_weight=weights)
+    sklearn_dbscan = DBSCAN_SKLEARN(eps=1.2, min_samples=5).fit(
+        X, sample_weight=weights)
+    check_labels_equals(daal_dbscan.labels_, sklearn_dbscan.labels_)
+    assert np.array_equal(np.sort(daal_dbscan.core_sample_indices_),
+                          sklearn_dbscan.core_sample_indices_)
+    assert sp.issparse(daal_dbscan.components_)
+
+
+@pytest.mark.parametrize('use_weights', USE_WEIGHTS)
+def test_dbscan_memory_saving(use_weights: bool):
+    data, weights = generate_data(low=-100.0, high=100.0, samples_number=1000,
+                                  sample_dimension=4)
+    if use_weights is False:
+        weights = None
+
+    default = DBSCAN_DAAL(eps=35.0, min_samples=6).fit(data, sample_weight=weights)
+    memory_saving = DBSCAN_DAAL(eps=35.0, min_samples=6, memory_saving=True).fit(
+        data, sample_weight=weights)
+    assert np.array_equal(default.labels_, memory_saving.labels_)
+    assert np.array_equal(default.core_sample_indices_,
+                          memory_saving.core_sample_indices_)
+
+
+@pytest.mark.parametrize('use_weights', USE_WEIGHTS)
+@pytest.mark.parametrize('graph', ['radius', 'knn', 'dense'])
+def test_dbscan_precomputed(use_weights: bool, graph: str):
+    from sklearn.metrics import pairwise_distances
+    from sklearn.neighbors import NearestNeighbors, kneighbors_graph
+
+    rng = np.random.RandomState(0)
+    data = rng.uniform(size=(400, 2))
+    weights = rng.uniform(high=2.0, size=400) if use_weights else None
+    eps, min_samples = 0.05, 4
+    if graph == 'radius':
+        X = NearestNeighbors(radius=eps).fit(data).radius_neighbors_graph(
+            mode='distance')
+    elif graph == 'knn':
+        # kNN graphs are not symmetric
+        X = kneighbors_graph(data, 3, mode='distance')
+    else:
+        X = pairwise_distances(data)
+
+    daal_dbscan = DBSCAN_DAAL(eps=eps, min_samples=min_samples,
+                              metric='precomputed').fit(X, sample_weight=weights)
+    sklearn_dbscan = DBSCAN_SKLEARN(eps=eps, min_samples=min_samples,
+                                    metric='precomputed').fit(X, sample_weight=weights)
+    assert np.array_equal(daal_dbscan.labels_, sklearn_dbscan.labels_)
+    assert np.array_equal(daal_dbscan.core_sample_indices_,
+                          sklearn_dbscan.core_sample_indices_)
+
+
+@pytest.mark.parametrize('use_weights', USE_WEIGHTS)
+def test_dbscan_kd_tree(use_weights: bool):
+    rng = np.random.RandomState(0)
+    data = rng.uniform(size=(400, 2))
+    weights = rng.uniform(high=2.0, size=400) if use_weights else None
+    eps, min_samples = 0.05, 4
+
+    daal_dbscan = DBSCAN_DAAL(eps=eps, min_samples=min_samples,
+                              algorithm='kd_tree').fit(data, sample_weight=weights)
+    sklearn_dbscan = DBSCAN_SKLEARN(eps=eps, min_samples=min_samples,
+                                    algorithm='kd_tree').fit(data, sample_weight=weights)
+    assert np.array_equal(daal_dbscan.labels_, sklearn_dbscan.labels_)
+    assert np.array_equal(daal_dbscan.core_sample_indices_,
+                          sklearn_dbscan.core_sample_indices_)
+    assert np.array_equal(daal_dbscan.components_, sklearn_dbscan.components_)
@@ -0,0 +1,138 @@
+#===============================================================================
+# Copyright 2022 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+from sklearn.datasets import make_blobs
+from daal4py.sklearn.cluster import KMeans
+from daal4py.sklearn._utils import sklearn_check_version
+
+
+@pytest.mark.skipif(not sklearn_check_version('0.23'),
+                    reason="n_init_jobs requires scikit-learn >= 0.23")
+@pytest.mark.parametrize('init', ['k-means++', 'random'])
+@pytest.mark.parametrize('n_init_jobs', [2, -1])
+def test_kmeans_parallel_n_init(init, n_init_jobs):
+    X, _ = make_blobs(n_samples=2000, n_features=3, centers=8, random_state=0)
+
+    sequential = KMeans(n_clusters=8, init=init, n_init=6, random_state=42).fit(X)
+    parallel = KMeans(n_clusters=8, init=init, n_init=6, random_state=42,
+                      n_init_jobs=n_init_jobs).fit(X)
+
+    assert_allclose(sequential.cluster_centers_, parallel.cluster_centers_)
+    assert_array_equal(sequential.labels_, parallel.labels_)
+    assert sequential.inertia_ == pytest.approx(parallel.inertia_)
+    assert sequential.n_iter_ == parallel.n_iter_
+
+
+@pytest.mark.parametrize('n_init', [1, 3])
+def test_kmeans_fused_fit_transform(n_init):
+    X, _ = make_blobs(n_samples=1000, n_features=4, centers=5, random_state=0)
+
+    expected = KMeans(n_clusters=5, n_init=n_init, random_state=0).fit(X)
+    result = KMeans(n_clusters=5, n_init=n_init, random_state=0)
+    distances = result.fit_transform(X)
+
+    assert_allclose(result.cluster_centers_, expected.cluster_centers_)
+    assert_allclose(distances, expected.transform(X), rtol=1e-6)
+    assert_array_equal(result.labels_, expected.labels_)
+    assert_array_equal(expected.labels_, expected.predict(X))
+    assert result.inertia_ == pytest.approx(expected.inertia_)
+
+    labels = KMeans(n_clusters=5, n_init=n_init, random_state=0).fit_predict(X)
+    assert_array_equal(labels, expected.labels_)
+
+
+def test_kmeans_sample_weight_counts():
+    X, _ = make_blobs(n_samples=500, n_features=3, centers=4, random_state=0)
+    counts = np.random.RandomState(0).randint(1, 5, X.shape[0])
+
+    weighted = KMeans(n_clusters=4, init=X[:4], n_init=1).fit(
+        X, sample_weight=counts)
+    repeated = KMeans(n_clusters=4, init=X[:4], n_init=1).fit(
+        np.repeat(X, counts, axis=0))
+
+    assert_allclose(weighted.cluster_centers_, repeated.cluster_centers_)
+    assert weighted.inertia_ == pytest.approx(repeated.inertia_)
+    assert_array_equal(weighted.labels_, weighted.predict(X))
+
+
+@pytest.mark.parametrize('init', ['k-means++', 'random'])
+def test_kmeans_sample_weight_init(init):
+    X, _ = make_blobs(n_samples=500, n_features=3, centers=4, random_state=0)
+    sample_weight = np.random.RandomState(0).uniform(0.5, 2, X.shape[0])
+
+    km = KMeans(n_clusters=4, init=init, n_init=3, random_state=0).fit(
+        X, sample_weight=sample_weight)
+
+    assert_array_equal(km.labels_, km.predict(X))
+    sq_distances = ((X - km.cluster_centers_[km.labels_]) ** 2).sum(axis=1)
+    assert km.inertia_ == pytest.approx(sq_distances @ sample_weight)
+
+
+def test_kmeans_uniform_sample_weight():
+    X, _ = make_blobs(n_samples=500, n_features=3, centers=4, random_state=0)
+
+    expected = KMeans(n_clusters=4, random_state=0).fit(X)
+    result = KMeans(n_clusters=4, random_state=0).fit(X, sample_weight=2.5)
+
+    assert_allclose(result.cluster_centers_, expected.cluster_centers_)
+    assert result.inertia_ == pytest.approx(2.5 * expected.inertia_)
+
+
+@pytest.mark.skipif(not sklearn_check_version('0.23'),
+                    reason="the bounds are implemented for scikit-learn >= 0.23")
+@pytest.mark.parametrize('weighted', [False, True])
+def test_kmeans_elkan_bounds(weighted, monkeypatch):
+    from daal4py.sklearn.cluster import _k_means_0_23
+    monkeypatch.setattr(_k_means_0_23, '_hamerly_clusters', (1, 1000))
+    X, _ = make_blobs(n_samples=3000, n_features=4, centers=50, random_state=0)
+    sample_weight = np.random.RandomState(0).uniform(0.5, 2, X.shape[0]) \
+        if weighted else None
+    init = X[:50]
+
+    # tol=0 runs both to the fixed point, whatever their stopping criteria
+    lloyd = KMeans(n_clusters=50, init=init, n_init=1, tol=0,
+                   algorithm='full').fit(X, sample_weight=sample_weight)
+    elkan = KMeans(n_clusters=50, init=init, n_init=1, tol=0,
+                   algorithm='elkan').fit(X, sample_weight=sample_weight)
+
+    assert_allclose(elkan.cluster_centers_, lloyd.cluster_centers_, rtol=1e-5)
+    assert_array_equal(elkan.labels_, elkan.predict(X))
+    assert elkan.inertia_ == pytest.approx(lloyd.inertia_, rel=1e-5)
+
+
+def test_kmeans_chunked_predict_transform(tmp_path):
+    X, _ = make_blobs(n_samples=1000, n_features=3, centers=5, random_state=0)
+    km = KMeans(n_clusters=5, random_state=0).fit(X)
+
+    X_mapped = np.memmap(tmp_path / 'X.dat', dtype=X.dtype, mode='w+', shape=X.shape)
+    X_mapped[:] = X
+    labels = np.memmap(tmp_path / 'labels.dat', dtype=np.int32, mode='w+',
+                       shape=X.shape[0])
+
+    result = km.predict_chunked(X_mapped, block_size=128, out=labels)
+    assert_array_equal(result, km.predict(X))
+    assert_array_equal(labels, km.predict(X))
+
+    blocks = (block for block in np.array_split(X, 7))
+    assert_array_equal(km.predict_chunked(blocks), km.predict(X))
+    assert_allclose(km.transform_chunked(X, block_size=300), km.transform(X))
+
+    with pytest.raises(ValueError, match="out has 10 rows"):
+        km.predict_chunked(X, block_size=128, out=np.empty(10, dtype=np.int32))
@@ -0,0 +1,66 @@
+#===============================================================================
+# Copyright 2022 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_array_equal
+from scipy import sparse as sp
+from sklearn.cluster import MiniBatchKMeans as MiniBatchKMeans_original
+from sklearn.datasets import make_blobs
+from daal4py.sklearn.cluster import MiniBatchKMeans
+from daal4py.sklearn._utils import sklearn_check_version
+
+
+@pytest.mark.skipif(not sklearn_check_version('1.0'),
+                    reason="partial_fit is accelerated for scikit-learn >= 1.0")
+@pytest.mark.parametrize('sparse', [False, True])
+@pytest.mark.parametrize('weighted', [False, True])
+def test_minibatch_kmeans_partial_fit(sparse, weighted):
+    X, _ = make_blobs(n_samples=3000, n_features=5, centers=6, random_state=0)
+    if sparse:
+        X = sp.csr_matrix(np.where(np.abs(X) > 3, X, 0))
+    sample_weight = np.random.RandomState(1).rand(X.shape[0]) if weighted \
+        else None
+
+    result = MiniBatchKMeans(n_clusters=6, random_state=0)
+    expected = MiniBatchKMeans_original(n_clusters=6, random_state=0)
+    for start in range(0, X.shape[0], 300):
+        batch = slice(start, start + 300)
+        batch_weight = None if sample_weight is None else sample_weight[batch]
+        result.partial_fit(X[batch], sample_weight=batch_weight)
+        expected.partial_fit(X[batch], sample_weight=batch_weight)
+
+    assert_allclose(result.cluster_centers_, expected.cluster_centers_, rtol=1e-6)
+    assert_array_equal(result.labels_, expected.labels_)
+    assert result.inertia_ == pytest.approx(expected.inertia_)
+    assert result.n_steps_ == expected.n_steps_
+    assert_array_equal(result.predict(X), expected.predict(X))
+
+
+@pytest.mark.skipif(not sklearn_check_version('1.0'),
+                    reason="partial_fit is accelerated for scikit-learn >= 1.0")
+def test_minibatch_kmeans_fit_then_partial_fit():
+    X, _ = make_blobs(n_samples=3000, n_features=5, centers=6, random_state=0)
+
+    result = MiniBatchKMeans(n_clusters=6, random_state=0).fit(X[:1500])
+    expected = MiniBatchKMeans_original(n_clusters=6, random_state=0).fit(X[:1500])
+    for start in range(1500, X.shape[0], 300):
+        result.partial_fit(X[start:start + 300])
+        expected.partial_fit(X[start:start + 300])
+
+    assert_allclose(result.cluster_centers_, expected.cluster_centers_, rtol=1e-6)
+    assert_array_equal(result.labels_, expected.labels_)
+    assert result.n_steps_ == expected.n_steps_
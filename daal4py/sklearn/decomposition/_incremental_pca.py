@@ -0,0 +1,249 @@
+#===============================================================================
+# Copyright 2022 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+import numpy as np
+from scipy.sparse import issparse
+
+from sklearn.decomposition import IncrementalPCA as IncrementalPCA_original
+from sklearn.utils import check_array
+
+import daal4py
+from .._utils import getFPType, sklearn_check_version, PatchingConditionsChain
+from .._device_offload import support_usm_ndarray
+
+
+def _daal4py_moments(X):
+    """Mean and scatter matrix (sum of squared deviations) of a batch"""
+    n_samples = X.shape[0]
+    if n_samples == 1:
+        return X[0].astype(np.float64), np.zeros((X.shape[1], X.shape[1]))
+
+    covariance_algo = daal4py.covariance(
+        fptype=getFPType(X), outputMatrixType='covarianceMatrix')
+    covariance_res = covariance_algo.compute(X)
+    return covariance_res.mean.ravel().astype(np.float64), \
+        covariance_res.covariance.astype(np.float64) * (n_samples - 1)
+
+
+class IncrementalPCA(IncrementalPCA_original):
+    __doc__ = IncrementalPCA_original.__doc__
+
+    # Attributes derived from the eigendecomposition of the accumulated
+    # covariance. partial_fit drops them and they are recomputed on first
+    # access, so feeding many batches costs one eigensolve, not one per batch.
+    _eigen_attributes = (
+        'components_', 'n_components_', 'explained_variance_',
+        'explained_variance_ratio_', 'singular_values_', 'noise_variance_',
+    )
+
+    def __init__(self, n_components=None, *, whiten=False, copy=True,
+                 batch_size=None):
+        self.n_components = n_components
+        self.whiten = whiten
+        self.copy = copy
+        self.batch_size = batch_size
+
+    def __getattr__(self, name):
+        if name in IncrementalPCA._eigen_attributes and '_scatter' in self.__dict__:
+            self._solve_eigenproblem()
+            return self.__dict__[name]
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def _check_n_components(self, n_features):
+        if self.n_components is not None and \
+                not 1 <= self.n_components <= n_features:
+            raise ValueError(
+                "n_components=%r invalid for n_features=%d, need "
+                "more rows than columns for IncrementalPCA "
+                "processing" % (self.n_components, n_features))
+
+    def _partial_fit_daal4py(self, X):
+        n_samples, n_features = X.shape
+        batch_mean, batch_scatter = _daal4py_moments(X)
+
+        n_seen = self.n_samples_seen_
+        n_total = n_seen + n_samples
+        if n_seen == 0:
+            mean, scatter = batch_mean, batch_scatter
+        else:
+            # Chan et al. pairwise update of the mean and the scatter matrix
+            delta = batch_mean - self._mean
+            mean = self._mean + delta * (n_samples / n_total)
+            scatter = self._scatter + batch_scatter + \
+                np.outer(delta, delta) * (n_seen * n_samples / n_total)
+
+        self._mean, self._scatter = mean, scatter
+        self.n_samples_seen_ = n_total
+        self.mean_ = mean.astype(X.dtype)
+        self.var_ = (np.diag(scatter) / n_total).astype(X.dtype)
+        for name in IncrementalPCA._eigen_attributes:
+            self.__dict__.pop(name, None)
+
+    def _solve_eigenproblem(self):
+        n_samples = self.n_samples_seen_
+        n_features = self._scatter.shape[0]
+        dtype = self.mean_.dtype
+
+        eigenvalues, eigenvectors = np.linalg.eigh(self._scatter)
+        eigenvalues = np.maximum(eigenvalues[::-1], 0)
+        components = eigenvectors[:, ::-1].T
+        # same sign convention as svd_flip(u_based_decision=False)
+        max_abs_cols = np.argmax(np.abs(components), axis=1)
+        signs = np.sign(components[range(n_features), max_abs_cols])
+        signs[signs == 0] = 1
+        components *= signs[:, np.newaxis]
+
+        if self.n_components is None:
+            n_components = min(n_samples, n_features)
+        else:
+            n_components = self.n_components
+
+        explained_variance = eigenvalues / max(n_samples - 1, 1)
+        total_scatter = eigenvalues.sum()
+        explained_variance_ratio = eigenvalues / total_scatter \
+            if total_scatter > 0 else np.zeros_like(eigenvalues)
+
+        self.n_components_ = n_components
+        self.components_ = components[:n_components].astype(dtype)
+        self.singular_values_ = np.sqrt(eigenvalues[:n_components]).astype(dtype)
+        self.explained_variance_ = explained_variance[:n_components].astype(dtype)
+        self.explained_variance_ratio_ = \
+            explained_variance_ratio[:n_components].astype(dtype)
+        if n_components < n_features:
+            self.noise_variance_ = explained_variance[n_components:].mean()
+        else:
+            self.noise_variance_ = 0.
+
+    def _reset(self):
+        for name in IncrementalPCA._eigen_attributes + ('_mean', '_scatter'):
+            self.__dict__.pop(name, None)
+        self.n_samples_seen_ = 0
+
+    def _validate_input(self, X, reset):
+        if sklearn_check_version('0.23'):
+            return self._validate_data(X, dtype=[np.float64, np.float32],
+                                       copy=self.copy, reset=reset)
+        X = check_array(X, dtype=[np.float64, np.float32], copy=self.copy)
+        if reset:
+            self.n_features_in_ = X.shape[1]
+        return X
+
+    @support_usm_ndarray()
+    def fit(self, X, y=None):
+        """
+        Fit the model with X.
+
+        The covariance of X is computed by oneDAL in a single pass, so
+        batch_size only affects the fallback to the stock implementation.
+
+        Parameters
+        ----------
+        X : {array-like, sparse matrix} of shape (n_samples, n_features)
+            Training data, where `n_samples` is the number of samples and
+            `n_features` is the number of features.
+
+        y : Ignored
+            Not used, present for API consistency by convention.
+
+        Returns
+        -------
+        self : object
+            Returns the instance itself.
+        """
+        _patching_status = PatchingConditionsChain(
+            "sklearn.decomposition.IncrementalPCA.fit")
+        _dal_ready = _patching_status.and_conditions([
+            (not issparse(X), "X is sparse. Sparse input is not supported.")
+        ])
+        _patching_status.write_log()
+
+        if not _dal_ready:
+            self._reset()
+            self.__dict__.pop('n_samples_seen_', None)
+            return super().fit(X, y)
+
+        X = self._validate_input(X, reset=True)
+        n_samples, n_features = X.shape
+        self._check_n_components(n_features)
+        self.batch_size_ = 5 * n_features if self.batch_size is None \
+            else self.batch_size
+
+        self._reset()
+        self._partial_fit_daal4py(X)
+        return self
+
+    @support_usm_ndarray()
+    def partial_fit(self, X, y=None, check_input=True):
+        """
+        Incremental fit with X. All of X is processed as a single batch.
+
+        The batch is folded into a running mean and covariance computed by
+        oneDAL; the components are derived from them when first accessed.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Training data, where `n_samples` is the number of samples and
+            `n_features` is the number of features.
+
+        y : Ignored
+            Not used, present for API consistency by convention.
+
+        check_input : bool, default=True
+            Run check_array on X.
+
+        Returns
+        -------
+        self : object
+            Returns the instance itself.
+        """
+        first_pass = getattr(self, 'n_samples_seen_', 0) == 0
+
+        _patching_status = PatchingConditionsChain(
+            "sklearn.decomposition.IncrementalPCA.partial_fit")
+        _dal_ready = _patching_status.and_conditions([
+            (not issparse(X), "X is sparse. Sparse input is not supported."),
+            (first_pass or '_scatter' in self.__dict__,
+                "The model was fitted by the stock implementation.")
+        ])
+        _patching_status.write_log()
+
+        if not _dal_ready:
+            super().partial_fit(X, y, check_input=check_input)
+            # the stock update does not maintain the covariance, so later
+            # batches have to keep going through it as well
+            self.__dict__.pop('_scatter', None)
+            self.__dict__.pop('_mean', None)
+            return self
+
+        if check_input:
+            X = self._validate_input(X, reset=first_pass)
+        n_samples, n_features = X.shape
+        self._check_n_components(n_features)
+        if first_pass:
+            self._reset()
+        elif n_features != self._scatter.shape[0]:
+            raise ValueError(
+                "Number of input features has changed from %i "
+                "to %i between calls to partial_fit! Try "
+                "setting n_components to a fixed value."
+                % (self._scatter.shape[0], n_features))
+        if not hasattr(self, 'batch_size_'):
+            self.batch_size_ = n_samples
+
+        self._partial_fit_daal4py(X)
+        return self
@@ -17,7 +17,9 @@
 import numpy as np
 
 import numbers
+import operator
 import warnings
+from collections.abc import Sequence
 
 import daal4py
 from .._utils import (getFPType, get_patch_message)
@@ -155,12 +157,114 @@ def _check_parameters(self):
     else:
         raise ValueError("minBinSize must be integral number but was "
                          "%r" % self.minBinSize)
+    if self.varImportance not in ("MDI", "MDA_Raw", "MDA_Scaled"):
+        raise ValueError("varImportance must be one of 'MDI', 'MDA_Raw' or "
+                         "'MDA_Scaled', got %r" % self.varImportance)
+    if self.varImportance != "MDI" and not self.bootstrap:
+        raise ValueError("MDA variable importance is only available"
+                         " if bootstrap=True")
+
+
+def _daal_feature_importances(self, training_result):
+    importances = training_result.variableImportance.ravel()
+    if self.varImportance == "MDI":
+        # sklearn semantics: non-negative importances summing up to one
+        total = importances.sum()
+        if total > 0:
+            importances = importances / total
+    return importances
+
+
+def _is_daal_forest(self):
+    """Whether the estimator holds a forest fitted by oneDAL"""
+    return hasattr(self, '_daal_models_') or hasattr(self, 'daal_model_')
+
+
+def _daal_forest_models(self):
+    """(model, number of trees) pairs the fitted oneDAL forest consists of"""
+    models = getattr(self, '_daal_models_', None)
+    if models is None:
+        models = [(self.daal_model_, self.daal_model_.NumberOfTrees)]
+    return models
+
+
+def _daal_warm_start_models(self, X):
+    """Parts of the fitted forest to keep, empty unless warm starting"""
+    if not self.warm_start or not _is_daal_forest(self):
+        return []
+    models = _daal_forest_models(self)
+    n_fitted_trees = sum(n_trees for _, n_trees in models)
+    if self.n_estimators < n_fitted_trees:
+        raise ValueError('n_estimators=%d must be larger or equal to '
+                         'len(estimators_)=%d when warm_start==True'
+                         % (self.n_estimators, n_fitted_trees))
+    if X.shape[1] != self.n_features_in_:
+        raise ValueError(
+            f'X has {X.shape[1]} features, but the warm-started forest '
+            f'was fitted with {self.n_features_in_} features')
+    if self.oob_score and self.n_estimators > n_fitted_trees:
+        # the out-of-bag score covers all trees of the forest, but oneDAL
+        # computes it for the trees being trained only, so refit the forest
+        return []
+    return models
+
+
+def _daal_seed(self, n_fitted_parts):
+    rs_ = check_random_state(self.random_state)
+    # trees added by a warm start continue the random stream of the forest
+    for _ in range(n_fitted_parts):
+        rs_.randint(0, np.iinfo('i').max)
+    return rs_.randint(0, np.iinfo('i').max)
+
+
+def _daal_store_forest(self, fitted_models, model, n_trees, training_result):
+    n_fitted_trees = sum(n for _, n in fitted_models)
+    importances = _daal_feature_importances(self, training_result)
+    fitted_importances = getattr(self, '_daal_feature_importances_', None)
+    if fitted_models and fitted_importances is not None:
+        importances = (fitted_importances * n_fitted_trees + importances * n_trees) \
+            / (n_fitted_trees + n_trees)
+    self._daal_feature_importances_ = importances
+    self._daal_models_ = fitted_models + [(model, n_trees)]
+    # a warm-started forest consists of several oneDAL models, which
+    # cannot be exposed as a single one
+    if len(self._daal_models_) == 1:
+        self.daal_model_ = model
+    else:
+        self.__dict__.pop('daal_model_', None)
+
+
+def _daal_trees_to_fit(self, fitted_models):
+    n_trees = self.n_estimators - sum(n for _, n in fitted_models)
+    if n_trees == 0:
+        warnings.warn("Warm-start fitting without increasing n_estimators does not "
+                      "fit new trees.")
+    return n_trees
+
+
+def _drop_daal_forest(self):
+    """Prepare for fitting by the stock implementation"""
+    if self.warm_start and \
+            isinstance(getattr(self, 'estimators_', None), _DaalTreeEstimators):
+        # sklearn grows a warm-started forest by extending estimators_
+        self.estimators_ = list(self.estimators_)
+    for attr in ('daal_model_', '_daal_models_', '_daal_feature_importances_',
+                 '_cached_estimators_'):
+        self.__dict__.pop(attr, None)
 
 
 def _daal_fit_classifier(self, X, y, sample_weight=None):
+    fitted_models = _daal_warm_start_models(self, X)
+    fitted_classes = self.classes_ if fitted_models else None
     y = check_array(y, ensure_2d=False, dtype=None)
     y, expanded_class_weight = self._validate_y_class_weight(y)
     n_classes_ = self.n_classes_[0]
+    if fitted_models and not np.array_equal(fitted_classes, self.classes_[0]):
+        raise ValueError("A warm-started forest must be fitted on the same "
+                         "classes as before")
+    n_trees = _daal_trees_to_fit(self, fitted_models)
+    if n_trees == 0:
+        return self
     self.n_features_in_ = X.shape[1]
     if not sklearn_check_version('1.0'):
         self.n_features_ = self.n_features_in_
@@ -173,8 +277,7 @@ def _daal_fit_classifier(self, X, y, sample_weight=None):
     if sample_weight is not None:
         sample_weight = [sample_weight]
 
-    rs_ = check_random_state(self.random_state)
-    seed_ = rs_.randint(0, np.iinfo('i').max)
+    seed_ = _daal_seed(self, len(fitted_models))
 
     if n_classes_ < 2:
         raise ValueError(
@@ -187,7 +290,7 @@ def _daal_fit_classifier(self, X, y, sample_weight=None):
     # more details here:
     # https://oneapi-src.github.io/oneDAL/daal/algorithms/engines/mt2203.html
     max_stream_count = 6024
-    if self.n_estimators <= max_stream_count:
+    if n_trees <= max_stream_count:
         daal_engine = daal4py.engines_mt2203(seed=seed_, fptype=X_fptype)
     else:
         daal_engine = daal4py.engines_mt19937(seed=seed_, fptype=X_fptype)
@@ -208,7 +311,7 @@ def _daal_fit_classifier(self, X, y, sample_weight=None):
         nClasses=int(n_classes_),
         fptype=X_fptype,
         method='hist',
-        nTrees=int(self.n_estimators),
+        nTrees=int(n_trees),
         observationsPerTreeFraction=n_samples_bootstrap_
         if self.bootstrap is True else 1.,
         featuresPerNode=int(features_per_node_),
@@ -221,7 +324,7 @@ def _daal_fit_classifier(self, X, y, sample_weight=None):
         engine=daal_engine,
         impurityThreshold=float(
             0.0 if self.min_impurity_split is None else self.min_impurity_split),
-        varImportance="MDI",
+        varImportance=self.varImportance,
         resultsToCompute=(
             "computeOutOfBagErrorAccuracy|computeOutOfBagErrorDecisionFunction"
             if self.oob_score
@@ -244,8 +347,8 @@ def _daal_fit_classifier(self, X, y, sample_weight=None):
     dfc_trainingResult = dfc_algorithm.compute(X, y, sample_weight)
 
     # get resulting model
-    model = dfc_trainingResult.model
-    self.daal_model_ = model
+    _daal_store_forest(self, fitted_models, dfc_trainingResult.model, n_trees,
+                       dfc_trainingResult)
 
     if self.oob_score:
         self.oob_score_ = dfc_trainingResult.outOfBagErrorAccuracy[0][0]
@@ -268,7 +371,11 @@ def _daal_predict_classifier(self, X):
             (f'X has {X.shape[1]} features, '
              f'but RandomForestClassifier is expecting '
              f'{self.n_features_in_} features as input'))
-    dfc_predictionResult = dfc_algorithm.compute(X, self.daal_model_)
+    models = _daal_forest_models(self)
+    if len(models) > 1:
+        # a warm-started forest votes with the probabilities of all its parts
+        return np.take(self.classes_, np.argmax(_daal_predict_proba(self, X), axis=1))
+    dfc_predictionResult = dfc_algorithm.compute(X, models[0][0])
 
     pred = dfc_predictionResult.prediction
 
@@ -283,11 +390,14 @@ def _daal_predict_proba(self, X):
         fptype=X_fptype,
         resultsToEvaluate="computeClassProbabilities"
     )
-    dfc_predictionResult = dfc_algorithm.compute(X, self.daal_model_)
-
-    pred = dfc_predictionResult.probabilities
+    models = _daal_forest_models(self)
+    if len(models) == 1:
+        return dfc_algorithm.compute(X, models[0][0]).probabilities
+    # parts of a warm-started forest are weighted by their number of trees
+    pred = sum(dfc_algorithm.compute(X, model).probabilities * n_trees
+               for model, n_trees in models)
 
-    return pred
+    return pred / sum(n_trees for _, n_trees in models)
 
 
 def _fit_classifier(self, X, y, sample_weight=None):
@@ -304,7 +414,9 @@ def _fit_classifier(self, X, y, sample_weight=None):
     _dal_ready = _patching_status.and_conditions([
         (self.oob_score and daal_check_version((2021, 'P', 500)) or not self.oob_score,
             "OOB score is only supported starting from 2021.5 version of oneDAL."),
-        (self.warm_start is False, "Warm start is not supported."),
+        (not (self.warm_start and hasattr(self, 'estimators_')) or _is_daal_forest(self),
+            "Warm start of a forest fitted by the stock implementation "
+            "is not supported."),
         (self.criterion == "gini",
             f"'{self.criterion}' criterion is not supported. "
             "Only 'gini' criterion is supported."),
@@ -347,29 +459,32 @@ def _fit_classifier(self, X, y, sample_weight=None):
         self.n_classes_ = self.n_classes_[0]
         self.classes_ = self.classes_[0]
         return self
+    _drop_daal_forest(self)
     return super(RandomForestClassifier, self).fit(
         X, y, sample_weight=sample_weight)
 
 
 def _daal_fit_regressor(self, X, y, sample_weight=None):
+    fitted_models = _daal_warm_start_models(self, X)
+    n_trees = _daal_trees_to_fit(self, fitted_models)
+    if n_trees == 0:
+        return self
     self.n_features_in_ = X.shape[1]
     if not sklearn_check_version('1.0'):
         self.n_features_ = self.n_features_in_
 
-    rs_ = check_random_state(self.random_state)
-
     if not self.bootstrap and self.oob_score:
         raise ValueError("Out of bag estimation only available"
                          " if bootstrap=True")
 
     X_fptype = getFPType(X)
-    seed_ = rs_.randint(0, np.iinfo('i').max)
+    seed_ = _daal_seed(self, len(fitted_models))
 
     # limitation on the number of stream for mt2203 is 6024
     # more details here:
     # https://oneapi-src.github.io/oneDAL/daal/algorithms/engines/mt2203.html
     max_stream_count = 6024
-    if self.n_estimators <= max_stream_count:
+    if n_trees <= max_stream_count:
         daal_engine = daal4py.engines_mt2203(seed=seed_, fptype=X_fptype)
     else:
         daal_engine = daal4py.engines_mt19937(seed=seed_, fptype=X_fptype)
@@ -389,7 +504,7 @@ def _daal_fit_regressor(self, X, y, sample_weight=None):
     dfr_algorithm = daal4py.decision_forest_regression_training(
         fptype=getFPType(X),
         method='hist',
-        nTrees=int(self.n_estimators),
+        nTrees=int(n_trees),
         observationsPerTreeFraction=n_samples_bootstrap if self.bootstrap is True else 1.,
         featuresPerNode=int(_featuresPerNode),
         maxTreeDepth=int(0 if self.max_depth is None else self.max_depth),
@@ -401,7 +516,7 @@ def _daal_fit_regressor(self, X, y, sample_weight=None):
         engine=daal_engine,
         impurityThreshold=float(
             0.0 if self.min_impurity_split is None else self.min_impurity_split),
-        varImportance="MDI",
+        varImportance=self.varImportance,
         resultsToCompute=("computeOutOfBagErrorR2|computeOutOfBagErrorPrediction"
                           if self.oob_score
                           else ""),
@@ -424,8 +539,8 @@ def _daal_fit_regressor(self, X, y, sample_weight=None):
     dfr_trainingResult = dfr_algorithm.compute(X, y, sample_weight)
 
     # get resulting model
-    model = dfr_trainingResult.model
-    self.daal_model_ = model
+    _daal_store_forest(self, fitted_models, dfr_trainingResult.model, n_trees,
+                       dfr_trainingResult)
 
     if self.oob_score:
         self.oob_score_ = dfr_trainingResult.outOfBagErrorR2[0][0]
@@ -458,7 +573,9 @@ def _fit_regressor(self, X, y, sample_weight=None):
     _dal_ready = _patching_status.and_conditions([
         (self.oob_score and daal_check_version((2021, 'P', 500)) or not self.oob_score,
             "OOB score is only supported starting from 2021.5 version of oneDAL."),
-        (self.warm_start is False, "Warm start is not supported."),
+        (not (self.warm_start and hasattr(self, 'estimators_')) or _is_daal_forest(self),
+            "Warm start of a forest fitted by the stock implementation "
+            "is not supported."),
         (self.criterion in ["mse", "squared_error"],
             f"'{self.criterion}' criterion is not supported. "
             "Only 'mse' and 'squared_error' criteria are supported."),
@@ -498,6 +615,7 @@ def _fit_regressor(self, X, y, sample_weight=None):
 
         self.estimators_ = self._estimators_
         return self
+    _drop_daal_forest(self)
     return super(RandomForestRegressor, self).fit(
         X, y, sample_weight=sample_weight)
 
@@ -510,9 +628,13 @@ def _daal_predict_regressor(self, X):
              f'{self.n_features_in_} features as input'))
     X_fptype = getFPType(X)
     dfr_alg = daal4py.decision_forest_regression_prediction(fptype=X_fptype)
-    dfr_predictionResult = dfr_alg.compute(X, self.daal_model_)
-
-    pred = dfr_predictionResult.prediction
+    models = _daal_forest_models(self)
+    if len(models) == 1:
+        pred = dfr_alg.compute(X, models[0][0]).prediction
+    else:
+        # parts of a warm-started forest are weighted by their number of trees
+        pred = sum(dfr_alg.compute(X, model).prediction * n_trees
+                   for model, n_trees in models) / sum(n for _, n in models)
 
     return pred.ravel()
 
@@ -543,6 +665,88 @@ def check_sample_weight(sample_weight, X, dtype=None):
     return sample_weight
 
 
+class _DaalTreeEstimators(Sequence):
+    """
+    Read-only sequence of sklearn decision trees backed by a oneDAL forest.
+
+    The states of all trees are exported by one multithreaded native call on
+    first access, and each sklearn tree is only built when it is requested.
+    Pickling stores the materialized list of trees.
+    """
+
+    def __init__(self, daal_models, base_estimator, random_states,
+                 n_features, n_outputs, n_classes=None, classes=None):
+        self._daal_models = daal_models
+        self._base_estimator = base_estimator
+        self._random_states = random_states
+        self._n_features = n_features
+        self._n_outputs = n_outputs
+        self._n_classes = n_classes
+        self._classes = classes
+        self._tree_states = None
+        self._estimators = [None] * len(random_states)
+
+    def __len__(self):
+        return len(self._estimators)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("estimator index out of range")
+        if self._estimators[index] is None:
+            self._estimators[index] = self._make_estimator(index)
+        return self._estimators[index]
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+    def _make_estimator(self, index):
+        if self._tree_states is None:
+            n_classes = 1 if self._n_classes is None else self._n_classes
+            self._tree_states = [
+                state for model, _ in self._daal_models
+                for state in daal4py.getTreeStates(model, n_classes)]
+        tree_state = self._tree_states[index]
+        # sklearn Tree copies the arrays, the exported state is not needed anymore
+        self._tree_states[index] = None
+
+        est = clone(self._base_estimator)
+        est.set_params(random_state=self._random_states[index])
+        if sklearn_check_version('1.0'):
+            est.n_features_in_ = self._n_features
+        else:
+            est.n_features_ = self._n_features
+        est.n_outputs_ = self._n_outputs
+        if self._n_classes is not None:
+            est.classes_ = self._classes
+            est.n_classes_ = self._n_classes
+
+        # treeState members: 'class_count', 'leaf_count', 'max_depth',
+        # 'node_ar', 'node_count', 'value_ar'
+        tree_state_dict = {
+            'max_depth': tree_state.max_depth,
+            'node_count': tree_state.node_count,
+            'nodes': tree_state.node_ar,
+            'values': tree_state.value_ar}
+        est.tree_ = Tree(
+            self._n_features,
+            np.array([1 if self._n_classes is None else self._n_classes],
+                     dtype=np.intp),
+            self._n_outputs)
+        est.tree_.__setstate__(tree_state_dict)
+        return est
+
+
+def _random_states_for_estimators(self):
+    random_state_checked = check_random_state(self.random_state)
+    return [random_state_checked.randint(np.iinfo(np.int32).max)
+            for _ in range(self.n_estimators)]
+
+
 class RandomForestClassifier(RandomForestClassifier_original):
     __doc__ = RandomForestClassifier_original.__doc__
 
@@ -567,7 +771,8 @@ class RandomForestClassifier(RandomForestClassifier_original):
                      ccp_alpha=0.0,
                      max_samples=None,
                      maxBins=256,
-                     minBinSize=1):
+                     minBinSize=1,
+                     varImportance="MDI"):
             super(RandomForestClassifier, self).__init__(
                 n_estimators=n_estimators,
                 criterion=criterion,
@@ -590,6 +795,7 @@ class RandomForestClassifier(RandomForestClassifier_original):
             self.max_samples = max_samples
             self.maxBins = maxBins
             self.minBinSize = minBinSize
+            self.varImportance = varImportance
             self.min_impurity_split = None
     else:
         def __init__(self,
@@ -613,7 +819,8 @@ class RandomForestClassifier(RandomForestClassifier_original):
                      ccp_alpha=0.0,
                      max_samples=None,
                      maxBins=256,
-                     minBinSize=1):
+                     minBinSize=1,
+                     varImportance="MDI"):
             super(RandomForestClassifier, self).__init__(
                 n_estimators=n_estimators,
                 criterion=criterion,
@@ -637,6 +844,7 @@ class RandomForestClassifier(RandomForestClassifier_original):
             )
             self.maxBins = maxBins
             self.minBinSize = minBinSize
+            self.varImportance = varImportance
 
     @support_usm_ndarray()
     def fit(self, X, y, sample_weight=None):
@@ -692,7 +900,7 @@ class RandomForestClassifier(RandomForestClassifier_original):
         _patching_status = PatchingConditionsChain(
             "sklearn.ensemble.RandomForestClassifier.predict")
         _dal_ready = _patching_status.and_conditions([
-            (hasattr(self, 'daal_model_'), "oneDAL model was not trained."),
+            (_is_daal_forest(self), "oneDAL model was not trained."),
             (not sp.issparse(X), "X is sparse. Sparse input is not supported.")])
         if hasattr(self, 'n_outputs_'):
             _dal_ready = _patching_status.and_conditions([
@@ -752,7 +960,7 @@ class RandomForestClassifier(RandomForestClassifier_original):
         _patching_status = PatchingConditionsChain(
             "sklearn.ensemble.RandomForestClassifier.predict_proba")
         _dal_ready = _patching_status.and_conditions([
-            (hasattr(self, 'daal_model_'), "oneDAL model was not trained."),
+            (_is_daal_forest(self), "oneDAL model was not trained."),
             (not sp.issparse(X), "X is sparse. Sparse input is not supported."),
             (daal_check_version((2021, 'P', 400)),
                 "oneDAL version is lower than 2021.4.")])
@@ -779,6 +987,25 @@ class RandomForestClassifier(RandomForestClassifier_original):
         def n_features_(self):
             return self.n_features_in_
 
+    @property
+    def feature_importances_(self):
+        """
+        The feature importances computed by oneDAL during training.
+
+        With the default ``varImportance="MDI"`` these are the impurity-based
+        importances normalized to sum to one; with ``"MDA_Raw"`` or
+        ``"MDA_Scaled"`` they are the out-of-bag permutation importances
+        (mean decrease of accuracy), which are not normalized.
+
+        Returns
+        -------
+        feature_importances_ : ndarray of shape (n_features,)
+        """
+        importances = getattr(self, '_daal_feature_importances_', None)
+        if importances is None:
+            return super().feature_importances_
+        return importances.copy()
+
     @property
     def _estimators_(self):
         if hasattr(self, '_cached_estimators_'):
@@ -788,7 +1015,7 @@ class RandomForestClassifier(RandomForestClassifier_original):
         if sklearn_check_version('0.22'):
             check_is_fitted(self)
         else:
-            check_is_fitted(self, 'daal_model_')
+            check_is_fitted(self, ['daal_model_', '_daal_models_'], all_or_any=any)
         classes_ = self.classes_[0]
         n_classes_ = self.n_classes_[0]
         # convert model to estimators
@@ -806,47 +1033,12 @@ class RandomForestClassifier(RandomForestClassifier_original):
         if not sklearn_check_version('1.0'):
             params['min_impurity_split'] = self.min_impurity_split
         est = DecisionTreeClassifier(**params)
-        # we need to set est.tree_ field with Trees constructed from Intel(R)
-        # oneAPI Data Analytics Library solution
-        estimators_ = []
-        random_state_checked = check_random_state(self.random_state)
-        for i in range(self.n_estimators):
-            # print("Tree #{}".format(i))
-            est_i = clone(est)
-            est_i.set_params(
-                random_state=random_state_checked.randint(np.iinfo(np.int32).max))
-            if sklearn_check_version('1.0'):
-                est_i.n_features_in_ = self.n_features_in_
-            else:
-                est_i.n_features_ = self.n_features_in_
-            est_i.n_outputs_ = self.n_outputs_
-            est_i.classes_ = classes_
-            est_i.n_classes_ = n_classes_
-            # treeState members: 'class_count', 'leaf_count', 'max_depth',
-            # 'node_ar', 'node_count', 'value_ar'
-            tree_i_state_class = daal4py.getTreeState(
-                self.daal_model_, i, n_classes_)
-
-            # node_ndarray = tree_i_state_class.node_ar
-            # value_ndarray = tree_i_state_class.value_ar
-            # value_shape = (node_ndarray.shape[0], self.n_outputs_,
-            #                n_classes_)
-            # assert np.allclose(
-            #     value_ndarray, value_ndarray.astype(np.intc, casting='unsafe')
-            # ), "Value array is non-integer"
-            tree_i_state_dict = {
-                'max_depth': tree_i_state_class.max_depth,
-                'node_count': tree_i_state_class.node_count,
-                'nodes': tree_i_state_class.node_ar,
-                'values': tree_i_state_class.value_ar}
-            est_i.tree_ = Tree(
-                self.n_features_in_,
-                np.array(
-                    [n_classes_],
-                    dtype=np.intp),
-                self.n_outputs_)
-            est_i.tree_.__setstate__(tree_i_state_dict)
-            estimators_.append(est_i)
+        # the trees are constructed from the Intel(R) oneAPI Data Analytics
+        # Library model when they are accessed
+        estimators_ = _DaalTreeEstimators(
+            _daal_forest_models(self), est, _random_states_for_estimators(self),
+            self.n_features_in_, self.n_outputs_,
+            n_classes=n_classes_, classes=classes_)
 
         self._cached_estimators_ = estimators_
         return estimators_
@@ -875,7 +1067,8 @@ class RandomForestRegressor(RandomForestRegressor_original):
                      ccp_alpha=0.0,
                      max_samples=None,
                      maxBins=256,
-                     minBinSize=1):
+                     minBinSize=1,
+                     varImportance="MDI"):
             super(RandomForestRegressor, self).__init__(
                 n_estimators=n_estimators,
                 criterion=criterion,
@@ -897,6 +1090,7 @@ class RandomForestRegressor(RandomForestRegressor_original):
             self.max_samples = max_samples
             self.maxBins = maxBins
             self.minBinSize = minBinSize
+            self.varImportance = varImportance
             self.min_impurity_split = None
     else:
         def __init__(self,
@@ -919,7 +1113,8 @@ class RandomForestRegressor(RandomForestRegressor_original):
                      ccp_alpha=0.0,
                      max_samples=None,
                      maxBins=256,
-                     minBinSize=1):
+                     minBinSize=1,
+                     varImportance="MDI"):
             super(RandomForestRegressor, self).__init__(
                 n_estimators=n_estimators,
                 criterion=criterion,
@@ -942,6 +1137,7 @@ class RandomForestRegressor(RandomForestRegressor_original):
             )
             self.maxBins = maxBins
             self.minBinSize = minBinSize
+            self.varImportance = varImportance
 
     @support_usm_ndarray()
     def fit(self, X, y, sample_weight=None):
@@ -997,7 +1193,7 @@ class RandomForestRegressor(RandomForestRegressor_original):
         _patching_status = PatchingConditionsChain(
             "sklearn.ensemble.RandomForestRegressor.predict")
         _dal_ready = _patching_status.and_conditions([
-            (hasattr(self, 'daal_model_'), "oneDAL model was not trained."),
+            (_is_daal_forest(self), "oneDAL model was not trained."),
             (not sp.issparse(X), "X is sparse. Sparse input is not supported.")])
         if hasattr(self, 'n_outputs_'):
             _dal_ready = _patching_status.and_conditions([
@@ -1026,6 +1222,25 @@ class RandomForestRegressor(RandomForestRegressor_original):
         def n_features_(self):
             return self.n_features_in_
 
+    @property
+    def feature_importances_(self):
+        """
+        The feature importances computed by oneDAL during training.
+
+        With the default ``varImportance="MDI"`` these are the impurity-based
+        importances normalized to sum to one; with ``"MDA_Raw"`` or
+        ``"MDA_Scaled"`` they are the out-of-bag permutation importances
+        (mean decrease of accuracy), which are not normalized.
+
+        Returns
+        -------
+        feature_importances_ : ndarray of shape (n_features,)
+        """
+        importances = getattr(self, '_daal_feature_importances_', None)
+        if importances is None:
+            return super().feature_importances_
+        return importances.copy()
+
     @property
     def _estimators_(self):
         if hasattr(self, '_cached_estimators_'):
@@ -1034,7 +1249,7 @@ class RandomForestRegressor(RandomForestRegressor_original):
         if sklearn_check_version('0.22'):
             check_is_fitted(self)
         else:
-            check_is_fitted(self, 'daal_model_')
+            check_is_fitted(self, ['daal_model_', '_daal_models_'], all_or_any=any)
         # convert model to estimators
         params = {
             'criterion': self.criterion,
@@ -1049,33 +1264,12 @@ class RandomForestRegressor(RandomForestRegressor_original):
         }
         if not sklearn_check_version('1.0'):
             params['min_impurity_split'] = self.min_impurity_split
-        est = DecisionTreeClassifier(**params)
-
-        # we need to set est.tree_ field with Trees constructed from Intel(R)
-        # oneAPI Data Analytics Library solution
-        estimators_ = []
-        random_state_checked = check_random_state(self.random_state)
-        for i in range(self.n_estimators):
-            est_i = clone(est)
-            est_i.set_params(
-                random_state=random_state_checked.randint(np.iinfo(np.int32).max))
-            if sklearn_check_version('1.0'):
-                est_i.n_features_in_ = self.n_features_in_
-            else:
-                est_i.n_features_ = self.n_features_in_
-            est_i.n_outputs_ = self.n_outputs_
-
-            tree_i_state_class = daal4py.getTreeState(self.daal_model_, i)
-            tree_i_state_dict = {
-                'max_depth': tree_i_state_class.max_depth,
-                'node_count': tree_i_state_class.node_count,
-                'nodes': tree_i_state_class.node_ar,
-                'values': tree_i_state_class.value_ar}
-
-            est_i.tree_ = Tree(
-                self.n_features_in_, np.array(
-                    [1], dtype=np.intp), self.n_outputs_)
-            est_i.tree_.__setstate__(tree_i_state_dict)
-            estimators_.append(est_i)
+        est = DecisionTreeRegressor(**params)
+        # the trees are constructed from the Intel(R) oneAPI Data Analytics
+        # Library model when they are accessed
+        estimators_ = _DaalTreeEstimators(
+            _daal_forest_models(self), est, _random_states_for_estimators(self),
+            self.n_features_in_, self.n_outputs_)
 
+        self._cached_estimators_ = estimators_
         return estimators_
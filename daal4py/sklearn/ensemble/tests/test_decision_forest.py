@@ -197,3 +197,103 @@ def test_mse_regressor_big_estimators_iris(n_estimators):
         n_estimators=n_estimators,
         description=f"Regression: n_estimators={n_estimators}: "
     )
+
+
+@pytest.mark.parametrize('forest_class',
+                         [DaalRandomForestClassifier, DaalRandomForestRegressor])
+def test_estimators_match_tree_states(forest_class):
+    import pickle
+    import daal4py
+    model = forest_class(n_estimators=20, random_state=0)
+    model.fit(IRIS.data, IRIS.target)
+
+    assert len(model.estimators_) == 20
+    assert model.estimators_[-1] is model.estimators_[19]
+    n_classes = 3 if forest_class is DaalRandomForestClassifier else 1
+    for i, est in enumerate(model.estimators_):
+        state = daal4py.getTreeState(model.daal_model_, i, n_classes)
+        assert est.tree_.node_count == state.node_count
+        assert est.tree_.max_depth == state.max_depth
+        np.testing.assert_array_equal(est.tree_.feature, state.node_ar['feature'])
+        np.testing.assert_array_equal(est.tree_.value, state.value_ar)
+
+    restored = pickle.loads(pickle.dumps(model))
+    assert isinstance(restored.estimators_, list)
+    np.testing.assert_array_equal(restored.estimators_[3].tree_.value,
+                                  model.estimators_[3].tree_.value)
+
+
+@pytest.mark.parametrize('forest_class',
+                         [DaalRandomForestClassifier, DaalRandomForestRegressor])
+def test_feature_importances_without_tree_conversion(forest_class):
+    model = forest_class(n_estimators=20, random_state=0)
+    model.fit(IRIS.data, IRIS.target)
+
+    importances = model.feature_importances_
+    assert importances.shape == (IRIS.data.shape[1],)
+    assert np.all(importances >= 0)
+    assert np.isclose(importances.sum(), 1.0)
+    # petal length and width are by far the most informative iris features
+    assert set(np.argsort(importances)[-2:]) == {2, 3}
+    assert all(est is None for est in model.estimators_._estimators)
+
+
+@pytest.mark.parametrize('var_importance', ['MDA_Raw', 'MDA_Scaled'])
+def test_feature_importances_mda(var_importance):
+    model = DaalRandomForestClassifier(n_estimators=20, random_state=0,
+                                       varImportance=var_importance)
+    model.fit(IRIS.data, IRIS.target)
+    assert model.feature_importances_.shape == (IRIS.data.shape[1],)
+
+    with pytest.raises(ValueError, match="bootstrap=True"):
+        DaalRandomForestClassifier(bootstrap=False, varImportance=var_importance) \
+            .fit(IRIS.data, IRIS.target)
+
+
+@pytest.mark.parametrize('forest_class',
+                         [DaalRandomForestClassifier, DaalRandomForestRegressor])
+def test_warm_start_adds_trees(forest_class):
+    model = forest_class(n_estimators=10, warm_start=True, random_state=0)
+    model.fit(IRIS.data, IRIS.target)
+    first_model = model.daal_model_
+    first_trees = model.estimators_[:10]
+
+    model.set_params(n_estimators=25)
+    model.fit(IRIS.data, IRIS.target)
+    assert model._daal_models_[0][0] is first_model
+    # the forest consists of two oneDAL models now
+    assert not hasattr(model, 'daal_model_')
+    assert len(model.estimators_) == 25
+    for old, new in zip(first_trees, model.estimators_[:10]):
+        np.testing.assert_array_equal(old.tree_.value, new.tree_.value)
+
+    if forest_class is DaalRandomForestClassifier:
+        proba = model.predict_proba(IRIS.data)
+        np.testing.assert_allclose(proba.sum(axis=1), 1.0)
+        np.testing.assert_array_equal(model.predict(IRIS.data),
+                                      model.classes_[np.argmax(proba, axis=1)])
+        assert accuracy_score(IRIS.target, model.predict(IRIS.data)) > 0.9
+    else:
+        assert mean_squared_error(IRIS.target, model.predict(IRIS.data)) < 0.1
+
+    with pytest.warns(UserWarning, match="does not fit new trees"):
+        model.fit(IRIS.data, IRIS.target)
+    with pytest.raises(ValueError, match="must be larger or equal"):
+        model.set_params(n_estimators=5).fit(IRIS.data, IRIS.target)
+
+
+@pytest.mark.parametrize('forest_class',
+                         [DaalRandomForestClassifier, DaalRandomForestRegressor])
+def test_warm_start_oob_score(forest_class):
+    model = forest_class(n_estimators=10, warm_start=True, oob_score=True,
+                         random_state=0)
+    model.fit(IRIS.data, IRIS.target)
+    model.set_params(n_estimators=25)
+    model.fit(IRIS.data, IRIS.target)
+
+    # the out-of-bag score has to cover the whole forest
+    expected = forest_class(n_estimators=25, oob_score=True, random_state=0)
+    expected.fit(IRIS.data, IRIS.target)
+    assert hasattr(model, 'daal_model_')
+    assert len(model.estimators_) == 25
+    assert model.oob_score_ == pytest.approx(expected.oob_score_)
@@ -18,10 +18,15 @@
 from .linear import LinearRegression
 from .logistic_path import logistic_regression_path, LogisticRegression
 from .ridge import Ridge
-from .coordinate_descent import ElasticNet, Lasso
+from .coordinate_descent import (ElasticNet, Lasso, ElasticNetCV, LassoCV,
+                                 enet_path, lasso_path)
 
 __all__ = ['Ridge', 'LinearRegression',
            'LogisticRegression',
            'logistic_regression_path',
            'ElasticNet',
-           'Lasso']
+           'Lasso',
+           'ElasticNetCV',
+           'LassoCV',
+           'enet_path',
+           'lasso_path']
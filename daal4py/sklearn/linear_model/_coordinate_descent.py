@@ -21,6 +21,12 @@ from scipy import sparse as sp
 from sklearn.utils import check_array, check_X_y
 from sklearn.linear_model._coordinate_descent import ElasticNet as ElasticNet_original
 from sklearn.linear_model._coordinate_descent import Lasso as Lasso_original
+from sklearn.linear_model._coordinate_descent import \
+    ElasticNetCV as ElasticNetCV_original
+from sklearn.linear_model._coordinate_descent import LassoCV as LassoCV_original
+from sklearn.linear_model._coordinate_descent import \
+    enet_path as enet_path_original
+from sklearn.linear_model._coordinate_descent import _alpha_grid
 from daal4py.sklearn._utils import (
     make2d, getFPType, get_patch_message, sklearn_check_version, PatchingConditionsChain)
 if sklearn_check_version('1.0'):
@@ -29,11 +35,43 @@ if sklearn_check_version('1.0'):
 import logging
 
 # only for compliance with Sklearn
+import sys
 import warnings
 from sklearn.exceptions import ConvergenceWarning
 from sklearn.preprocessing import normalize
 
 from .._device_offload import support_usm_ndarray
+from ._linear import (
+    _sparse_max_features,
+    _sparse_normal_equations)
+
+
+def _normal_equations_to_data(gram, xty, yty, dtype):
+    """Dense data Z of n_features + n_targets rows and targets u with
+    Z^T Z = gram, Z^T u = xty and u^T u = yty.
+
+    Least squares objectives only see the data through these products, so
+    solving them on (Z, u) gives the coefficients of the original problem.
+    """
+    n_features, n_targets = xty.shape
+    eigenvalues, eigenvectors = np.linalg.eigh(gram)
+    eigenvalues = np.maximum(eigenvalues, 0)
+    sqrt_eigenvalues = np.sqrt(eigenvalues)
+    nonzero = eigenvalues > \
+        eigenvalues.max(initial=0) * n_features * np.finfo(np.float64).eps
+    data = (eigenvectors * sqrt_eigenvalues).T
+    targets = np.zeros((n_features, n_targets))
+    targets[nonzero] = (eigenvectors[:, nonzero].T @ xty) / \
+        sqrt_eigenvalues[nonzero, np.newaxis]
+
+    # rows without data carrying the part of y^T y not explained by X
+    residual = yty - targets.T @ targets
+    residual_values, residual_vectors = np.linalg.eigh((residual + residual.T) / 2)
+    residual_rows = (residual_vectors * np.sqrt(np.maximum(residual_values, 0))).T
+
+    data = np.vstack([data, np.zeros((n_targets, n_features))])
+    targets = np.vstack([targets, residual_rows])
+    return data.astype(dtype), targets.astype(dtype)
 
 
 def _daal4py_check(self, X, y, check_input):
@@ -361,6 +399,156 @@ def _daal4py_fit_lasso(self, X, y_, check_input):
     return self
 
 
+def _daal4py_fit_sparse(self, X, y_, check_input):
+    """Elastic net (or lasso, with l1_ratio=1) on a sparse X.
+
+    Coordinate descent runs on the dense problem with the same centered
+    normal equations as X, which has n_features + n_targets rows. The rows
+    are scaled so that its mean squared error is the one of the n_samples
+    rows of X, the penalties then apply unchanged.
+    """
+    _daal4py_check(self, X, y_, check_input)
+    y = make2d(y_)
+    n_samples, n_features = X.shape
+    _fptype = getFPType(X)
+    if sklearn_check_version('0.23'):
+        self.n_features_in_ = n_features
+
+    gram, xty, yty, X_offset, y_offset = _sparse_normal_equations(
+        X, y, None, self.fit_intercept)
+    data, targets = _normal_equations_to_data(gram, xty, yty, X.dtype)
+    scale = X.dtype.type(np.sqrt(data.shape[0] / n_samples))
+    scaled_data, scaled_targets = data * scale, targets * scale
+
+    penalty_L1 = np.asarray(self.alpha * self.l1_ratio, dtype=X.dtype)
+    penalty_L2 = np.asarray(self.alpha * (1.0 - self.l1_ratio), dtype=X.dtype)
+    if (penalty_L1.size != 1 or penalty_L2.size != 1):
+        raise ValueError("alpha or l1_ratio length is wrong")
+
+    mse_alg = daal4py.optimization_solver_mse(
+        numberOfTerms=data.shape[0],
+        fptype=_fptype,
+        method='defaultDense'
+    )
+    mse_alg.setup(scaled_data, scaled_targets, None)
+
+    cd_solver = daal4py.optimization_solver_coordinate_descent(
+        function=mse_alg,
+        fptype=_fptype,
+        method='defaultDense',
+        selection=self.selection,
+        seed=0 if self.random_state is None else self.random_state,
+        nIterations=self.max_iter,
+        positive=self.positive,
+        accuracyThreshold=self.tol,
+    )
+
+    # set warm_start, the intercept of the scaled problem is zero
+    n_targets = y.shape[1]
+    if self.warm_start and hasattr(self, "coef_") and \
+            isinstance(self.coef_, np.ndarray) and \
+            self.coef_.size == n_targets * n_features:
+        inputArgument = np.zeros((n_targets, n_features + 1), dtype=_fptype)
+        inputArgument[:, 1:] = self.coef_.reshape((n_targets, n_features))
+        cd_solver.setup(inputArgument)
+    elastic_net_alg = daal4py.elastic_net_training(
+        fptype=_fptype,
+        method='defaultDense',
+        interceptFlag=False,
+        dataUseInComputation='doNotUse',
+        penaltyL1=penalty_L1.reshape((1, -1)),
+        penaltyL2=penalty_L2.reshape((1, -1)),
+        optimizationSolver=cd_solver
+    )
+    try:
+        elastic_net_res = elastic_net_alg.compute(
+            data=scaled_data, dependentVariables=scaled_targets)
+    except RuntimeError:
+        return None
+
+    # the oneDAL model has no intercept, predict goes through sklearn
+    self.__dict__.pop('daal_model_', None)
+    self.__dict__.pop('_X', None)
+    self.__dict__.pop('_y', None)
+    self.coef_ = elastic_net_res.model.Beta[:, 1:].copy(order='C')
+    self.intercept_ = y_offset - self.coef_ @ X_offset
+
+    # only for compliance with Sklearn
+    if n_targets == 1:
+        self.coef_ = np.ravel(self.coef_)
+        self.intercept_ = self.intercept_[0]
+    self._gap = _daal4py_dual_gap(
+        self, data, targets, np.zeros(n_features), np.zeros(n_targets), n_samples)
+
+    # set n_iter_
+    n_iter = cd_solver.__get_result__().nIterations[0][0]
+    if n_targets == 1:
+        self.n_iter_ = n_iter
+    else:
+        self.n_iter_ = np.full(n_targets, n_iter)
+
+    # only for compliance with Sklearn
+    if self.max_iter == n_iter + 1:
+        warnings.warn("Objective did not converge. You might want to "
+                      "increase the number of iterations.", ConvergenceWarning)
+
+    return self
+
+
+def _daal4py_dual_gap(self, X, y, X_offset, y_offset, n_samples):
+    """Duality gap of the fitted coefficients, y is 2d"""
+    l1_reg = self.alpha * self.l1_ratio * n_samples
+    l2_reg = self.alpha * (1.0 - self.l1_ratio) * n_samples
+    n_targets = y.shape[1]
+
+    if (n_targets == 1):
+        gap = self.tol + 1.0
+        coef = np.reshape(self.coef_, (self.coef_.shape[0], 1))
+        R = (y - y_offset) - np.dot((X - X_offset), coef)
+        XtA = np.dot((X - X_offset).T, R) - l2_reg * coef
+        R_norm2 = np.dot(R.T, R)
+        coef_norm2 = np.dot(self.coef_, self.coef_)
+        dual_norm_XtA = np.max(
+            XtA) if self.positive else np.max(np.abs(XtA))
+        if dual_norm_XtA > l1_reg:
+            const = l1_reg / dual_norm_XtA
+            A_norm2 = R_norm2 * (const ** 2)
+            gap = 0.5 * (R_norm2 + A_norm2)
+        else:
+            const = 1.0
+            gap = R_norm2
+        l1_norm = np.sum(np.abs(self.coef_))
+        tmp = l1_reg * l1_norm
+        tmp -= const * np.dot(R.T, (y - y_offset))
+        tmp += 0.5 * l2_reg * (1 + const ** 2) * coef_norm2
+        gap += tmp
+        return gap[0][0]
+
+    gap = np.full(n_targets, self.tol + 1.0)
+    for k in range(n_targets):
+        R = (y[:, k] - y_offset[k]) - \
+            np.dot((X - X_offset), self.coef_[k, :].T)
+        XtA = np.dot((X - X_offset).T, R) - \
+            l2_reg * self.coef_[k, :].T
+        R_norm2 = np.dot(R.T, R)
+        coef_norm2 = np.dot(self.coef_[k, :], self.coef_[k, :].T)
+        dual_norm_XtA = np.max(
+            XtA) if self.positive else np.max(np.abs(XtA))
+        if dual_norm_XtA > l1_reg:
+            const = l1_reg / dual_norm_XtA
+            A_norm2 = R_norm2 * (const ** 2)
+            gap[k] = 0.5 * (R_norm2 + A_norm2)
+        else:
+            const = 1.0
+            gap[k] = R_norm2
+        l1_norm = np.sum(np.abs(self.coef_[k, :]))
+        tmp = l1_reg * l1_norm
+        tmp -= const * np.dot(R.T, (y[:, k] - y_offset[k]))
+        tmp += 0.5 * l2_reg * (1 + const ** 2) * coef_norm2
+        gap[k] += tmp
+    return gap
+
+
 def _daal4py_predict_lasso(self, X):
     X = make2d(X)
     _fptype = getFPType(self.coef_)
@@ -403,13 +591,19 @@ def _fit(self, X, y, sample_weight=None, check_input=True):
         self.fit_shape_good_for_daal_ = \
             True if X.ndim <= 1 else True if X.shape[0] >= X.shape[1] else False
     else:
-        self.fit_shape_good_for_daal_ = False
+        # the sparse path solves a dense problem of n_features + n_targets rows
+        self.fit_shape_good_for_daal_ = True
 
     _function_name = f"sklearn.linear_model.{self.__class__.__name__}.fit"
     _patching_status = PatchingConditionsChain(
         _function_name)
     _dal_ready = _patching_status.and_conditions([
-        (not sp.issparse(X), "X is sparse. Sparse input is not supported."),
+        (not sp.issparse(X) or X.shape[1] <= _sparse_max_features,
+            f"X is sparse and has more than {_sparse_max_features} features."),
+        (not sp.issparse(X) or self.normalize in [False, 'deprecated'],
+            "Normalization of sparse X is not supported."),
+        (not sp.issparse(X) or not isinstance(self.precompute, np.ndarray),
+            "A precomputed Gram matrix for sparse X is not supported."),
         (self.fit_shape_good_for_daal_,
             "The shape of X does not satisfy oneDAL requirements: "
             "number of features > number of samples."),
@@ -433,7 +627,7 @@ def _fit(self, X, y, sample_weight=None, check_input=True):
     self.n_iter_ = None
     self._gap = None
 
-    if not check_input:
+    if not check_input and not sp.issparse(X):
         # only for compliance with Sklearn,
         # this assert is not required for Intel(R) oneAPI Data
         # Analytics Library
@@ -452,12 +646,14 @@ def _fit(self, X, y, sample_weight=None, check_input=True):
     # only for pass tests
     # "check_estimators_fit_returns_self(readonly_memmap=True) and
     # check_regressors_train(readonly_memmap=True)
-    if not X.flags.writeable:
+    if not sp.issparse(X) and not X.flags.writeable:
         X = np.copy(X)
     if not y.flags.writeable:
         y = np.copy(y)
 
-    if self.__class__.__name__ == "ElasticNet":
+    if sp.issparse(X):
+        res = _daal4py_fit_sparse(self, X, y, check_input=check_input)
+    elif self.__class__.__name__ == "ElasticNet":
         res = _daal4py_fit_enet(self, X, y, check_input=check_input)
     else:
         res = _daal4py_fit_lasso(self, X, y, check_input=check_input)
@@ -624,59 +820,9 @@ class ElasticNet(ElasticNet_original):
     @property
     def dual_gap_(self):
         if (self._gap is None):
-            l1_reg = self.alpha * self.l1_ratio * self._X.shape[0]
-            l2_reg = self.alpha * (1.0 - self.l1_ratio) * self._X.shape[0]
-            n_targets = self._y.shape[1]
-
-            if (n_targets == 1):
-                self._gap = self.tol + 1.0
-                X_offset = np.average(self._X, axis=0)
-                y_offset = np.average(self._y, axis=0)
-                coef = np.reshape(self.coef_, (self.coef_.shape[0], 1))
-                R = (self._y - y_offset) - np.dot((self._X - X_offset), coef)
-                XtA = np.dot((self._X - X_offset).T, R) - l2_reg * coef
-                R_norm2 = np.dot(R.T, R)
-                coef_norm2 = np.dot(self.coef_, self.coef_)
-                dual_norm_XtA = np.max(
-                    XtA) if self.positive else np.max(np.abs(XtA))
-                if dual_norm_XtA > l1_reg:
-                    const = l1_reg / dual_norm_XtA
-                    A_norm2 = R_norm2 * (const ** 2)
-                    self._gap = 0.5 * (R_norm2 + A_norm2)
-                else:
-                    const = 1.0
-                    self._gap = R_norm2
-                l1_norm = np.sum(np.abs(self.coef_))
-                tmp = l1_reg * l1_norm
-                tmp -= const * np.dot(R.T, (self._y - y_offset))
-                tmp += 0.5 * l2_reg * (1 + const ** 2) * coef_norm2
-                self._gap += tmp
-                self._gap = self._gap[0][0]
-            else:
-                self._gap = np.full(n_targets, self.tol + 1.0)
-                X_offset = np.average(self._X, axis=0)
-                y_offset = np.average(self._y, axis=0)
-                for k in range(n_targets):
-                    R = (self._y[:, k] - y_offset[k]) - \
-                        np.dot((self._X - X_offset), self.coef_[k, :].T)
-                    XtA = np.dot((self._X - X_offset).T, R) - \
-                        l2_reg * self.coef_[k, :].T
-                    R_norm2 = np.dot(R.T, R)
-                    coef_norm2 = np.dot(self.coef_[k, :], self.coef_[k, :].T)
-                    dual_norm_XtA = np.max(
-                        XtA) if self.positive else np.max(np.abs(XtA))
-                    if dual_norm_XtA > l1_reg:
-                        const = l1_reg / dual_norm_XtA
-                        A_norm2 = R_norm2 * (const ** 2)
-                        self._gap[k] = 0.5 * (R_norm2 + A_norm2)
-                    else:
-                        const = 1.0
-                        self._gap[k] = R_norm2
-                    l1_norm = np.sum(np.abs(self.coef_[k, :]))
-                    tmp = l1_reg * l1_norm
-                    tmp -= const * np.dot(R.T, (self._y[:, k] - y_offset[k]))
-                    tmp += 0.5 * l2_reg * (1 + const ** 2) * coef_norm2
-                    self._gap[k] += tmp
+            self._gap = _daal4py_dual_gap(
+                self, self._X, self._y, np.average(self._X, axis=0),
+                np.average(self._y, axis=0), self._X.shape[0])
         return self._gap
 
     @dual_gap_.setter
@@ -827,3 +973,140 @@ class Lasso(ElasticNet):
         if not _dal_ready:
             return self._decision_function(X)
         return _daal4py_predict_lasso(self, X)
+
+
+def _daal4py_enet_path(X, y, l1_ratio, eps, n_alphas, alphas, precompute, Xy,
+                       coef_init, verbose, positive, params):
+    """Regularization path as a sequence of oneDAL coordinate descent fits
+    without intercept, each one warm started from the coefficients of the
+    previous (larger) alpha"""
+    n_samples, n_features = X.shape
+    if alphas is None:
+        alphas = _alpha_grid(X, y, Xy=Xy, l1_ratio=l1_ratio, fit_intercept=False,
+                             eps=eps, n_alphas=n_alphas, copy_X=False)
+    elif len(alphas) > 1:
+        alphas = np.sort(alphas)[::-1]
+    n_alphas = len(alphas)
+
+    # daal4py copies arrays that are not C-contiguous on every call
+    X = np.ascontiguousarray(X)
+    y = np.ascontiguousarray(y, dtype=X.dtype)
+
+    model = ElasticNet(
+        l1_ratio=l1_ratio,
+        fit_intercept=False,
+        precompute=precompute if isinstance(precompute, np.ndarray) else False,
+        max_iter=params.get('max_iter', 1000),
+        tol=params.get('tol', 1e-4),
+        warm_start=True,
+        positive=positive,
+        random_state=params.get('random_state', None),
+        selection=params.get('selection', 'cyclic'),
+    )
+    model._normalize = False
+    if coef_init is not None:
+        model.coef_ = np.asarray(coef_init, dtype=X.dtype)
+        model.intercept_ = 0.
+
+    coefs = np.empty((n_features, n_alphas), dtype=X.dtype)
+    dual_gaps = np.empty(n_alphas)
+    n_iters = []
+    for i, alpha in enumerate(alphas):
+        model.alpha = alpha
+        if _daal4py_fit_enet(model, X, y, check_input=False) is None:
+            return None
+        coefs[:, i] = model.coef_
+        # sklearn reports the duality gap of the path scaled by n_samples
+        dual_gaps[i] = _daal4py_dual_gap(
+            model, X, make2d(y), np.zeros(n_features), np.zeros(1), n_samples) / n_samples
+        n_iters.append(model.n_iter_)
+
+        if verbose:
+            if verbose > 2:
+                print(model)
+            elif verbose > 1:
+                print("Path: %03i out of %03i" % (i, n_alphas))
+            else:
+                sys.stderr.write(".")
+    return alphas, coefs, dual_gaps, n_iters
+
+
+@support_usm_ndarray(freefunc=True)
+def enet_path(X, y, *, l1_ratio=0.5, eps=1e-3, n_alphas=100, alphas=None,
+              precompute="auto", Xy=None, copy_X=True, coef_init=None,
+              verbose=False, return_n_iter=False, positive=False,
+              check_input=True, **params):
+    """Compute elastic net path with coordinate descent.
+
+    The coefficients of each alpha are computed by oneDAL, warm started from
+    the ones of the previous alpha. See sklearn.linear_model.enet_path for the
+    parameters and the returned values.
+    """
+    if check_input:
+        X = check_array(X, accept_sparse='csc', dtype=[np.float64, np.float32])
+        y = check_array(y, accept_sparse='csc', dtype=X.dtype.type,
+                        ensure_2d=False)
+
+    _patching_status = PatchingConditionsChain(
+        "sklearn.linear_model.enet_path")
+    _dal_ready = _patching_status.and_conditions([
+        (not sp.issparse(X), "X is sparse. Sparse input is not supported."),
+        (not sp.issparse(y) and np.ndim(y) == 1,
+            "Multi-output (multi-task) paths are not supported."),
+        (X.shape[0] >= X.shape[1],
+            "The shape of X does not satisfy oneDAL requirements: "
+            "number of features > number of samples."),
+        (X.dtype == np.float64 or X.dtype == np.float32,
+            f"'{X.dtype}' X data type is not supported. "
+            "Only np.float32 and np.float64 are supported.")])
+    _patching_status.write_log()
+
+    if _dal_ready:
+        res = _daal4py_enet_path(X, y, l1_ratio, eps, n_alphas, alphas, precompute,
+                                 Xy, coef_init, verbose, positive, params)
+        if res is not None:
+            return res if return_n_iter else res[:3]
+        logging.info(
+            "sklearn.linear_model.enet_path: " + get_patch_message("sklearn_after_daal"))
+
+    return enet_path_original(
+        X, y, l1_ratio=l1_ratio, eps=eps, n_alphas=n_alphas, alphas=alphas,
+        precompute=precompute, Xy=Xy, copy_X=copy_X, coef_init=coef_init,
+        verbose=verbose, return_n_iter=return_n_iter, positive=positive,
+        check_input=check_input, **params)
+
+
+@support_usm_ndarray(freefunc=True)
+def lasso_path(X, y, *, eps=1e-3, n_alphas=100, alphas=None, precompute="auto",
+               Xy=None, copy_X=True, coef_init=None, verbose=False,
+               return_n_iter=False, positive=False, **params):
+    """Compute Lasso path with coordinate descent.
+
+    This is enet_path with l1_ratio=1. See sklearn.linear_model.lasso_path
+    for the parameters and the returned values.
+    """
+    return enet_path(
+        X, y, l1_ratio=1.0, eps=eps, n_alphas=n_alphas, alphas=alphas,
+        precompute=precompute, Xy=Xy, copy_X=copy_X, coef_init=coef_init,
+        verbose=verbose, return_n_iter=return_n_iter, positive=positive, **params)
+
+
+# The CV estimators compute the path of every fold (and l1_ratio) with the
+# oneDAL path solver. The folds run in threads when n_jobs > 1, oneDAL
+# releases the GIL while it computes.
+class ElasticNetCV(ElasticNetCV_original):
+    __doc__ = ElasticNetCV_original.__doc__
+
+    path = staticmethod(enet_path)
+
+    def _get_estimator(self):
+        return ElasticNet()
+
+
+class LassoCV(LassoCV_original):
+    __doc__ = LassoCV_original.__doc__
+
+    path = staticmethod(lasso_path)
+
+    def _get_estimator(self):
+        return Lasso()
@@ -25,6 +25,7 @@ from .._utils import sklearn_check_version
 from .._device_offload import support_usm_ndarray
 from sklearn.utils.fixes import sparse_lsqr
 from sklearn.utils.validation import _check_sample_weight
+from sklearn.exceptions import NotFittedError
 from sklearn.utils import check_array
 
 from sklearn.linear_model import LinearRegression as LinearRegression_original
@@ -47,47 +48,259 @@ from .._utils import (
 import logging
 
 
-def _daal4py_fit(self, X, y_):
+def _center_and_rescale(X, y, sample_weight, fit_intercept):
+    """Turn a weighted least squares problem into an ordinary one without
+    intercept: X and y are centered by their weighted means (when fitting the
+    intercept) and their rows are scaled by sqrt(sample_weight).
+
+    Returns the new X and y (copies) and the offsets the intercept is
+    recovered from as y_offset - coef @ X_offset.
+    """
+    if fit_intercept:
+        X_offset = np.average(X, axis=0, weights=sample_weight).astype(X.dtype)
+        y_offset = np.average(y, axis=0, weights=sample_weight).astype(X.dtype)
+        X = X - X_offset
+        y = y - y_offset
+    else:
+        X_offset = np.zeros(X.shape[1], dtype=X.dtype)
+        y_offset = np.zeros(y.shape[1], dtype=X.dtype)
+        X, y = X.copy(), y.astype(X.dtype)
+    sw_sqrt = np.sqrt(sample_weight)[:, np.newaxis]
+    X *= sw_sqrt
+    y *= sw_sqrt
+    return X, y, X_offset, y_offset
+
+
+# The sparse path densifies the (n_features, n_features) Gram matrix and
+# eigendecomposes it, wider sparse inputs go to the stock solvers.
+_sparse_max_features = 2048
+
+
+def _sparse_normal_equations(X, y, sample_weight, fit_intercept, block_size=4096):
+    """Weighted X^T X, X^T y and y^T y of a sparse X, accumulated in float64
+    over blocks of CSR rows so that X is never densified.
+
+    The products are centered by the weighted means when fitting the
+    intercept, the offsets are returned as in _center_and_rescale.
+    """
+    X = sp.csr_matrix(X)
+    y = make2d(np.asarray(y)).astype(np.float64)
+    n_samples, n_features = X.shape
+    if sample_weight is None:
+        sample_weight = np.ones(n_samples)
+    sample_weight = np.asarray(sample_weight, dtype=np.float64)
+
+    gram = np.zeros((n_features, n_features))
+    xty = np.zeros((n_features, y.shape[1]))
+    for start in range(0, n_samples, block_size):
+        block = X[start:start + block_size].astype(np.float64)
+        block_weighted = sp.diags(sample_weight[start:start + block_size]) @ block
+        gram += (block.T @ block_weighted).toarray()
+        xty += block_weighted.T @ y[start:start + block_size]
+    y_weighted = y * sample_weight[:, np.newaxis]
+    yty = y.T @ y_weighted
+
+    if fit_intercept:
+        weight_sum = sample_weight.sum()
+        X_offset = np.asarray(X.T @ sample_weight).ravel() / weight_sum
+        y_offset = y_weighted.sum(axis=0) / weight_sum
+        gram -= weight_sum * np.outer(X_offset, X_offset)
+        xty -= weight_sum * np.outer(X_offset, y_offset)
+        yty -= weight_sum * np.outer(y_offset, y_offset)
+    else:
+        X_offset = np.zeros(n_features)
+        y_offset = np.zeros(y.shape[1])
+    return gram, xty, yty, X_offset.astype(X.dtype), y_offset.astype(X.dtype)
+
+
+def _daal4py_cross_products(X, y, fit_intercept):
+    """X^T X and X^T y in float64 from one oneDAL covariance pass over [X, y],
+    centered when fitting the intercept, with the offsets as in
+    _center_and_rescale"""
+    X, y = np.asarray(X), np.asarray(y)
+    n_samples, n_features = X.shape
+    Xy = np.hstack([X, y])
+    covariance_algo = daal4py.covariance(
+        fptype=getFPType(Xy), outputMatrixType='covarianceMatrix')
+    covariance_res = covariance_algo.compute(Xy)
+    mean = covariance_res.mean.ravel().astype(np.float64)
+    cross_products = covariance_res.covariance.astype(np.float64) * (n_samples - 1)
+    if fit_intercept:
+        X_offset, y_offset = mean[:n_features], mean[n_features:]
+    else:
+        cross_products += n_samples * np.outer(mean, mean)
+        X_offset, y_offset = np.zeros(n_features), np.zeros(y.shape[1])
+    return cross_products[:n_features, :n_features], \
+        cross_products[:n_features, n_features:], \
+        X_offset.astype(X.dtype), y_offset.astype(X.dtype)
+
+
+def _min_norm_solution(gram, xty, n_samples, dtype=np.float64):
+    """Minimum norm solution of the normal equations gram @ coef.T = xty from
+    the eigendecomposition of the Gram matrix.
+
+    Returns the coefficients, and the rank and the singular values (in
+    decreasing order) of the data the Gram matrix was built from.
+    Eigenvalues below the rounding error of the Gram matrix, accumulated in
+    dtype, count as zero, and so do their singular values.
+    """
+    n_features = gram.shape[0]
+    eigenvalues, eigenvectors = np.linalg.eigh(gram)
+    eigenvalues = np.maximum(eigenvalues[::-1], 0)
+    eigenvectors = eigenvectors[:, ::-1]
+    nonzero = eigenvalues > \
+        eigenvalues[0] * max(n_samples, n_features) * np.finfo(dtype).eps
+    basis = eigenvectors[:, nonzero]
+    coef = (basis / eigenvalues[nonzero]) @ (basis.T @ xty)
+    return coef.T, int(nonzero.sum()), np.sqrt(np.where(nonzero, eigenvalues, 0))
+
+
+def _daal4py_set_weighted_coefs(self, Beta, X_offset, y_offset, single_target):
+    """Coefficients of a model fitted without intercept to data centered by
+    the given offsets"""
+    self.__dict__.pop('daal_model_', None)  # the oneDAL model has no intercept
+    self.coef_ = Beta[:, 1:].copy(order='C')
+    self.intercept_ = y_offset - self.coef_ @ X_offset
+
+    if self.coef_.shape[0] == 1 and single_target:
+        self.coef_ = np.ravel(self.coef_)
+        self.intercept_ = self.intercept_[0]
+
+
+def _daal4py_fit(self, X, y_, sample_weight=None):
     y = make2d(y_)
     X_fptype = getFPType(X)
-
-    try:
-        lr_algorithm = daal4py.linear_regression_training(
-            fptype=X_fptype,
-            interceptFlag=bool(self.fit_intercept),
-            method='defaultDense'
-        )
-        lr_res = lr_algorithm.compute(X, y)
-    except RuntimeError:
-        # Normal system is not invertible, try QR
+    n_samples, n_features = X.shape
+    fit_intercept = bool(self.fit_intercept)
+    centered = sample_weight is not None or sp.issparse(X)
+    gram_dtype = np.float64
+    if sp.issparse(X):
+        # solved from the normal equations below
+        gram, xty, _, X_offset, y_offset = _sparse_normal_equations(
+            X, y, sample_weight, fit_intercept)
+    else:
+        if sample_weight is not None:
+            X, y, X_offset, y_offset = _center_and_rescale(
+                X, y, sample_weight, fit_intercept)
+            fit_intercept = False
         try:
             lr_algorithm = daal4py.linear_regression_training(
                 fptype=X_fptype,
-                interceptFlag=bool(self.fit_intercept),
-                method='qrDense'
+                interceptFlag=fit_intercept,
+                method='defaultDense'
             )
             lr_res = lr_algorithm.compute(X, y)
         except RuntimeError:
-            # fall back on sklearn
-            return None
+            # Normal system is not invertible. Take its minimum norm solution
+            # rather than factoring X again with QR or in sklearn.
+            gram, xty, *offsets = _daal4py_cross_products(X, y, fit_intercept)
+            # oneDAL accumulates the cross products in the type of [X, y]
+            gram_dtype = np.result_type(X, y)
+            if not centered:
+                X_offset, y_offset = offsets
+        else:
+            if not centered:
+                _daal4py_set_model(self, lr_res.model, y_.ndim == 1)
+            else:
+                _daal4py_set_weighted_coefs(
+                    self, lr_res.model.Beta, X_offset, y_offset, y_.ndim == 1)
+            self.n_features_in_ = n_features
+            self.rank_ = n_features
+            self.singular_ = np.full((n_features,), np.nan)
+            return self
+
+    coef, self.rank_, self.singular_ = _min_norm_solution(
+        gram, xty, n_samples, gram_dtype)
+    Beta = np.hstack([np.zeros((coef.shape[0], 1)), coef]).astype(
+        np.float32 if X_fptype == 'float' else np.float64)
+    _daal4py_set_weighted_coefs(self, Beta, X_offset, y_offset, y_.ndim == 1)
+    self.n_features_in_ = n_features
+    return self
 
-    lr_model = lr_res.model
-    self.daal_model_ = lr_model
-    coefs = lr_model.Beta
+
+def _daal4py_set_model(self, model, single_target):
+    self.daal_model_ = model
+    coefs = model.Beta
 
     self.intercept_ = coefs[:, 0].copy(order='C')
     self.coef_ = coefs[:, 1:].copy(order='C')
-    self.n_features_in_ = X.shape[1]
-    self.rank_ = X.shape[1]
-    self.singular_ = np.full((X.shape[1],), np.nan)
 
-    if self.coef_.shape[0] == 1 and y_.ndim == 1:
+    if self.coef_.shape[0] == 1 and single_target:
         self.coef_ = np.ravel(self.coef_)
         self.intercept_ = self.intercept_[0]
 
+
+# Attributes solved for from the normal equations accumulated by partial_fit.
+# partial_fit drops them and they are recomputed on first access, so feeding
+# many chunks costs one solve, not one per chunk.
+_streaming_attributes = ('coef_', 'intercept_', 'daal_model_')
+
+
+_streaming_state = ('_streaming_algo', '_streaming_dtype', '_streaming_y_shape')
+
+
+def _reset_streaming(self):
+    for name in _streaming_state + ('n_samples_seen_',):
+        self.__dict__.pop(name, None)
+
+
+def _daal4py_partial_fit(self, X, y_, training_algorithm, **params):
+    """Feed a chunk into the streaming algorithm of the estimator, which is
+    created by the first chunk with the given parameters."""
+    y = make2d(y_)
+    if '_streaming_algo' not in self.__dict__:
+        if 'coef_' in self.__dict__:
+            raise ValueError(
+                "partial_fit can only continue a model built by partial_fit in "
+                "this process, the streamed data is not kept by fit or pickling.")
+        self._streaming_algo = training_algorithm(
+            fptype=getFPType(X), method='defaultDense', streaming=True, **params)
+        # the fptype of the algorithm is fixed by the first chunk
+        self._streaming_dtype = X.dtype
+        self._streaming_y_shape = (y_.ndim, y.shape[1])
+        self.n_samples_seen_ = 0
+    elif (y_.ndim, y.shape[1]) != self._streaming_y_shape:
+        raise ValueError(
+            "The number of targets has changed between calls to partial_fit.")
+
+    self._streaming_algo.compute(X.astype(self._streaming_dtype, copy=False),
+                                 y.astype(self._streaming_dtype, copy=False))
+    self.n_samples_seen_ += X.shape[0]
+    for name in _streaming_attributes:
+        self.__dict__.pop(name, None)
     return self
 
 
+def _daal4py_finalize(self):
+    try:
+        res = self._streaming_algo.finalize()
+    except RuntimeError:
+        # NotFittedError is an AttributeError as well, so that hasattr()
+        # on the solved attributes returns False rather than raising
+        raise NotFittedError(
+            "The normal equations accumulated by partial_fit are singular, "
+            "more samples are needed to solve them.")
+    _daal4py_set_model(self, res.model, self._streaming_y_shape[0] == 1)
+
+
+def _streaming_getattr(self, name):
+    if name in _streaming_attributes and '_streaming_algo' in self.__dict__:
+        _daal4py_finalize(self)
+        return self.__dict__[name]
+    raise AttributeError(
+        f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+
+def _streaming_getstate(self, state):
+    """The streaming algorithm is not picklable, only the solved model is kept"""
+    if '_streaming_algo' in state:
+        for name in _streaming_attributes:
+            state[name] = getattr(self, name)
+        for name in _streaming_state:
+            del state[name]
+    return state
+
+
 def _daal4py_predict(self, X):
     X = make2d(X)
     _fptype = getFPType(self.coef_)
@@ -161,11 +374,16 @@ def _fit_linear(self, X, y, sample_weight=None):
     _patching_status = PatchingConditionsChain(
         "sklearn.linear_model.LinearRegression.fit")
     _patching_status.and_conditions([
-        (not sp.issparse(X), "X is sparse. Sparse input is not supported."),
+        (not sp.issparse(X) or X.shape[1] <= _sparse_max_features,
+            f"X is sparse and has more than {_sparse_max_features} features."),
         (self.fit_shape_good_for_daal_,
             "The shape of X does not satisfy oneDAL requirements: "
-            "number of features + 1 >= number of samples."),
-        (sample_weight is None, "Sample weights are not supported.")])
+            "number of features + 1 >= number of samples.")])
+    if sample_weight is not None:
+        sample_weight = _check_sample_weight(sample_weight, X)
+        _patching_status.and_conditions([
+            (sample_weight.min() >= 0, "Sample weights are negative."),
+            (sample_weight.max() > 0, "All sample weights are zero.")])
 
     if sklearn_check_version('0.22') and not sklearn_check_version('0.23'):
         _patching_status.and_conditions([
@@ -176,7 +394,7 @@ def _fit_linear(self, X, y, sample_weight=None):
     _dal_ready = _patching_status.get_status()
     _patching_status.write_log()
     if _dal_ready:
-        res = _daal4py_fit(self, X, y)
+        res = _daal4py_fit(self, X, y, sample_weight=sample_weight)
         if res is not None:
             return res
         logging.info(
@@ -190,6 +408,75 @@ def _fit_linear(self, X, y, sample_weight=None):
     )
 
 
+def _partial_fit_linear(self, X, y, sample_weight=None):
+    """
+    Update the linear model with a chunk of training data.
+
+    Parameters
+    ----------
+    X : numpy array of shape [n_samples,n_features]
+        Training data
+
+    y : numpy array of shape [n_samples, n_targets]
+        Target values
+
+    sample_weight : None
+        Not supported, present for API consistency
+
+    Returns
+    -------
+    self : returns an instance of self.
+    """
+    first_call = '_streaming_algo' not in self.__dict__
+    if sklearn_check_version('1.0'):
+        self._normalize = _deprecate_normalize(
+            self.normalize,
+            default=False,
+            estimator_name=self.__class__.__name__,
+        )
+        self._check_feature_names(X, reset=first_call)
+
+    # there is no stock partial_fit to fall back to
+    if sp.issparse(X):
+        raise ValueError("Sparse input is not supported by partial_fit.")
+    if sample_weight is not None:
+        raise ValueError("Sample weights are not supported by partial_fit.")
+    if getattr(self, 'positive', False):
+        raise ValueError(
+            "Forced positive coefficients are not supported by partial_fit.")
+
+    params = {
+        'X': X,
+        'y': y,
+        'y_numeric': True,
+        'multi_output': True,
+    }
+    if sklearn_check_version('0.23'):
+        X, y = _daal_validate_data(
+            self,
+            reset=first_call,
+            dtype=[np.float64, np.float32],
+            **params,
+        )
+    else:
+        X, y = _daal_check_X_y(dtype=[np.float64, np.float32], **params)
+        if first_call:
+            self.n_features_in_ = X.shape[1]
+        elif X.shape[1] != self.n_features_in_:
+            raise ValueError(
+                f'X has {X.shape[1]} features, '
+                f'but LinearRegression is expecting '
+                f'{self.n_features_in_} features as input')
+
+    _daal4py_partial_fit(self, X, y, daal4py.linear_regression_training,
+                         interceptFlag=bool(self.fit_intercept))
+    self.rank_ = X.shape[1]
+    self.singular_ = np.full((X.shape[1],), np.nan)
+    self.fit_shape_good_for_daal_ = \
+        bool(self.n_samples_seen_ > X.shape[1] + int(self.fit_intercept))
+    return self
+
+
 def _predict_linear(self, X):
     """Predict using the linear model
 
@@ -268,6 +555,12 @@ class LinearRegression(LinearRegression_original):
                 n_jobs=n_jobs
             )
 
+    def __getattr__(self, name):
+        return _streaming_getattr(self, name)
+
+    def __getstate__(self):
+        return _streaming_getstate(self, super().__getstate__())
+
     @support_usm_ndarray()
     def fit(self, X, y, sample_weight=None):
         """
@@ -291,6 +584,7 @@ class LinearRegression(LinearRegression_original):
         self : object
             Fitted Estimator.
         """
+        _reset_streaming(self)
         if sklearn_check_version('1.0'):
             self._normalize = _deprecate_normalize(
                 self.normalize,
@@ -312,6 +606,34 @@ class LinearRegression(LinearRegression_original):
                 )
         return _fit_linear(self, X, y, sample_weight=sample_weight)
 
+    @support_usm_ndarray()
+    def partial_fit(self, X, y, sample_weight=None):
+        """
+        Update the linear model with a chunk of the training data.
+
+        The chunk is added to the normal equations accumulated by a streaming
+        oneDAL algorithm. They are solved when the coefficients or predict
+        are first used after the update, so feeding many chunks costs a
+        single solve. The streamed data is not kept by fit or pickling.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Training data.
+
+        y : array-like of shape (n_samples,) or (n_samples, n_targets)
+            Target values. Will be cast to X's dtype if necessary.
+
+        sample_weight : None
+            Not supported, present for API consistency by convention.
+
+        Returns
+        -------
+        self : object
+            Updated Estimator.
+        """
+        return _partial_fit_linear(self, X, y, sample_weight=sample_weight)
+
     @support_usm_ndarray()
     def predict(self, X):
         """
@@ -15,8 +15,10 @@
 #===============================================================================
 
 import numpy as np
+from scipy import linalg
 from scipy import sparse as sp
 from sklearn.utils import check_array, check_X_y
+from sklearn.utils.validation import _check_sample_weight
 from sklearn.linear_model._ridge import _BaseRidge
 from sklearn.linear_model._ridge import Ridge as Ridge_original
 
@@ -25,24 +27,67 @@ from .._utils import (
     make2d, getFPType, get_patch_message, sklearn_check_version,
     PatchingConditionsChain)
 from .._device_offload import support_usm_ndarray
+from ._linear import (
+    _center_and_rescale,
+    _sparse_max_features,
+    _sparse_normal_equations,
+    _daal4py_set_weighted_coefs,
+    _daal4py_partial_fit,
+    _reset_streaming,
+    _streaming_getattr,
+    _streaming_getstate)
 import logging
 
 
-def _daal4py_fit(self, X, y_):
+def _ridge_params(self, X, y):
+    ridge_params = np.asarray(self.alpha, dtype=X.dtype)
+    if ridge_params.size != 1 and ridge_params.size != y.shape[1]:
+        raise ValueError("alpha length is wrong")
+    return ridge_params.reshape((1, -1))
+
+
+def _ridge_solution(gram, xty, ridge_params):
+    """Coefficients solving (gram + alpha * I) @ coef.T = xty, with one alpha
+    or one per target. None if the system is not positive definite."""
+    n_features, n_targets = xty.shape
+    alphas = np.ravel(ridge_params).astype(np.float64)
+    coef = np.empty((n_targets, n_features))
+    targets = [slice(None)] if alphas.size == 1 else range(n_targets)
+    try:
+        for target, alpha in zip(targets, np.broadcast_to(alphas, (len(targets),))):
+            system = gram + alpha * np.eye(n_features)
+            coef[target] = linalg.solve(system, xty[:, target], assume_a='pos').T
+    except linalg.LinAlgError:
+        return None
+    return coef
+
+
+def _daal4py_fit(self, X, y_, sample_weight=None):
     X = make2d(X)
     y = make2d(y_)
 
     _fptype = getFPType(X)
-
-    ridge_params = np.asarray(self.alpha, dtype=X.dtype)
-    if ridge_params.size != 1 and ridge_params.size != y.shape[1]:
-        raise ValueError("alpha length is wrong")
-    ridge_params = ridge_params.reshape((1, -1))
+    ridge_params = _ridge_params(self, X, y)
+    fit_intercept = self.fit_intercept is True
+    centered = sample_weight is not None or sp.issparse(X)
+    if sp.issparse(X):
+        gram, xty, _, X_offset, y_offset = _sparse_normal_equations(
+            X, y, sample_weight, fit_intercept)
+        coef = _ridge_solution(gram, xty, ridge_params)
+        if coef is None:
+            return None
+        Beta = np.hstack([np.zeros((coef.shape[0], 1)), coef]).astype(X.dtype)
+        _daal4py_set_weighted_coefs(self, Beta, X_offset, y_offset, y_.ndim == 1)
+        return self
+    if sample_weight is not None:
+        X, y, X_offset, y_offset = _center_and_rescale(
+            X, y, sample_weight, fit_intercept)
+        fit_intercept = False
 
     ridge_alg = daal4py.ridge_regression_training(
         fptype=_fptype,
         method='defaultDense',
-        interceptFlag=(self.fit_intercept is True),
+        interceptFlag=fit_intercept,
         ridgeParameters=ridge_params
     )
     try:
@@ -50,6 +95,11 @@ def _daal4py_fit(self, X, y_):
     except RuntimeError:
         return None
 
+    if centered:
+        _daal4py_set_weighted_coefs(
+            self, ridge_res.model.Beta, X_offset, y_offset, y_.ndim == 1)
+        return self
+
     ridge_model = ridge_res.model
     self.daal_model_ = ridge_model
     coefs = ridge_model.Beta
@@ -118,6 +168,8 @@ def _fit_ridge(self, X, y, sample_weight=None):
     self.n_features_in_ = X.shape[1]
     self.sample_weight_ = sample_weight
     self.fit_shape_good_for_daal_ = True if X.shape[0] >= X.shape[1] else False
+    if sample_weight is not None:
+        sample_weight = _check_sample_weight(sample_weight, X)
 
     _patching_status = PatchingConditionsChain(
         "sklearn.linear_model.Ridge.fit")
@@ -125,14 +177,18 @@ def _fit_ridge(self, X, y, sample_weight=None):
         (self.solver == 'auto',
             f"'{self.solver}' solver is not supported. "
             "Only 'auto' solver is supported."),
-        (not sp.issparse(X), "X is sparse. Sparse input is not supported."),
+        (not sp.issparse(X) or X.shape[1] <= _sparse_max_features,
+            f"X is sparse and has more than {_sparse_max_features} features."),
         (self.fit_shape_good_for_daal_,
             "The shape of X does not satisfy oneDAL requirements: "
             "number of features > number of samples."),
         (X.dtype == np.float64 or X.dtype == np.float32,
             f"'{X.dtype}' X data type is not supported. "
             "Only np.float32 and np.float64 are supported."),
-        (sample_weight is None, "Sample weights are not supported."),
+        (sample_weight is None or sample_weight.min() >= 0,
+            "Sample weights are negative."),
+        (sample_weight is None or sample_weight.max() > 0,
+            "All sample weights are zero."),
         (not (hasattr(self, 'positive') and self.positive),
             "Forced positive coefficients are not supported.")])
     _patching_status.write_log()
@@ -142,7 +198,7 @@ def _fit_ridge(self, X, y, sample_weight=None):
             del self.daal_model_
         return super(Ridge, self).fit(X, y, sample_weight=sample_weight)
     self.n_iter_ = None
-    res = _daal4py_fit(self, X, y)
+    res = _daal4py_fit(self, X, y, sample_weight=sample_weight)
     if res is None:
         logging.info(
             "sklearn.linear_model.Ridge.fit: " + get_patch_message("sklearn_after_daal"))
@@ -152,6 +208,61 @@ def _fit_ridge(self, X, y, sample_weight=None):
     return res
 
 
+def _partial_fit_ridge(self, X, y, sample_weight=None):
+    """Update Ridge regression model with a chunk of training data
+
+    Parameters
+    ----------
+    X : array-like, shape = [n_samples, n_features]
+        Training data
+
+    y : array-like, shape = [n_samples] or [n_samples, n_targets]
+        Target values
+
+    sample_weight : None
+        Not supported, present for API consistency
+
+    Returns
+    -------
+    self : returns an instance of self.
+    """
+    first_call = '_streaming_algo' not in self.__dict__
+    if sklearn_check_version('1.0'):
+        from sklearn.linear_model._base import _deprecate_normalize
+        self._normalize = _deprecate_normalize(
+            self.normalize,
+            default=False,
+            estimator_name=self.__class__.__name__
+        )
+        self._check_feature_names(X, reset=first_call)
+
+    # there is no stock partial_fit to fall back to
+    if sp.issparse(X):
+        raise ValueError("Sparse input is not supported by partial_fit.")
+    if sample_weight is not None:
+        raise ValueError("Sample weights are not supported by partial_fit.")
+    if hasattr(self, 'positive') and self.positive:
+        raise ValueError(
+            "Forced positive coefficients are not supported by partial_fit.")
+
+    X, y = check_X_y(X, y, dtype=[np.float64, np.float32],
+                     multi_output=True, y_numeric=True)
+    if first_call:
+        self.n_features_in_ = X.shape[1]
+    elif X.shape[1] != self.n_features_in_:
+        raise ValueError(
+            f'X has {X.shape[1]} features, '
+            f'but Ridge is expecting {self.n_features_in_} features as input')
+
+    _daal4py_partial_fit(self, X, y, daal4py.ridge_regression_training,
+                         interceptFlag=(self.fit_intercept is True),
+                         ridgeParameters=_ridge_params(self, X, make2d(y)))
+    self.n_iter_ = None
+    self.sample_weight_ = None
+    self.fit_shape_good_for_daal_ = True
+    return self
+
+
 def _predict_ridge(self, X):
     """Predict using the linear model
 
@@ -242,6 +353,12 @@ class Ridge(Ridge_original, _BaseRidge):
             self.solver = solver
             self.random_state = random_state
 
+    def __getattr__(self, name):
+        return _streaming_getattr(self, name)
+
+    def __getstate__(self):
+        return _streaming_getstate(self, super().__getstate__())
+
     @support_usm_ndarray()
     def fit(self, X, y, sample_weight=None):
         """
@@ -264,8 +381,38 @@ class Ridge(Ridge_original, _BaseRidge):
         self : object
             Fitted estimator.
         """
+        _reset_streaming(self)
         return _fit_ridge(self, X, y, sample_weight=sample_weight)
 
+    @support_usm_ndarray()
+    def partial_fit(self, X, y, sample_weight=None):
+        """
+        Update Ridge regression model with a chunk of the training data.
+
+        The chunk is added to the regularized normal equations accumulated
+        by a streaming oneDAL algorithm. They are solved when the coefficients
+        or predict are first used after the update, so feeding many chunks
+        costs a single solve. The streamed data is not kept by fit or
+        pickling.
+
+        Parameters
+        ----------
+        X : ndarray of shape (n_samples, n_features)
+            Training data.
+
+        y : ndarray of shape (n_samples,) or (n_samples, n_targets)
+            Target values.
+
+        sample_weight : None
+            Not supported, present for API consistency by convention.
+
+        Returns
+        -------
+        self : object
+            Updated estimator.
+        """
+        return _partial_fit_ridge(self, X, y, sample_weight=sample_weight)
+
     @support_usm_ndarray()
     def predict(self, X):
         """
@@ -182,3 +182,165 @@ def test_linear_array_vs_dataframe_heterogen_float_int():
     assert_array_almost_equal(
         array_reg.predict(x_test).reshape((-1, 1)),
         df_reg.predict(df_x_test).reshape((-1, 1)))
+
+
+@pytest.mark.parametrize('n_targets', [1, 3])
+def test_partial_fit_matches_fit(n_targets):
+    import pickle
+    from daal4py.sklearn.linear_model import LinearRegression, Ridge
+
+    x, y = make_regression(1000, 10, n_targets=n_targets, noise=1., random_state=0)
+    for model in (LinearRegression(), Ridge(alpha=2.)):
+        expected = model.fit(x, y)
+        expected_coef = expected.coef_.copy()
+        expected_prediction = expected.predict(x)
+
+        streamed = model.__class__(**model.get_params())
+        for x_chunk, y_chunk in zip(np.array_split(x, 7), np.array_split(y, 7)):
+            streamed.partial_fit(x_chunk, y_chunk)
+        assert streamed.n_samples_seen_ == x.shape[0]
+        assert_array_almost_equal(streamed.coef_, expected_coef)
+        assert_array_almost_equal(streamed.predict(x), expected_prediction)
+
+        restored = pickle.loads(pickle.dumps(streamed))
+        assert_array_almost_equal(restored.predict(x), expected_prediction)
+        with pytest.raises(ValueError, match="partial_fit can only continue"):
+            restored.partial_fit(x, y)
+
+
+@pytest.mark.parametrize('n_targets', [1, 3])
+def test_partial_fit_read_between_chunks(n_targets):
+    from daal4py.sklearn.linear_model import LinearRegression, Ridge
+
+    x, y = make_regression(1000, 10, n_targets=n_targets, noise=1., random_state=0)
+    for model in (LinearRegression(), Ridge(alpha=2.)):
+        streamed = model.__class__(**model.get_params())
+        n_seen = 0
+        # the streaming algorithm keeps accumulating after each finalize
+        for x_chunk, y_chunk in zip(np.array_split(x, 5), np.array_split(y, 5)):
+            streamed.partial_fit(x_chunk, y_chunk)
+            n_seen += x_chunk.shape[0]
+            expected = model.fit(x[:n_seen], y[:n_seen])
+            assert_array_almost_equal(streamed.coef_, expected.coef_)
+            assert_array_almost_equal(streamed.intercept_, expected.intercept_)
+            assert_array_almost_equal(streamed.predict(x), expected.predict(x))
+
+
+def test_partial_fit_singular():
+    from sklearn.exceptions import NotFittedError
+    from daal4py.sklearn.linear_model import LinearRegression
+
+    x, y = make_regression(20, 10, random_state=0)
+    model = LinearRegression().partial_fit(x[:3], y[:3])
+    assert not hasattr(model, 'coef_')
+    with pytest.raises(NotFittedError, match="singular"):
+        model.predict(x)
+
+    model.partial_fit(x[3:], y[3:])
+    assert_array_almost_equal(model.coef_, LinearRegression().fit(x, y).coef_)
+
+
+@pytest.mark.parametrize('fit_intercept', [True, False])
+@pytest.mark.parametrize('n_targets', [1, 2])
+def test_weighted_fit(fit_intercept, n_targets):
+    from daal4py.sklearn.linear_model import LinearRegression, Ridge
+
+    x, y = make_regression(500, 8, n_targets=n_targets, noise=5., random_state=0)
+    sample_weight = np.random.RandomState(0).uniform(0, 3, x.shape[0])
+    alpha = 3.
+
+    # weighted least squares with an unpenalized intercept, solved directly
+    x_aug = np.hstack([np.ones((x.shape[0], 1)), x]) if fit_intercept else x
+    penalty = alpha * np.eye(x_aug.shape[1])
+    if fit_intercept:
+        penalty[0, 0] = 0
+    gram = x_aug.T @ (x_aug * sample_weight[:, np.newaxis])
+    rhs = x_aug.T @ (y.reshape(x.shape[0], -1) * sample_weight[:, np.newaxis])
+
+    for model, reg in ((LinearRegression(fit_intercept=fit_intercept), 0),
+                       (Ridge(alpha=alpha, fit_intercept=fit_intercept), 1)):
+        beta = np.linalg.solve(gram + reg * penalty, rhs)
+        expected_coef = beta[int(fit_intercept):].T
+        if n_targets == 1:
+            expected_coef = expected_coef.ravel()
+        expected_intercept = beta[0] if fit_intercept else np.zeros(beta.shape[1])
+
+        model.fit(x, y, sample_weight=sample_weight)
+        assert_array_almost_equal(model.coef_, expected_coef)
+        assert_array_almost_equal(np.ravel(model.intercept_), expected_intercept)
+        assert_array_almost_equal(
+            model.predict(x), x @ model.coef_.T + model.intercept_)
+
+
+@pytest.mark.parametrize('fit_intercept', [True, False])
+def test_sparse_fit(fit_intercept):
+    import scipy.sparse as sp
+    from daal4py.sklearn.linear_model import LinearRegression, Ridge, ElasticNet, Lasso
+
+    x = sp.random(600, 30, density=0.05, format='csr', random_state=0)
+    coef = np.random.RandomState(0).normal(size=(30, 2))
+    y = x @ coef + 0.3 + np.random.RandomState(1).normal(scale=0.1, size=(600, 2))
+    sample_weight = np.random.RandomState(2).uniform(0, 3, x.shape[0])
+
+    for model, target, weights in (
+            (LinearRegression(fit_intercept=fit_intercept), y, None),
+            (LinearRegression(fit_intercept=fit_intercept), y, sample_weight),
+            (Ridge(alpha=0.5, fit_intercept=fit_intercept), y[:, 0], sample_weight),
+            (Ridge(alpha=[0.5, 2.], fit_intercept=fit_intercept), y, None),
+            (ElasticNet(alpha=1e-3, fit_intercept=fit_intercept, tol=1e-8), y, None),
+            (Lasso(alpha=1e-3, fit_intercept=fit_intercept, tol=1e-8), y[:, 0], None)):
+        dense = model.__class__(**model.get_params()).fit(
+            x.toarray(), target, sample_weight=weights)
+        model.fit(x, target, sample_weight=weights)
+        assert_array_almost_equal(model.coef_, dense.coef_, decimal=4)
+        assert_array_almost_equal(model.intercept_, dense.intercept_, decimal=4)
+        assert_array_almost_equal(model.predict(x), dense.predict(x.toarray()),
+                                  decimal=4)
+
+
+@pytest.mark.parametrize('fit_intercept', [True, False])
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+def test_singular_fit(fit_intercept, dtype):
+    from daal4py.sklearn.linear_model import LinearRegression as LinearRegressionDaal
+
+    # one-hot columns collinear with the intercept and a duplicated column
+    rng = np.random.RandomState(0)
+    x = np.hstack([np.eye(4)[rng.randint(0, 4, 300)], rng.normal(size=(300, 3))])
+    x = np.hstack([x, 2 * x[:, 4:5]])
+    y = x @ rng.normal(size=x.shape[1]) + rng.normal(scale=0.1, size=x.shape[0])
+    x, y = x.astype(dtype), y.astype(dtype)
+    decimal = 6 if dtype == np.float64 else 3
+
+    expected = LinearRegression(fit_intercept=fit_intercept).fit(x, y)
+    model = LinearRegressionDaal(fit_intercept=fit_intercept).fit(x, y)
+    assert model.rank_ == expected.rank_
+    assert_array_almost_equal(model.singular_, expected.singular_, decimal=decimal)
+    assert_array_almost_equal(model.coef_, expected.coef_, decimal=decimal)
+    assert_array_almost_equal(model.intercept_, expected.intercept_, decimal=decimal)
+    assert_array_almost_equal(model.predict(x), expected.predict(x), decimal=decimal)
+
+
+def test_enet_path_and_cv():
+    from sklearn.linear_model import enet_path as enet_path_stock
+    from sklearn.linear_model import LassoCV as LassoCV_stock
+    from daal4py.sklearn.linear_model import enet_path, lasso_path, LassoCV
+
+    x, y = make_regression(300, 10, n_informative=5, noise=5., random_state=0)
+    params = {'n_alphas': 20, 'tol': 1e-10, 'max_iter': 10000}
+
+    expected = enet_path_stock(x, y, l1_ratio=0.7, **params)
+    result = enet_path(x, y, l1_ratio=0.7, return_n_iter=True, **params)
+    assert len(result) == 4
+    assert_array_almost_equal(result[0], expected[0])
+    assert_array_almost_equal(result[1], expected[1], decimal=4)
+    assert_array_almost_equal(result[2], expected[2], decimal=6)
+    alphas, coefs, _ = lasso_path(x, y, alphas=expected[0][::-1], **params)
+    assert_array_almost_equal(alphas, expected[0])
+    assert coefs.shape == (10, 20)
+
+    expected = LassoCV_stock(cv=3, **params).fit(x, y)
+    for n_jobs in (None, 2):
+        model = LassoCV(cv=3, n_jobs=n_jobs, **params).fit(x, y)
+        assert model.alpha_ == expected.alpha_
+        assert_array_almost_equal(model.mse_path_, expected.mse_path_, decimal=3)
+        assert_array_almost_equal(model.coef_, expected.coef_, decimal=4)
@@ -15,84 +15,226 @@
 #===============================================================================
 
 from daal4py.sklearn._utils import daal_check_version, set_idp_sklearn_verbose
-from ..neighbors import KNeighborsRegressor as KNeighborsRegressor_daal4py
-from ..neighbors import NearestNeighbors as NearestNeighbors_daal4py
-from ..neighbors import KNeighborsClassifier as KNeighborsClassifier_daal4py
-from ..model_selection import _daal_train_test_split
-from ..utils.validation import _daal_assert_all_finite
-from ..svm.svm import SVC as SVC_daal4py
-from ..ensemble._forest import RandomForestClassifier as RandomForestClassifier_daal4py
-from ..ensemble._forest import RandomForestRegressor as RandomForestRegressor_daal4py
-from ..metrics import _daal_roc_auc_score
-from ..metrics import daal_pairwise_distances
-from ..cluster.k_means import KMeans as KMeans_daal4py
-from ..cluster.dbscan import DBSCAN as DBSCAN_daal4py
-from ..linear_model.coordinate_descent import Lasso as Lasso_daal4py
-from ..linear_model.coordinate_descent import ElasticNet as ElasticNet_daal4py
-from ..linear_model.linear import LinearRegression as LinearRegression_daal4py
-from ..linear_model.ridge import Ridge as Ridge_daal4py
-from ..linear_model.logistic_path import LogisticRegression as LogisticRegression_daal4py
-from ..linear_model.logistic_path import logistic_regression_path as \
-    daal_optimized_logistic_path
-from ..decomposition._pca import PCA as PCA_daal4py
-from ..manifold import TSNE as TSNE_daal4py
-from sklearn import model_selection
-from sklearn import metrics
-from sklearn.utils import validation
 import sys
 from sklearn import __version__ as sklearn_version
 from distutils.version import LooseVersion
 from functools import lru_cache
-
-import sklearn.cluster as cluster_module
-import sklearn.ensemble as ensemble_module
-import sklearn.svm as svm_module
-import sklearn.linear_model._logistic as logistic_module
-import sklearn.neighbors as neighbors_module
-import sklearn.decomposition as decomposition_module
-import sklearn.linear_model as linear_model_module
-import sklearn.manifold as manifold_module
+import importlib
+import threading
 
 import warnings
 
 
+class _LazyPatchTarget:
+    """Patch target ``(module, name, replacement)`` that imports the patched
+    module and the replacement only when they are accessed.
+
+    Indexing and unpacking follow the plain ``(module, name, replacement)``
+    tuples used by the patch maps.
+    """
+    _fields = ('module', 'name', 'replacement')
+
+    def __init__(self, module, name, replacement_module, replacement_name=None):
+        self._module = module
+        self.name = name
+        self._replacement_module = replacement_module
+        self._replacement_name = name if replacement_name is None else replacement_name
+
+    @property
+    def module(self):
+        return importlib.import_module(self._module)
+
+    @property
+    def replacement(self):
+        return getattr(importlib.import_module(self._replacement_module),
+                       self._replacement_name)
+
+    def __getitem__(self, index):
+        return getattr(self, self._fields[index])
+
+    def __len__(self):
+        return len(self._fields)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self._module}.{self.name} -> " \
+               f"{self._replacement_module}.{self._replacement_name})"
+
+
+# Patched attributes of sklearn packages whose replacement has not been
+# imported yet: {module name: {attribute: (target, original)}}
+_lazy_patches = {}
+_lazy_lock = threading.RLock()
+_lazy_resolving = 0
+
+
+def _is_initializing(module_name):
+    """Whether the current thread is executing the module, one of its parent
+    packages or submodules at import time.
+
+    Importing a replacement directly (e.g. ``from daal4py.sklearn.cluster
+    import KMeans`` after patching) runs its ``from sklearn... import X as
+    X_original`` while the replacement is only partially initialized.
+    """
+    parts = module_name.split('.')
+    parents = {'.'.join(parts[:i]) for i in range(1, len(parts) + 1)}
+    frame = sys._getframe(1)
+    while frame is not None:
+        name = frame.f_globals.get('__name__', '')
+        if name in parents or name.startswith(module_name + '.'):
+            spec = getattr(sys.modules.get(name), '__spec__', None)
+            if getattr(spec, '_initializing', False):
+                return True
+        frame = frame.f_back
+    return False
+
+
+def _install_lazy_getattr(module):
+    previous = module.__dict__.get('__getattr__')
+    if getattr(previous, '_daal4py_lazy_patching', False):
+        return
+    previous_dir = module.__dict__.get('__dir__')
+
+    def __getattr__(name):
+        global _lazy_resolving
+        lazy = _lazy_patches.get(module.__name__, {})
+        if name not in lazy:
+            if previous is not None:
+                return previous(name)
+            raise AttributeError(
+                f"module {module.__name__!r} has no attribute {name!r}")
+        with _lazy_lock:
+            if name not in lazy:
+                # resolved by another thread meanwhile
+                return getattr(module, name)
+            target, original = lazy[name]
+            if _lazy_resolving or _is_initializing(target._replacement_module):
+                # Replacement modules import the stock estimators they
+                # derive from, so keep sklearn's objects visible to them
+                if original is None:
+                    raise AttributeError(
+                        f"module {module.__name__!r} has no attribute {name!r}")
+                return original
+            _lazy_resolving += 1
+            try:
+                replacement = target.replacement
+            finally:
+                _lazy_resolving -= 1
+            del lazy[name]
+            setattr(module, name, replacement)
+            return replacement
+
+    def __dir__():
+        names = previous_dir() if previous_dir is not None else module.__dict__
+        return sorted(set(names) | set(_lazy_patches.get(module.__name__, {})))
+
+    __getattr__._daal4py_lazy_patching = True
+    module.__getattr__ = __getattr__
+    module.__dir__ = __dir__
+
+
+def _set_patched_attr(which, what, target, original):
+    # Re-exports in package namespaces are replaced through the module
+    # __getattr__ so that the replacement is imported on first use.
+    # Attributes of plain modules may be used as globals by the module
+    # itself, which bypasses __getattr__, so they are set eagerly.
+    if isinstance(target, _LazyPatchTarget) and hasattr(which, '__path__'):
+        with _lazy_lock:
+            _install_lazy_getattr(which)
+            which.__dict__.pop(what, None)
+            _lazy_patches.setdefault(which.__name__, {})[what] = (target, original)
+    else:
+        setattr(which, what, target[2])
+
+
+def _unset_patched_attr(which, what, original):
+    with _lazy_lock:
+        _lazy_patches.get(which.__name__, {}).pop(what, None)
+        setattr(which, what, original)
+
+
 @lru_cache(maxsize=None)
 def _get_map_of_algorithms():
     mapping = {
-        'pca': [[(decomposition_module, 'PCA', PCA_daal4py), None]],
-        'kmeans': [[(cluster_module, 'KMeans', KMeans_daal4py), None]],
-        'dbscan': [[(cluster_module, 'DBSCAN', DBSCAN_daal4py), None]],
-        'distances': [[(metrics, 'pairwise_distances', daal_pairwise_distances), None]],
-        'linear': [[(linear_model_module, 'LinearRegression',
-                     LinearRegression_daal4py), None]],
-        'ridge': [[(linear_model_module, 'Ridge', Ridge_daal4py), None]],
-        'elasticnet': [[(linear_model_module, 'ElasticNet', ElasticNet_daal4py), None]],
-        'lasso': [[(linear_model_module, 'Lasso', Lasso_daal4py), None]],
-        'svm': [[(svm_module, 'SVC', SVC_daal4py), None]],
-        'logistic': [[(logistic_module, '_logistic_regression_path',
-                       daal_optimized_logistic_path), None]],
-        'log_reg': [[(linear_model_module, 'LogisticRegression',
-                    LogisticRegression_daal4py), None]],
-        'knn_classifier': [[(neighbors_module, 'KNeighborsClassifier',
-                             KNeighborsClassifier_daal4py), None]],
-        'nearest_neighbors': [[(neighbors_module, 'NearestNeighbors',
-                                NearestNeighbors_daal4py), None]],
-        'knn_regressor': [[(neighbors_module, 'KNeighborsRegressor',
-                            KNeighborsRegressor_daal4py), None]],
-        'random_forest_classifier': [[(ensemble_module, 'RandomForestClassifier',
-                                       RandomForestClassifier_daal4py), None]],
-        'random_forest_regressor': [[(ensemble_module, 'RandomForestRegressor',
-                                      RandomForestRegressor_daal4py), None]],
-        'train_test_split': [[(model_selection, 'train_test_split',
-                               _daal_train_test_split), None]],
-        'fin_check': [[(validation, '_assert_all_finite',
-                        _daal_assert_all_finite), None]],
-        'roc_auc_score': [[(metrics, 'roc_auc_score',
-                           _daal_roc_auc_score), None]],
-        'tsne': [[(manifold_module, 'TSNE', TSNE_daal4py), None]],
+        'pca': [[_LazyPatchTarget('sklearn.decomposition', 'PCA',
+                                  'daal4py.sklearn.decomposition._pca'), None]],
+        'incremental_pca': [[_LazyPatchTarget(
+            'sklearn.decomposition', 'IncrementalPCA',
+            'daal4py.sklearn.decomposition._incremental_pca'), None]],
+        'kmeans': [[_LazyPatchTarget('sklearn.cluster', 'KMeans',
+                                     'daal4py.sklearn.cluster.k_means'), None]],
+        'dbscan': [[_LazyPatchTarget('sklearn.cluster', 'DBSCAN',
+                                     'daal4py.sklearn.cluster.dbscan'), None]],
+        'minibatch_kmeans': [[_LazyPatchTarget(
+            'sklearn.cluster', 'MiniBatchKMeans',
+            'daal4py.sklearn.cluster.minibatch_k_means'), None]],
+        'distances': [[_LazyPatchTarget('sklearn.metrics', 'pairwise_distances',
+                                        'daal4py.sklearn.metrics',
+                                        'daal_pairwise_distances'), None]],
+        'linear': [[_LazyPatchTarget('sklearn.linear_model', 'LinearRegression',
+                                     'daal4py.sklearn.linear_model.linear'), None]],
+        'ridge': [[_LazyPatchTarget('sklearn.linear_model', 'Ridge',
+                                    'daal4py.sklearn.linear_model.ridge'), None]],
+        'elasticnet': [[_LazyPatchTarget(
+            'sklearn.linear_model', 'ElasticNet',
+            'daal4py.sklearn.linear_model.coordinate_descent'), None]],
+        'lasso': [[_LazyPatchTarget(
+            'sklearn.linear_model', 'Lasso',
+            'daal4py.sklearn.linear_model.coordinate_descent'), None]],
+        'elasticnet_cv': [[_LazyPatchTarget(
+            'sklearn.linear_model', 'ElasticNetCV',
+            'daal4py.sklearn.linear_model.coordinate_descent'), None]],
+        'lasso_cv': [[_LazyPatchTarget(
+            'sklearn.linear_model', 'LassoCV',
+            'daal4py.sklearn.linear_model.coordinate_descent'), None]],
+        'enet_path': [[_LazyPatchTarget(
+            'sklearn.linear_model', 'enet_path',
+            'daal4py.sklearn.linear_model.coordinate_descent'), None]],
+        'lasso_path': [[_LazyPatchTarget(
+            'sklearn.linear_model', 'lasso_path',
+            'daal4py.sklearn.linear_model.coordinate_descent'), None]],
+        'svm': [[_LazyPatchTarget('sklearn.svm', 'SVC',
+                                  'daal4py.sklearn.svm.svm'), None]],
+        'logistic': [[_LazyPatchTarget('sklearn.linear_model._logistic',
+                                       '_logistic_regression_path',
+                                       'daal4py.sklearn.linear_model.logistic_path',
+                                       'logistic_regression_path'), None]],
+        'log_reg': [[_LazyPatchTarget('sklearn.linear_model', 'LogisticRegression',
+                                      'daal4py.sklearn.linear_model.logistic_path'),
+                     None]],
+        'knn_classifier': [[_LazyPatchTarget('sklearn.neighbors',
+                                             'KNeighborsClassifier',
+                                             'daal4py.sklearn.neighbors'), None]],
+        'nearest_neighbors': [[_LazyPatchTarget('sklearn.neighbors',
+                                                'NearestNeighbors',
+                                                'daal4py.sklearn.neighbors'), None]],
+        'knn_regressor': [[_LazyPatchTarget('sklearn.neighbors',
+                                            'KNeighborsRegressor',
+                                            'daal4py.sklearn.neighbors'), None]],
+        'random_forest_classifier': [[_LazyPatchTarget(
+            'sklearn.ensemble', 'RandomForestClassifier',
+            'daal4py.sklearn.ensemble._forest'), None]],
+        'random_forest_regressor': [[_LazyPatchTarget(
+            'sklearn.ensemble', 'RandomForestRegressor',
+            'daal4py.sklearn.ensemble._forest'), None]],
+        'train_test_split': [[_LazyPatchTarget('sklearn.model_selection',
+                                               'train_test_split',
+                                               'daal4py.sklearn.model_selection',
+                                               '_daal_train_test_split'), None]],
+        'fin_check': [[_LazyPatchTarget('sklearn.utils.validation',
+                                        '_assert_all_finite',
+                                        'daal4py.sklearn.utils.validation',
+                                        '_daal_assert_all_finite'), None]],
+        'roc_auc_score': [[_LazyPatchTarget('sklearn.metrics', 'roc_auc_score',
+                                            'daal4py.sklearn.metrics',
+                                            '_daal_roc_auc_score'), None]],
+        'tsne': [[_LazyPatchTarget('sklearn.manifold', 'TSNE',
+                                   'daal4py.sklearn.manifold'), None]],
     }
     mapping['svc'] = mapping['svm']
     mapping['logisticregression'] = mapping['log_reg']
+    mapping['elasticnetcv'] = mapping['elasticnet_cv']
+    mapping['lassocv'] = mapping['lasso_cv']
+    mapping['incrementalpca'] = mapping['incremental_pca']
     mapping['kneighborsclassifier'] = mapping['knn_classifier']
     mapping['nearestneighbors'] = mapping['nearest_neighbors']
     mapping['kneighborsregressor'] = mapping['knn_regressor']
@@ -105,10 +247,11 @@ def do_patch(name, get_map=_get_map_of_algorithms):
     lname = name.lower()
     if lname in get_map():
         for descriptor in get_map()[lname]:
-            which, what, replacer = descriptor[0]
+            target = descriptor[0]
+            which, what = target[0], target[1]
             if descriptor[1] is None:
                 descriptor[1] = getattr(which, what, None)
-            setattr(which, what, replacer)
+            _set_patched_attr(which, what, target, descriptor[1])
     else:
         raise ValueError("Has no patch for: " + name)
 
@@ -118,8 +261,8 @@ def do_unpatch(name, get_map=_get_map_of_algorithms):
     if lname in get_map():
         for descriptor in get_map()[lname]:
             if descriptor[1] is not None:
-                which, what, _ = descriptor[0]
-                setattr(which, what, descriptor[1])
+                target = descriptor[0]
+                _unset_patched_attr(target[0], target[1], descriptor[1])
     else:
         raise ValueError("Has no patch for: " + name)
 
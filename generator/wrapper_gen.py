@@ -1247,6 +1247,50 @@ def getTreeState(model, i=0, n_classes=1):
     return state
 
 
+def getTreeStates(model, n_classes=1):
+    cdef vector[TreeState] cTreeStates
+    cdef size_t c_n_classes = n_classes
+{% for model in ['algorithms::decision_forest::classification',
+                 'algorithms::gbt::classification',
+                 'algorithms::decision_forest::regression',
+                 'algorithms::gbt::regression'] %}
+{% if model in algos %}
+{% set flatname = '::'.join([model, 'model'])|flat %}
+    cdef {{flatname}} c_{{flatname}}
+{% endif %}
+{% endfor %}
+    if False:
+        pass
+{% for model in ['algorithms::decision_forest::classification',
+                 'algorithms::gbt::classification'] %}
+{% if model in algos %}
+{% set flatname = '::'.join([model, 'model'])|flat %}
+    elif isinstance(model, {{flatname}}):
+        c_{{flatname}} = <{{flatname}}>model
+        with nogil:
+            cTreeStates = _getTreeStates(c_{{flatname}}.c_ptr, c_n_classes)
+{% endif %}
+{% endfor %}
+{% for model in ['algorithms::decision_forest::regression',
+                 'algorithms::gbt::regression'] %}
+{% if model in algos %}
+{% set flatname = '::'.join([model, 'model'])|flat %}
+    elif isinstance(model, {{flatname}}):
+        c_{{flatname}} = <{{flatname}}>model
+        with nogil:
+            cTreeStates = _getTreeStates(c_{{flatname}}.c_ptr, 1)
+{% endif %}
+{% endfor %}
+    else:
+        assert(False), 'Incorrect model type: ' + str(type(model))
+    states = []
+    for i in range(cTreeStates.size()):
+        state = pyTreeState()
+        state.set(&cTreeStates[i])
+        states.append(state)
+    return states
+
+
 cdef extern from "daal4py_version.h":
     cdef const long long INTEL_DAAL_VERSION
     cdef const long long __INTEL_DAAL_BUILD_DATE
@@ -0,0 +1,51 @@
+#===============================================================================
+# Copyright 2022 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+from ._policy import _get_policy
+from ..datatypes._data_conversion import to_table
+
+
+class CompiledPredictor:
+    """
+    Inference entry point of a fitted estimator with the model, parameters
+    and policy resolved once.
+
+    Calls skip all input validation: X must be a 2D array (or CSR matrix
+    for models fitted on sparse data) of the dtype and number of features
+    the predictor was compiled for.
+    """
+
+    def __init__(self, infer, params, model, postprocess, dtype, queue=None):
+        self._infer = infer
+        self._params = params
+        self._model = model
+        self._postprocess = postprocess
+        self._queue = queue
+        self.dtype = dtype
+        policy = _get_policy(queue)
+        # the policy switches the daal4py SYCL context while it is alive,
+        # such a policy has to be created for every call
+        if getattr(policy._d4p_interop, '_d4p_context', None) is None:
+            self._policy = policy
+        else:
+            self._policy = None
+
+    def __call__(self, X):
+        policy = self._policy
+        if policy is None:
+            policy = _get_policy(self._queue)
+        result = self._infer(policy, self._params, self._model, to_table(X))
+        return self._postprocess(result)
@@ -34,6 +34,10 @@
 
 namespace oneapi::dal::python {
 
+// The descriptor is built from a Python dict and therefore needs the GIL,
+// but the oneDAL call itself only touches C++ objects, so the *_ops below
+// release the GIL around it to let other Python threads run concurrently.
+
 template <typename Ops>
 struct fptype2t {
     fptype2t(const Ops& ops) : ops(ops) {}
@@ -60,6 +64,7 @@ struct compute_ops {
     template <typename Float, typename Method, typename... Args>
     auto operator()(const pybind11::dict& params) {
         auto desc = ops.template operator()<Float, Method, Task, Args...>(params);
+        pybind11::gil_scoped_release release;
         return dal::compute(policy, desc, input);
     }
 
@@ -80,6 +85,7 @@ struct train_ops {
     template <typename Float, typename Method, typename... Args>
     auto operator()(const pybind11::dict& params) {
         auto desc = ops.template operator()<Float, Method, Task, Args...>(params);
+        pybind11::gil_scoped_release release;
         return dal::train(policy, desc, input);
     }
 
@@ -100,6 +106,7 @@ struct infer_ops {
     template <typename Float, typename Method, typename... Args>
     auto operator()(const pybind11::dict& params) {
         auto desc = ops.template operator()<Float, Method, Task, Args...>(params);
+        pybind11::gil_scoped_release release;
         return dal::infer(policy, desc, input);
     }
 
@@ -18,6 +18,7 @@
 
 #include <stdexcept>
 #include <string>
+#include <unordered_map>
 
 #include "oneapi/dal/table/homogen.hpp"
 #include "oneapi/dal/table/detail/csr.hpp"
@@ -81,36 +82,139 @@ inline dal::homogen_table convert_to_homogen_impl(PyArrayObject *np_data) {
     return res_table;
 }
 
-template <typename T>
-inline dal::detail::csr_table convert_to_csr_impl(PyObject *py_data,
-                                                  PyObject *py_column_indices,
-                                                  PyObject *py_row_indices,
-                                                  std::int64_t row_count,
-                                                  std::int64_t column_count) {
-    PyArrayObject *np_data = reinterpret_cast<PyArrayObject *>(py_data);
-    PyArrayObject *np_column_indices = reinterpret_cast<PyArrayObject *>(py_column_indices);
-    PyArrayObject *np_row_indices = reinterpret_cast<PyArrayObject *>(py_row_indices);
+// oneDAL CSR tables are 1-based, so converting a scipy csr_matrix requires a
+// shifted copy of its indices and row offsets. Iterative solvers convert the
+// same matrix on every call, so the shifted arrays of a matrix are cached from
+// its second conversion on. An entry holds references to the source index
+// arrays and is reused while the matrix still has the same arrays, with the
+// same buffers, sizes and types; in-place writes to the index arrays are not
+// detected. A weakref callback drops the entry once the matrix is freed.
+// All accesses happen with the GIL held.
+struct csr_index_source {
+    PyObject *array;
+    const void *data;
+    npy_intp size;
+    int type;
+};
+
+struct csr_index_cache_entry {
+    PyObject *weakref;
+    csr_index_source column_indices;
+    csr_index_source row_indices;
+    dal::array<std::int64_t> column_indices_one_based;
+    dal::array<std::int64_t> row_indices_one_based;
+};
+
+static std::unordered_map<PyObject *, csr_index_cache_entry> csr_index_cache;
+
+static csr_index_source make_csr_index_source(PyObject *array) {
+    Py_INCREF(array);
+    return { array, array_data(array), array_size(array, 0), array_type(array) };
+}
 
-    const std::int64_t *row_indices_zero_based =
-        static_cast<std::int64_t *>(array_data(np_row_indices));
-    const std::int64_t row_indices_count = static_cast<std::int64_t>(array_size(np_row_indices, 0));
+static bool is_csr_index_source(const csr_index_source &source, PyObject *array) {
+    return source.array == array && source.data == array_data(array) &&
+           source.size == array_size(array, 0) && source.type == array_type(array);
+}
 
-    auto row_indices_one_based = dal::array<std::int64_t>::empty(row_indices_count);
-    auto row_indices_one_based_data = row_indices_one_based.get_mutable_data();
+static void release_csr_index_sources(csr_index_cache_entry &entry) {
+    Py_DECREF(entry.column_indices.array);
+    Py_DECREF(entry.row_indices.array);
+}
 
-    for (std::int64_t i = 0; i < row_indices_count; ++i)
-        row_indices_one_based_data[i] = row_indices_zero_based[i] + 1;
+static PyObject *csr_index_cache_evict(PyObject *key, PyObject * /* weakref */) {
+    auto it = csr_index_cache.find(static_cast<PyObject *>(PyLong_AsVoidPtr(key)));
+    if (it != csr_index_cache.end()) {
+        Py_DECREF(it->second.weakref);
+        release_csr_index_sources(it->second);
+        csr_index_cache.erase(it);
+    }
+    Py_RETURN_NONE;
+}
 
-    const std::int64_t *column_indices_zero_based =
-        static_cast<std::int64_t *>(array_data(np_column_indices));
-    const std::int64_t column_indices_count =
-        static_cast<std::int64_t>(array_size(np_column_indices, 0));
+static PyMethodDef csr_index_cache_evict_def = { "_csr_index_cache_evict",
+                                                 csr_index_cache_evict,
+                                                 METH_O,
+                                                 nullptr };
 
-    auto column_indices_one_based = dal::array<std::int64_t>::empty(column_indices_count);
-    auto column_indices_one_based_data = column_indices_one_based.get_mutable_data();
+static dal::array<std::int64_t> make_one_based(PyObject *py_zero_based) {
+    PyObject *np_zero_based =
+        PyArray_FROMANY(py_zero_based, NPY_INT64, 0, 0, NPY_ARRAY_CARRAY | NPY_ARRAY_FORCECAST);
+    if (!np_zero_based) {
+        throw std::invalid_argument(
+            "[convert_to_table] Failed accessing csr data when converting csr_matrix.\n");
+    }
+    const std::int64_t *zero_based = static_cast<std::int64_t *>(array_data(np_zero_based));
+    const std::int64_t count = static_cast<std::int64_t>(array_size(np_zero_based, 0));
+
+    auto one_based = dal::array<std::int64_t>::empty(count);
+    auto one_based_data = one_based.get_mutable_data();
+    for (std::int64_t i = 0; i < count; ++i)
+        one_based_data[i] = zero_based[i] + 1;
 
-    for (std::int64_t i = 0; i < column_indices_count; ++i)
-        column_indices_one_based_data[i] = column_indices_zero_based[i] + 1;
+    Py_DECREF(np_zero_based);
+    return one_based;
+}
+
+static void get_csr_one_based_indices(PyObject *obj,
+                                      PyObject *py_column_indices,
+                                      PyObject *py_row_indices,
+                                      dal::array<std::int64_t> &column_indices_one_based,
+                                      dal::array<std::int64_t> &row_indices_one_based) {
+    auto it = csr_index_cache.find(obj);
+    const bool is_same_indices =
+        it != csr_index_cache.end() &&
+        is_csr_index_source(it->second.column_indices, py_column_indices) &&
+        is_csr_index_source(it->second.row_indices, py_row_indices);
+    // row offsets are never empty, so an empty copy means none was made yet
+    if (is_same_indices && it->second.row_indices_one_based.get_count() > 0) {
+        column_indices_one_based = it->second.column_indices_one_based;
+        row_indices_one_based = it->second.row_indices_one_based;
+        return;
+    }
+
+    column_indices_one_based = make_one_based(py_column_indices);
+    row_indices_one_based = make_one_based(py_row_indices);
+
+    if (is_same_indices) {
+        // second conversion of the same matrix: keep the copies from now on
+        it->second.column_indices_one_based = column_indices_one_based;
+        it->second.row_indices_one_based = row_indices_one_based;
+        return;
+    }
+    if (it != csr_index_cache.end()) {
+        // the matrix got new index arrays, the weakref is still valid
+        release_csr_index_sources(it->second);
+        it->second = { it->second.weakref,
+                       make_csr_index_source(py_column_indices),
+                       make_csr_index_source(py_row_indices) };
+        return;
+    }
+
+    PyObject *key = PyLong_FromVoidPtr(obj);
+    PyObject *callback = key ? PyCFunction_New(&csr_index_cache_evict_def, key) : nullptr;
+    Py_XDECREF(key);
+    PyObject *weakref = callback ? PyWeakref_NewRef(obj, callback) : nullptr;
+    Py_XDECREF(callback);
+    if (!weakref) {
+        // not weak-referenceable: convert without caching
+        PyErr_Clear();
+        return;
+    }
+    // a single conversion only records the index arrays, without copies
+    csr_index_cache[obj] = { weakref,
+                             make_csr_index_source(py_column_indices),
+                             make_csr_index_source(py_row_indices) };
+}
+
+template <typename T>
+inline dal::detail::csr_table convert_to_csr_impl(
+    PyObject *py_data,
+    const dal::array<std::int64_t> &column_indices_one_based,
+    const dal::array<std::int64_t> &row_indices_one_based,
+    std::int64_t row_count,
+    std::int64_t column_count) {
+    PyArrayObject *np_data = reinterpret_cast<PyArrayObject *>(py_data);
 
     const T *data_pointer = static_cast<T *>(array_data(np_data));
     const std::int64_t data_count = static_cast<std::int64_t>(array_size(np_data, 0));
@@ -158,35 +262,29 @@ dal::table convert_to_table(PyObject *obj) {
             throw std::invalid_argument("[convert_to_table] Got invalid csr_matrix object.");
         }
         PyObject *np_data = PyArray_FROMANY(py_data, array_type(py_data), 0, 0, NPY_ARRAY_CARRAY);
-        PyObject *np_column_indices =
-            PyArray_FROMANY(py_column_indices,
-                            NPY_UINT64,
-                            0,
-                            0,
-                            NPY_ARRAY_CARRAY | NPY_ARRAY_ENSURECOPY | NPY_ARRAY_FORCECAST);
-        PyObject *np_row_indices =
-            PyArray_FROMANY(py_row_indices,
-                            NPY_UINT64,
-                            0,
-                            0,
-                            NPY_ARRAY_CARRAY | NPY_ARRAY_ENSURECOPY | NPY_ARRAY_FORCECAST);
-
         PyObject *np_row_count = PyTuple_GetItem(py_shape, 0);
         PyObject *np_column_count = PyTuple_GetItem(py_shape, 1);
-        if (!(np_data && np_column_indices && np_row_indices && np_row_count && np_column_count)) {
+        if (!(np_data && np_row_count && np_column_count)) {
             throw std::invalid_argument(
                 "[convert_to_table] Failed accessing csr data when converting csr_matrix.\n");
         }
 
+        dal::array<std::int64_t> column_indices_one_based, row_indices_one_based;
+        get_csr_one_based_indices(obj,
+                                  py_column_indices,
+                                  py_row_indices,
+                                  column_indices_one_based,
+                                  row_indices_one_based);
+
         const std::int64_t row_count = static_cast<std::int64_t>(PyLong_AsSsize_t(np_row_count));
         const std::int64_t column_count =
             static_cast<std::int64_t>(PyLong_AsSsize_t(np_column_count));
 
-#define MAKE_CSR_TABLE(CType)                           \
-    res = convert_to_csr_impl<CType>(np_data,           \
-                                     np_column_indices, \
-                                     np_row_indices,    \
-                                     row_count,         \
+#define MAKE_CSR_TABLE(CType)                                  \
+    res = convert_to_csr_impl<CType>(np_data,                  \
+                                     column_indices_one_based, \
+                                     row_indices_one_based,    \
+                                     row_count,                \
                                      column_count);
         SET_NPY_FEATURE(array_type(np_data),
                         MAKE_CSR_TABLE,
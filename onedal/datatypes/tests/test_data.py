@@ -18,6 +18,7 @@ import pytest
 import numpy as np
 from numpy.testing import assert_allclose
 from onedal.primitives import linear_kernel
+from onedal.datatypes._data_conversion import from_table, to_table
 
 from onedal.tests.utils._device_selection import get_queues
 
@@ -133,3 +134,47 @@ def _test_input_format_f_contiguous_pandas(queue, dtype):
 @pytest.mark.parametrize('dtype', [np.float32, np.float64])
 def test_input_format_f_contiguous_pandas(queue, dtype):
     _test_input_format_f_contiguous_pandas(queue, dtype)
+
+
+def _assert_csr_round_trip(x_csr):
+    data, indices, indptr = from_table(to_table(x_csr))
+    assert_allclose(data, x_csr.data)
+    assert_allclose(indices, x_csr.indices)
+    assert_allclose(indptr, x_csr.indptr)
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_input_format_csr_repeated_conversion(dtype):
+    sp = pytest.importorskip('scipy.sparse')
+    x_csr = sp.random(20, 10, density=0.3, format='csr', dtype=dtype,
+                      random_state=0)
+
+    # the second conversion caches the one-based index arrays, later ones
+    # reuse them
+    for _ in range(3):
+        _assert_csr_round_trip(x_csr)
+
+    # new index arrays invalidate the cached entry
+    x_csr.indices = (x_csr.indices + 1) % x_csr.shape[1]
+    for _ in range(3):
+        _assert_csr_round_trip(x_csr)
+
+    other = sp.random(20, 10, density=0.5, format='csr', dtype=dtype,
+                      random_state=1)
+    _assert_csr_round_trip(other)
+
+
+@pytest.mark.parametrize('dtype', [np.float32, np.float64])
+def test_input_format_csr_index_arrays_resized(dtype):
+    sp = pytest.importorskip('scipy.sparse')
+    x_csr = sp.random(20, 10, density=0.3, format='csr', dtype=dtype,
+                      random_state=0)
+    for _ in range(2):
+        _assert_csr_round_trip(x_csr)
+
+    # eliminate_zeros compacts the indices in place and prunes them to the
+    # new number of stored values
+    x_csr.data[::2] = 0
+    x_csr.eliminate_zeros()
+    for _ in range(2):
+        _assert_csr_round_trip(x_csr)
@@ -37,6 +37,7 @@ from onedal import _backend
 from ..common._mixin import ClassifierMixin, RegressorMixin
 from ..common._policy import _get_policy
 from ..common._estimator_checks import _check_is_fitted, _is_classifier, _is_regressor
+from ..common._predictor import CompiledPredictor
 from ..datatypes._data_conversion import from_table, to_table
 
 
@@ -443,6 +444,22 @@ class KNeighborsClassifier(NeighborsBase, ClassifierMixin):
                    return_distance=True, queue=None):
         return super()._kneighbors(X, n_neighbors, return_distance, queue=queue)
 
+    def compile_predictor(self, queue=None):
+        _check_is_fitted(self)
+        self._fit_method = super()._parse_auto_method(
+            self.algorithm, self.n_samples_fit_, self.n_features_in_)
+        self._validate_n_classes()
+        classes = self.classes_
+
+        def postprocess(result):
+            responses = from_table(result.responses)
+            return classes.take(np.asarray(responses.ravel(), dtype=np.intp))
+
+        return CompiledPredictor(
+            _backend.neighbors.classification.infer,
+            self._get_onedal_params(self._fit_X), self._onedal_model,
+            postprocess, self._fit_X.dtype, queue=queue)
+
 
 class NearestNeighbors(NeighborsBase):
     def __init__(self, n_neighbors=5, *,
@@ -486,3 +503,74 @@ class NearestNeighbors(NeighborsBase):
     def kneighbors(self, X=None, n_neighbors=None,
                    return_distance=True, queue=None):
         return super()._kneighbors(X, n_neighbors, return_distance, queue=queue)
+
+    def radius_neighbors_graph(self, X=None, radius=None, queue=None):
+        """
+        Sparse graph of the neighbors within radius, with distances as values.
+
+        oneDAL only provides k-nearest neighbors search, so the search is
+        repeated with twice as many neighbors for the queries whose
+        neighbors all lie within radius, until no query has more. As in
+        scikit-learn, a sample is not its own neighbor if X is None.
+        """
+        _check_is_fitted(self)
+        if radius is None:
+            radius = self.radius
+
+        query_is_train = X is None
+        if query_is_train:
+            X = self._fit_X
+        else:
+            X = _check_array(X, dtype=[np.float64, np.float32])
+        n_queries, n_samples_fit = X.shape[0], self.n_samples_fit_
+
+        params = self._get_onedal_params(X)
+        n_neighbors = min(max(self.n_neighbors or 1, 1) + query_is_train,
+                          n_samples_fit)
+        pending = np.arange(n_queries)
+        rows, cols, values = [], [], []
+        while pending.size > 0:
+            params['neighbor_count'] = n_neighbors
+            result = self._onedal_predict(
+                self._onedal_model, X[pending], params, queue=queue)
+            distances = from_table(result.distances)
+            indices = from_table(result.indices)
+
+            within = distances <= radius
+            done = ~np.all(within, axis=1) | (n_neighbors == n_samples_fit)
+            within_done = within[done]
+            rows.append(np.repeat(pending[done], within_done.sum(axis=1)))
+            cols.append(indices[done][within_done].astype(np.intp))
+            values.append(distances[done][within_done])
+
+            pending = pending[~done]
+            n_neighbors = min(2 * n_neighbors, n_samples_fit)
+
+        rows, cols, values = \
+            np.concatenate(rows), np.concatenate(cols), np.concatenate(values)
+        if query_is_train:
+            not_self = rows != cols
+            rows, cols, values = rows[not_self], cols[not_self], values[not_self]
+        graph = sp.csr_matrix((values, (rows, cols)),
+                              shape=(n_queries, n_samples_fit))
+        graph.sort_indices()
+        return graph
+
+    def compile_predictor(self, queue=None):
+        _check_is_fitted(self)
+        method = super()._parse_auto_method(
+            self._fit_method, self.n_samples_fit_, self.n_features_in_)
+
+        def postprocess(result):
+            distances = from_table(result.distances)
+            indices = from_table(result.indices)
+            if method == 'kd_tree':
+                order = np.argsort(distances, axis=1)
+                distances = np.take_along_axis(distances, order, axis=1)
+                indices = np.take_along_axis(indices, order, axis=1)
+            return distances, indices
+
+        return CompiledPredictor(
+            _backend.neighbors.search.infer,
+            self._get_onedal_params(self._fit_X), self._onedal_model,
+            postprocess, self._fit_X.dtype, queue=queue)
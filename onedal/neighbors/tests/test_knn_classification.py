@@ -20,6 +20,8 @@ from numpy.testing import assert_array_equal
 
 from onedal.neighbors import KNeighborsClassifier
 from onedal.tests.utils._device_selection import get_queues
+from onedal.tests.utils._threading import (measure_threaded_throughput,
+                                           assert_gil_released)
 
 from sklearn import datasets
 
@@ -45,3 +47,29 @@ def test_pickle(queue):
     assert type(clf2) == clf.__class__
     result = clf2.predict(iris.data, queue=queue)
     assert_array_equal(expected, result)
+
+
+@pytest.mark.parametrize('queue', get_queues())
+def test_threaded_predict(queue):
+    X, y = datasets.make_classification(n_samples=2000, n_features=20,
+                                        random_state=0)
+    clf = KNeighborsClassifier(5).fit(X, y, queue=queue)
+
+    batches = np.array_split(X, 64)
+    serial, threaded = measure_threaded_throughput(
+        lambda batch: clf.predict(batch, queue=queue), batches, n_threads=4)
+    for expected, result in zip(serial, threaded):
+        assert_array_equal(expected, result)
+
+    X_large = np.tile(X, (10, 1))
+    assert_gil_released(lambda: clf.predict(X_large, queue=queue))
+
+
+@pytest.mark.parametrize('queue', get_queues())
+def test_compiled_predictor(queue):
+    iris = datasets.load_iris()
+    clf = KNeighborsClassifier(5).fit(iris.data, iris.target, queue=queue)
+    predictor = clf.compile_predictor(queue=queue)
+
+    for batch in (iris.data[:1], iris.data[:7], iris.data[:64]):
+        assert_array_equal(predictor(batch), clf.predict(batch, queue=queue))
@@ -0,0 +1,43 @@
+#===============================================================================
+# Copyright 2022 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose, assert_array_equal
+
+from onedal.neighbors import NearestNeighbors
+from onedal.tests.utils._device_selection import get_queues
+
+from sklearn.neighbors import NearestNeighbors as NearestNeighbors_sklearn
+
+
+@pytest.mark.parametrize('queue', get_queues())
+@pytest.mark.parametrize('algorithm', ['brute', 'kd_tree'])
+def test_radius_neighbors_graph(queue, algorithm):
+    rng = np.random.RandomState(0)
+    X = rng.uniform(size=(300, 2))
+    Q = rng.uniform(size=(50, 2))
+
+    nn = NearestNeighbors(n_neighbors=2, algorithm=algorithm).fit(X, None, queue=queue)
+    ref = NearestNeighbors_sklearn(radius=0.2).fit(X)
+
+    for query in (None, Q):
+        graph = nn.radius_neighbors_graph(query, radius=0.2, queue=queue)
+        expected = ref.radius_neighbors_graph(query, mode='distance')
+        expected.sort_indices()
+        assert_array_equal(graph.indptr, expected.indptr)
+        assert_array_equal(graph.indices, expected.indices)
+        assert_allclose(graph.data, expected.data)
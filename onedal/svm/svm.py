@@ -32,6 +32,7 @@ from ..datatypes import (
 from ..common._mixin import ClassifierMixin, RegressorMixin
 from ..common._policy import _get_policy
 from ..common._estimator_checks import _check_is_fitted
+from ..common._predictor import CompiledPredictor
 from ..datatypes._data_conversion import from_table, to_table
 from onedal import _backend
 
@@ -282,6 +283,30 @@ class BaseSVM(BaseEstimator, metaclass=ABCMeta):
             y = from_table(result.responses)
         return y
 
+    def _compile_predictor(self, module, postprocess, queue):
+        _check_is_fitted(self)
+        if hasattr(self, '_onedal_model'):
+            model = self._onedal_model
+        else:
+            model = self._create_model(module)
+        params = self._get_onedal_params(self.support_vectors_)
+        return CompiledPredictor(module.infer, params, model, postprocess,
+                                 self.support_vectors_.dtype, queue=queue)
+
+    def _compile_classifier(self, module, queue):
+        classes = self.classes_
+        if self.break_ties and self.decision_function_shape == 'ovr' and \
+                len(classes) > 2:
+            def postprocess(result):
+                decision = from_table(result.decision_function)
+                return classes.take(np.argmax(self._ovr_decision_function(
+                    decision < 0, -decision, len(classes)), axis=1))
+        else:
+            def postprocess(result):
+                responses = from_table(result.responses).ravel()
+                return classes.take(np.asarray(responses, dtype=np.intp))
+        return self._compile_predictor(module, postprocess, queue)
+
     def _ovr_decision_function(self, predictions, confidences, n_classes):
         n_samples = predictions.shape[0]
         votes = np.zeros((n_samples, n_classes))
@@ -366,6 +391,11 @@ class SVR(RegressorMixin, BaseSVM):
         y = super()._predict(X, _backend.svm.regression, queue)
         return y.ravel()
 
+    def compile_predictor(self, queue=None):
+        return super()._compile_predictor(
+            _backend.svm.regression,
+            lambda result: from_table(result.responses).ravel(), queue)
+
 
 class SVC(ClassifierMixin, BaseSVM):
     """
@@ -402,6 +432,9 @@ class SVC(ClassifierMixin, BaseSVM):
     def decision_function(self, X, queue=None):
         return super()._decision_function(X, _backend.svm.classification, queue)
 
+    def compile_predictor(self, queue=None):
+        return super()._compile_classifier(_backend.svm.classification, queue)
+
 
 class NuSVR(RegressorMixin, BaseSVM):
     """
@@ -428,6 +461,11 @@ class NuSVR(RegressorMixin, BaseSVM):
         y = super()._predict(X, _backend.svm.nu_regression, queue)
         return y.ravel()
 
+    def compile_predictor(self, queue=None):
+        return super()._compile_predictor(
+            _backend.svm.nu_regression,
+            lambda result: from_table(result.responses).ravel(), queue)
+
 
 class NuSVC(ClassifierMixin, BaseSVM):
     """
@@ -463,3 +501,6 @@ class NuSVC(ClassifierMixin, BaseSVM):
 
     def decision_function(self, X, queue=None):
         return super()._decision_function(X, _backend.svm.nu_classification, queue)
+
+    def compile_predictor(self, queue=None):
+        return super()._compile_classifier(_backend.svm.nu_classification, queue)
@@ -29,6 +29,8 @@ from sklearn.model_selection import train_test_split
 
 from onedal.tests.utils._device_selection import (get_queues,
                                                   pass_if_not_implemented_for_gpu)
+from onedal.tests.utils._threading import (measure_threaded_throughput,
+                                           assert_gil_released)
 
 
 def _replace_and_save(md, fns, replacing_fn):
@@ -180,3 +182,30 @@ def test_svc_sigmoid(queue, dtype):
     assert_array_equal(svc.dual_coef_, [[-1, -1, -1, 1, 1, 1]])
     assert_array_equal(svc.support_, [0, 1, 2, 3, 4, 5])
     assert_array_equal(svc.predict(X_test, queue=queue), [2, 2, 1, 2, 1])
+
+
+@pytest.mark.parametrize('queue', get_queues('host,cpu'))
+def test_threaded_predict(queue):
+    X, y = make_blobs(n_samples=2000, n_features=20, centers=2, random_state=0)
+    clf = SVC(kernel='rbf').fit(X, y, queue=queue)
+
+    batches = np.array_split(X, 64)
+    serial, threaded = measure_threaded_throughput(
+        lambda batch: clf.predict(batch, queue=queue), batches, n_threads=4)
+    for expected, result in zip(serial, threaded):
+        assert_array_equal(expected, result)
+
+    X_large = np.tile(X, (10, 1))
+    assert_gil_released(lambda: clf.predict(X_large, queue=queue))
+
+
+@pytest.mark.parametrize('queue', get_queues())
+@pytest.mark.parametrize('break_ties', [False, True])
+def test_compiled_predictor(queue, break_ties):
+    X, y = make_blobs(n_samples=300, n_features=5, centers=3, random_state=0)
+    clf = SVC(kernel='rbf', break_ties=break_ties).fit(X, y, queue=queue)
+    predictor = clf.compile_predictor(queue=queue)
+    assert predictor.dtype == X.dtype
+
+    for batch in (X[:1], X[:7], X[:64]):
+        assert_array_equal(predictor(batch), clf.predict(batch, queue=queue))
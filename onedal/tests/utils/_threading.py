@@ -0,0 +1,78 @@
+#===============================================================================
+# Copyright 2022 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+import logging
+import threading
+import time
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+
+
+def measure_threaded_throughput(func, batches, n_threads):
+    """Run ``func`` on every batch serially and from ``n_threads`` Python
+    threads, log the throughput of both runs and return both result lists."""
+    start = timeit.default_timer()
+    serial = [func(batch) for batch in batches]
+    serial_time = timeit.default_timer() - start
+
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        start = timeit.default_timer()
+        threaded = list(executor.map(func, batches))
+        threaded_time = timeit.default_timer() - start
+
+    logging.info(
+        f'{getattr(func, "__qualname__", func)}: {len(batches)} batches, '
+        f'serial {len(batches) / serial_time:.1f} batches/s, '
+        f'{n_threads} threads {len(batches) / threaded_time:.1f} batches/s '
+        f'(x{serial_time / threaded_time:.2f})')
+    return serial, threaded
+
+
+def assert_gil_released(func, min_share=0.25):
+    """Assert that another Python thread keeps making progress while
+    ``func()`` runs, compared to its progress while the caller sleeps.
+
+    A call that holds the GIL for most of its duration stalls the counting
+    thread, so its share of the baseline rate falls well below ``min_share``.
+    """
+    ticks = [0]
+    stop = threading.Event()
+
+    def count():
+        while not stop.is_set():
+            ticks[0] += 1
+
+    def count_during(call):
+        ticks[0] = 0
+        stop.clear()
+        counter = threading.Thread(target=count)
+        counter.start()
+        start = timeit.default_timer()
+        call()
+        elapsed = timeit.default_timer() - start
+        stop.set()
+        counter.join()
+        return ticks[0] / elapsed, elapsed
+
+    func()
+    rate, elapsed = count_during(func)
+    baseline, _ = count_during(lambda: time.sleep(elapsed))
+    share = rate / baseline
+    logging.info(f'{getattr(func, "__qualname__", func)}: another thread ran '
+                 f'at {share:.2f} of its idle rate over {elapsed:.3f}s')
+    assert share >= min_share, \
+        f'the call held the GIL: another thread ran at {share:.2f} ' \
+        f'of its idle rate (expected at least {min_share})'
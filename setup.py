@@ -267,6 +267,17 @@ def getpyexts():
                               libraries=libraries_plat + MPI_LIBS,
                               library_dirs=ONEDAL_LIBDIRS + MPI_LIBDIRS,
                               language='c++'))
+        if not IS_WIN:
+            exts.append(Extension('daal4py.socket_transceiver',
+                                  ['src/socket/socket_transceiver.cpp'],
+                                  depends=mpi_depens,
+                                  include_dirs=include_dir_plat + [np.get_include()],
+                                  extra_compile_args=eca,
+                                  define_macros=get_daal_type_defines(),
+                                  extra_link_args=ela,
+                                  libraries=libraries_plat,
+                                  library_dirs=ONEDAL_LIBDIRS,
+                                  language='c++'))
     return exts
 
 
@@ -17,5 +17,6 @@
 
 from .k_means import KMeans
 from .dbscan import DBSCAN
+from .minibatch_k_means import MiniBatchKMeans
 
-__all__ = ['KMeans', 'DBSCAN']
+__all__ = ['KMeans', 'DBSCAN', 'MiniBatchKMeans']
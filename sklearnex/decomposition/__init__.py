@@ -16,5 +16,6 @@
 #===============================================================================
 
 from .pca import PCA
+from .incremental_pca import IncrementalPCA
 
-__all__ = ['PCA']
+__all__ = ['PCA', 'IncrementalPCA']
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+#===============================================================================
+# Copyright 2022 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+import numpy as np
+from numpy.testing import assert_allclose
+
+
+def test_sklearnex_import():
+    from sklearnex.decomposition import IncrementalPCA
+    X = np.array([[-1, -1], [-2, -1], [-3, -2], [1, 1], [2, 1], [3, 2]])
+    incpca = IncrementalPCA(n_components=2).fit(X)
+    assert 'daal4py' in incpca.__module__
+
+
+def test_partial_fit_matches_pca():
+    from sklearn.decomposition import PCA
+    from sklearnex.decomposition import IncrementalPCA
+    rng = np.random.RandomState(0)
+    X = rng.randn(300, 6) @ rng.randn(6, 6) + rng.randn(6)
+
+    incpca = IncrementalPCA(n_components=4)
+    for batch in np.array_split(X, 7):
+        incpca.partial_fit(batch)
+    pca = PCA(n_components=4, svd_solver='full').fit(X)
+
+    assert incpca.n_samples_seen_ == X.shape[0]
+    assert_allclose(incpca.mean_, pca.mean_)
+    assert_allclose(incpca.var_, X.var(axis=0))
+    assert_allclose(incpca.explained_variance_, pca.explained_variance_)
+    assert_allclose(incpca.singular_values_, pca.singular_values_)
+    assert_allclose(incpca.noise_variance_, pca.noise_variance_)
+    assert_allclose(np.abs(incpca.components_), np.abs(pca.components_),
+                    atol=1e-7)
+    assert_allclose(np.abs(incpca.transform(X)), np.abs(pca.transform(X)),
+                    atol=1e-7)
+
+
+def test_fit_matches_partial_fit():
+    from sklearnex.decomposition import IncrementalPCA
+    rng = np.random.RandomState(1)
+    X = rng.randn(100, 5).astype(np.float32)
+
+    fitted = IncrementalPCA(n_components=3).fit(X)
+    streamed = IncrementalPCA(n_components=3)
+    for batch in np.array_split(X, 4):
+        streamed.partial_fit(batch)
+
+    assert fitted.components_.dtype == np.float32
+    assert_allclose(fitted.components_, streamed.components_, atol=1e-4)
+    assert_allclose(fitted.explained_variance_,
+                    streamed.explained_variance_, rtol=1e-4)
@@ -27,15 +27,6 @@ if os.environ.get('OFF_ONEDAL_IFACE') is None and daal_check_version((2021, 'P',
     from ._config import get_config as get_config_sklearnex
     from ._config import config_context as config_context_sklearnex
 
-    from .svm import SVR as SVR_sklearnex
-    from .svm import SVC as SVC_sklearnex
-    from .svm import NuSVR as NuSVR_sklearnex
-    from .svm import NuSVC as NuSVC_sklearnex
-
-    from .neighbors import KNeighborsClassifier as KNeighborsClassifier_sklearnex
-    # from .neighbors import KNeighborsRegressor as KNeighborsRegressor_sklearnex
-    from .neighbors import NearestNeighbors as NearestNeighbors_sklearnex
-
     new_patching_available = True
 else:
     new_patching_available = False
@@ -43,13 +34,12 @@ else:
 # Scikit-learn* modules
 
 import sklearn as base_module
-import sklearn.svm as svm_module
-import sklearn.neighbors as neighbors_module
 
 
 @lru_cache(maxsize=None)
 def get_patch_map():
-    from daal4py.sklearn.monkeypatch.dispatcher import _get_map_of_algorithms
+    from daal4py.sklearn.monkeypatch.dispatcher import (_get_map_of_algorithms,
+                                                        _LazyPatchTarget)
     mapping = _get_map_of_algorithms().copy()
 
     if new_patching_available:
@@ -57,10 +47,12 @@ def get_patch_map():
         # SVM
         mapping.pop('svm')
         mapping.pop('svc')
-        mapping['svr'] = [[(svm_module, 'SVR', SVR_sklearnex), None]]
-        mapping['svc'] = [[(svm_module, 'SVC', SVC_sklearnex), None]]
-        mapping['nusvr'] = [[(svm_module, 'NuSVR', NuSVR_sklearnex), None]]
-        mapping['nusvc'] = [[(svm_module, 'NuSVC', NuSVC_sklearnex), None]]
+        mapping['svr'] = [[_LazyPatchTarget('sklearn.svm', 'SVR', 'sklearnex.svm'), None]]
+        mapping['svc'] = [[_LazyPatchTarget('sklearn.svm', 'SVC', 'sklearnex.svm'), None]]
+        mapping['nusvr'] = [[_LazyPatchTarget('sklearn.svm', 'NuSVR',
+                                              'sklearnex.svm'), None]]
+        mapping['nusvc'] = [[_LazyPatchTarget('sklearn.svm', 'NuSVC',
+                                              'sklearnex.svm'), None]]
 
         # kNN
         mapping.pop('knn_classifier')
@@ -70,15 +62,15 @@ def get_patch_map():
         # mapping.pop('kneighborsregressor')
         mapping.pop('nearest_neighbors')
         mapping.pop('nearestneighbors')
-        mapping['knn_classifier'] = [[(neighbors_module,
-                                       'KNeighborsClassifier',
-                                       KNeighborsClassifier_sklearnex), None]]
-        # mapping['knn_regressor'] = [[(neighbors_module,
-        #                               'KNeighborsRegressor',
-        #                               KNeighborsRegressor_sklearnex), None]]
-        mapping['nearest_neighbors'] = [[(neighbors_module,
-                                          'NearestNeighbors',
-                                          NearestNeighbors_sklearnex), None]]
+        mapping['knn_classifier'] = [[_LazyPatchTarget('sklearn.neighbors',
+                                                       'KNeighborsClassifier',
+                                                       'sklearnex.neighbors'), None]]
+        # mapping['knn_regressor'] = [[_LazyPatchTarget('sklearn.neighbors',
+        #                                               'KNeighborsRegressor',
+        #                                               'sklearnex.neighbors'), None]]
+        mapping['nearest_neighbors'] = [[_LazyPatchTarget('sklearn.neighbors',
+                                                          'NearestNeighbors',
+                                                          'sklearnex.neighbors'), None]]
 
         # Configs
         mapping['set_config'] = [[(base_module,
@@ -18,7 +18,8 @@
 from .linear import LinearRegression
 from .logistic_path import logistic_regression_path, LogisticRegression
 from .ridge import Ridge
-from .coordinate_descent import ElasticNet, Lasso
+from .coordinate_descent import (ElasticNet, Lasso, ElasticNetCV, LassoCV,
+                                 enet_path, lasso_path)
 
 __all__ = [
     'Ridge',
@@ -26,5 +27,9 @@ __all__ = [
     'LogisticRegression',
     'logistic_regression_path',
     'ElasticNet',
-    'Lasso'
+    'Lasso',
+    'ElasticNetCV',
+    'LassoCV',
+    'enet_path',
+    'lasso_path'
 ]
@@ -15,4 +15,5 @@
 # limitations under the License.
 #===============================================================================
 
-from daal4py.sklearn.linear_model import ElasticNet, Lasso
+from daal4py.sklearn.linear_model import (ElasticNet, Lasso, ElasticNetCV, LassoCV,
+                                          enet_path, lasso_path)
@@ -15,15 +15,15 @@
 #===============================================================================
 
 from abc import ABC
+import copy
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from distutils.version import LooseVersion
 
+from sklearn.base import clone
 from sklearn.model_selection import StratifiedKFold
 from sklearn.preprocessing import LabelEncoder
-from sklearn.calibration import CalibratedClassifierCV
-from sklearn import __version__ as sklearn_version
 
-from onedal.datatypes.validation import _column_or_1d
+from onedal.datatypes.validation import _column_or_1d, _check_X_y
 
 
 def get_dual_coef(self):
@@ -50,6 +50,90 @@ def set_intercept(self, value):
             del self._onedal_estimator._onedal_model
 
 
+def _ovo_decision_function(onedal_estimator, X, queue=None):
+    """One-vs-one decision values oriented as in libsvm: positive favors
+    the first class of every pair"""
+    ovo_estimator = copy.copy(onedal_estimator)
+    ovo_estimator.decision_function_shape = 'ovo'
+    decision = ovo_estimator.decision_function(X, queue=queue)
+    if decision.ndim == 1:
+        # binary models score the second class positively
+        decision = -decision.reshape(-1, 1)
+    return decision
+
+
+def _sigmoid_objective(decision, targets, A, B):
+    fApB = decision * A + B
+    return np.sum(np.where(fApB >= 0,
+                           targets * fApB + np.log1p(np.exp(-np.abs(fApB))),
+                           (targets - 1) * fApB + np.log1p(np.exp(-np.abs(fApB)))))
+
+
+def _sigmoid_train(decision, labels):
+    """Platt scaling, a port of libsvm's sigmoid_train (Lin, Lin and Weng
+    2007): returns A, B of P(label | f) = 1 / (1 + exp(A * f + B))"""
+    prior1 = np.sum(labels)
+    prior0 = labels.shape[0] - prior1
+    targets = np.where(labels, (prior1 + 1.0) / (prior1 + 2.0), 1.0 / (prior0 + 2.0))
+
+    A, B = 0.0, np.log((prior0 + 1.0) / (prior1 + 1.0))
+    fval = _sigmoid_objective(decision, targets, A, B)
+    for _ in range(100):
+        fApB = decision * A + B
+        exp_term = np.exp(-np.abs(fApB))
+        p = np.where(fApB >= 0, exp_term, 1.0) / (1.0 + exp_term)
+        d2 = p * (1.0 - p)
+        h11 = 1e-12 + np.sum(decision * decision * d2)
+        h22 = 1e-12 + np.sum(d2)
+        h21 = np.sum(decision * d2)
+        d1 = targets - p
+        g1 = np.sum(decision * d1)
+        g2 = np.sum(d1)
+        if abs(g1) < 1e-5 and abs(g2) < 1e-5:
+            break
+
+        det = h11 * h22 - h21 * h21
+        dA = -(h22 * g1 - h21 * g2) / det
+        dB = -(-h21 * g1 + h11 * g2) / det
+        gd = g1 * dA + g2 * dB
+        stepsize = 1.0
+        while stepsize >= 1e-10:
+            newA, newB = A + stepsize * dA, B + stepsize * dB
+            newf = _sigmoid_objective(decision, targets, newA, newB)
+            if newf < fval + 1e-4 * stepsize * gd:
+                A, B, fval = newA, newB, newf
+                break
+            stepsize /= 2.0
+        else:
+            break
+    return A, B
+
+
+def _multiclass_probability(pairwise):
+    """Pairwise coupling of libsvm (method 2 of Wu, Lin and Weng 2004)
+    vectorized over samples; pairwise[:, i, j] is P(i | i or j)"""
+    n_samples, n_classes = pairwise.shape[:2]
+    Q = -pairwise.transpose(0, 2, 1) * pairwise
+    diagonal = np.sum(pairwise ** 2, axis=1)
+    Q[:, np.arange(n_classes), np.arange(n_classes)] = diagonal
+
+    p = np.full((n_samples, n_classes), 1.0 / n_classes)
+    eps = 0.005 / n_classes
+    for _ in range(max(100, n_classes)):
+        Qp = np.einsum('nij,nj->ni', Q, p)
+        pQp = np.sum(p * Qp, axis=1)
+        if np.max(np.abs(Qp - pQp[:, np.newaxis])) < eps:
+            break
+        for t in range(n_classes):
+            diff = (pQp - Qp[:, t]) / diagonal[:, t]
+            p[:, t] += diff
+            pQp = (pQp + diff * (diff * diagonal[:, t] + 2 * Qp[:, t])) / \
+                (1 + diff) ** 2
+            Qp = (Qp + diff[:, np.newaxis] * Q[:, t, :]) / (1 + diff)[:, np.newaxis]
+            p /= (1 + diff)[:, np.newaxis]
+    return p
+
+
 class BaseSVC(ABC):
     def _compute_balanced_class_weight(self, y):
         y_ = _column_or_1d(y)
@@ -64,38 +148,83 @@ class BaseSVC(ABC):
         return recip_freq[le.transform(classes)]
 
     def _fit_proba(self, X, y, sample_weight=None, queue=None):
-        from .._config import get_config, config_context
-
-        params = self.get_params()
-        params["probability"] = False
-        params["decision_function_shape"] = 'ovr'
-        clf_base = self.__class__(**params)
-
-        # We use stock metaestimators below, so the only way
-        # to pass a queue is using config_context.
-        cfg = get_config()
-        cfg['target_offload'] = queue
-        with config_context(**cfg):
-            try:
-                n_splits = 5
-                n_jobs = n_splits if queue is None or queue.sycl_device.is_cpu else 1
-                cv = StratifiedKFold(
-                    n_splits=n_splits,
-                    shuffle=True,
-                    random_state=self.random_state)
-                if LooseVersion(sklearn_version) >= LooseVersion("0.24"):
-                    self.clf_prob = CalibratedClassifierCV(
-                        clf_base, ensemble=False, cv=cv, method='sigmoid',
-                        n_jobs=n_jobs)
-                else:
-                    self.clf_prob = CalibratedClassifierCV(
-                        clf_base, cv=cv, method='sigmoid')
-                self.clf_prob.fit(X, y, sample_weight)
-            except ValueError:
-                clf_base = clf_base.fit(X, y, sample_weight)
-                self.clf_prob = CalibratedClassifierCV(
-                    clf_base, cv="prefit", method='sigmoid')
-                self.clf_prob.fit(X, y, sample_weight)
+        """
+        Fit libsvm-compatible Platt scaling parameters probA_ and probB_.
+
+        The sigmoids are fitted on one-vs-one decision values of held-out
+        folds. The fold models are trained by oneDAL concurrently in threads
+        sharing X. If a class is too small to be split, the decision values
+        of the fitted model are used instead.
+        """
+        X, y = _check_X_y(X, y, dtype=[np.float64, np.float32],
+                          accept_sparse='csr')
+        if sample_weight is not None:
+            sample_weight = np.asarray(sample_weight)
+        classes = self._onedal_estimator.classes_
+        y_ind = np.searchsorted(classes, y)
+
+        n_splits = 5
+        fold_params = {'decision_function_shape': 'ovo'}
+        try:
+            cv = StratifiedKFold(
+                n_splits=n_splits,
+                shuffle=True,
+                random_state=self.random_state)
+            folds = list(cv.split(X, y_ind))
+        except ValueError:
+            folds = None
+
+        if folds is None or \
+                any(len(np.unique(y_ind[train])) != len(classes) for train, _ in folds):
+            decision = _ovo_decision_function(self._onedal_estimator, X, queue=queue)
+        else:
+            def fold_decision(fold):
+                train, test = fold
+                estimator = clone(self._onedal_estimator).set_params(**fold_params)
+                estimator.fit(
+                    X[train], y[train],
+                    None if sample_weight is None else sample_weight[train],
+                    queue=queue)
+                return test, _ovo_decision_function(estimator, X[test], queue=queue)
+
+            # oneDAL releases the GIL, so threads train the folds in parallel
+            # without copying the data to worker processes
+            n_jobs = n_splits if queue is None or queue.sycl_device.is_cpu else 1
+            with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                results = list(executor.map(fold_decision, folds))
+            decision = np.empty((X.shape[0], results[0][1].shape[1]))
+            for test, fold_decision_values in results:
+                decision[test] = fold_decision_values
+
+        n_classes = len(classes)
+        probA, probB = [], []
+        k = 0
+        for i in range(n_classes):
+            for j in range(i + 1, n_classes):
+                pair = (y_ind == i) | (y_ind == j)
+                A, B = _sigmoid_train(decision[pair, k], y_ind[pair] == i)
+                probA.append(A)
+                probB.append(B)
+                k += 1
+        self._probA = np.asarray(probA)
+        self._probB = np.asarray(probB)
+
+    def _predict_proba_platt(self, X, queue=None):
+        decision = _ovo_decision_function(self._onedal_estimator, X, queue=queue)
+        pairwise_probabilities = np.clip(
+            1.0 / (1.0 + np.exp(decision * self._probA + self._probB)), 1e-7, 1 - 1e-7)
+
+        n_classes = len(self.classes_)
+        if n_classes == 2:
+            return np.hstack([pairwise_probabilities, 1 - pairwise_probabilities])
+        pairwise = np.zeros((decision.shape[0], n_classes, n_classes))
+        k = 0
+        for i in range(n_classes):
+            for j in range(i + 1, n_classes):
+                pairwise[:, i, j] = pairwise_probabilities[:, k]
+                pairwise[:, j, i] = 1 - pairwise_probabilities[:, k]
+                k += 1
+        return _multiclass_probability(pairwise)
 
     def _save_attributes(self):
         self.support_vectors_ = self._onedal_estimator.support_vectors_
@@ -110,11 +239,7 @@ class BaseSVC(ABC):
         self._n_support = self._onedal_estimator._n_support
         self._sparse = False
         self._gamma = self._onedal_estimator._gamma
-        if self.probability:
-            length = int(len(self.classes_) * (len(self.classes_) - 1) / 2)
-            self._probA = np.zeros(length)
-            self._probB = np.zeros(length)
-        else:
+        if not self.probability:
             self._probA = np.empty(0)
             self._probB = np.empty(0)
 
@@ -220,17 +220,10 @@ class SVC(sklearn_SVC, BaseSVC):
         return self._onedal_estimator.predict(X, queue=queue)
 
     def _onedal_predict_proba(self, X, queue=None):
-        if getattr(self, 'clf_prob', None) is None:
+        if len(getattr(self, '_probA', [])) == 0:
             raise NotFittedError(
                 "predict_proba is not available when fitted with probability=False")
-        from .._config import get_config, config_context
-
-        # We use stock metaestimators below, so the only way
-        # to pass a queue is using config_context.
-        cfg = get_config()
-        cfg['target_offload'] = queue
-        with config_context(**cfg):
-            return self.clf_prob.predict_proba(X)
+        return self._predict_proba_platt(X, queue=queue)
 
     def _onedal_decision_function(self, X, queue=None):
         return self._onedal_estimator.decision_function(X, queue=queue)
@@ -61,3 +61,19 @@ def test_sklearnex_import_nusvr():
     assert 'daal4py' in svc.__module__ or 'sklearnex' in svc.__module__
     assert_allclose(svc.dual_coef_, [[-1., 0.611111, 1., -0.611111]], rtol=1e-3)
     assert_allclose(svc.support_, [1, 2, 3, 5])
+
+
+def test_svc_platt_scaling_matches_libsvm():
+    from sklearn.datasets import load_iris
+    from sklearn.svm import SVC as SklearnSVC
+    from sklearnex.svm import SVC
+    X, y = load_iris(return_X_y=True)
+    svc = SVC(probability=True, random_state=0).fit(X, y)
+    reference = SklearnSVC(probability=True, random_state=0).fit(X, y)
+
+    assert svc.probA_.shape == reference.probA_.shape == (3,)
+    assert np.all(svc.probA_ < 0)
+    proba = svc.predict_proba(X)
+    assert_allclose(proba.sum(axis=1), 1.0)
+    assert np.mean(np.argmax(proba, axis=1) == svc.predict(X)) > 0.95
+    assert np.abs(proba - reference.predict_proba(X)).mean() < 0.05
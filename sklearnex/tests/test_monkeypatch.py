@@ -14,6 +14,9 @@
 # limitations under the License.
 #===============================================================================
 
+import subprocess
+import sys
+
 import sklearnex
 
 
@@ -132,3 +135,65 @@ def test_unpatch_by_list_many_estimators():
     assert KNeighborsRegressor.__module__.startswith('sklearn')
     assert LogisticRegression.__module__.startswith('daal4py')
     assert SVC.__module__.startswith('daal4py') or SVC.__module__.startswith('sklearnex')
+
+
+def test_patch_incremental_pca():
+    sklearnex.patch_sklearn(["IncrementalPCA"])
+
+    from sklearn.decomposition import IncrementalPCA, PCA
+
+    assert IncrementalPCA.__module__.startswith('daal4py')
+    assert PCA.__module__.startswith('sklearn')
+
+    sklearnex.unpatch_sklearn()
+
+    from sklearn.decomposition import IncrementalPCA
+
+    assert IncrementalPCA.__module__.startswith('sklearn')
+
+
+def _imported_modules(code):
+    # every module imported by the process is reported by `-X importtime`
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, check=True)
+    return {line.split('|')[-1].strip() for line in result.stderr.splitlines()
+            if line.startswith('import time:')}
+
+
+def test_patching_imports_estimators_lazily():
+    heavy_modules = {'daal4py.sklearn.ensemble._forest',
+                     'daal4py.sklearn.manifold._t_sne',
+                     'sklearnex.svm'}
+
+    patched = _imported_modules('from sklearnex import patch_sklearn; '
+                                'patch_sklearn()')
+    assert not heavy_modules & patched
+
+    used = _imported_modules('from sklearnex import patch_sklearn; '
+                             'patch_sklearn(); '
+                             'from sklearn.ensemble import RandomForestClassifier; '
+                             'assert RandomForestClassifier.__module__'
+                             '.startswith("daal4py")')
+    assert 'daal4py.sklearn.ensemble._forest' in used
+    assert 'daal4py.sklearn.manifold._t_sne' not in used
+
+
+def test_replacement_modules_import_after_patching():
+    from daal4py.sklearn.monkeypatch.dispatcher import _LazyPatchTarget
+    modules = {target._replacement_module
+               for entries in sklearnex.get_patch_map().values()
+               for target, _ in entries if isinstance(target, _LazyPatchTarget)}
+
+    # Replacements import the stock estimators they derive from, which must
+    # not resolve to the replacement module while it is being imported
+    for module in sorted(modules):
+        subprocess.run([sys.executable, '-c',
+                        'from sklearnex import patch_sklearn; patch_sklearn(); '
+                        f'import {module}'], check=True)
+
+    subprocess.run([sys.executable, '-c',
+                    'from sklearnex import patch_sklearn; patch_sklearn(); '
+                    'from daal4py.sklearn.cluster import KMeans; '
+                    'import sklearn.cluster; '
+                    'assert "KMeans" in dir(sklearn.cluster); '
+                    'assert sklearn.cluster.KMeans is KMeans'], check=True)
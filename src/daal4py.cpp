@@ -18,6 +18,7 @@
 #include <cstdint>
 #include <cstring>
 #include <limits>
+#include <unordered_map>
 #include <Python.h>
 #include "daal4py.h"
 #include "npy4daal.h"
@@ -365,13 +366,139 @@ static daal::data_management::NumericTablePtr _make_npynt(PyObject * nda)
     return daal::data_management::NumericTablePtr(ptr);
 }
 
+// oneDAL CSR tables are 1-based, so converting a scipy csr_matrix requires a
+// shifted copy of its indices and row offsets. Iterative solvers convert the
+// same matrix on every call, so the shifted arrays of a matrix are cached from
+// its second conversion on. An entry holds references to the source index
+// arrays and is reused while the matrix still has the same arrays, with the
+// same buffers, sizes and types; in-place writes to the index arrays are not
+// detected. A weakref callback drops the entry once the matrix is freed.
+// All accesses happen with the GIL held.
+struct csr_index_source
+{
+    PyObject * array;
+    const void * data;
+    npy_intp size;
+    int type;
+};
+
+struct csr_index_cache_entry
+{
+    PyObject * weakref;
+    csr_index_source indcs;
+    csr_index_source roffs;
+    daal::services::SharedPtr<size_t> indcs_one_based;
+    daal::services::SharedPtr<size_t> roffs_one_based;
+};
+
+static std::unordered_map<PyObject *, csr_index_cache_entry> csr_index_cache;
+
+static csr_index_source make_csr_index_source(PyObject * ary)
+{
+    Py_INCREF(ary);
+    return { ary, array_data(ary), array_size(ary, 0), array_type(ary) };
+}
+
+static bool is_csr_index_source(const csr_index_source & source, PyObject * ary)
+{
+    return source.array == ary && source.data == array_data(ary) && source.size == array_size(ary, 0) && source.type == array_type(ary);
+}
+
+static void release_csr_index_sources(csr_index_cache_entry & entry)
+{
+    Py_DECREF(entry.indcs.array);
+    Py_DECREF(entry.roffs.array);
+}
+
+static PyObject * csr_index_cache_evict(PyObject * key, PyObject * /* weakref */)
+{
+    auto it = csr_index_cache.find(reinterpret_cast<PyObject *>(PyLong_AsVoidPtr(key)));
+    if (it != csr_index_cache.end())
+    {
+        Py_DECREF(it->second.weakref);
+        release_csr_index_sources(it->second);
+        csr_index_cache.erase(it);
+    }
+    Py_RETURN_NONE;
+}
+
+static PyMethodDef csr_index_cache_evict_def = { "_csr_index_cache_evict", csr_index_cache_evict, METH_O, NULL };
+
+static daal::services::SharedPtr<size_t> make_one_based(PyObject * zero_based)
+{
+    PyObject * np_ary = PyArray_FROMANY(zero_based, NPY_UINT64, 0, 0, NPY_ARRAY_CARRAY | NPY_ARRAY_FORCECAST);
+    if (PyErr_Occurred())
+    {
+        PyErr_Print();
+        throw std::runtime_error("Python Error");
+    }
+    if (!np_ary) throw std::invalid_argument("Failed accessing csr data when converting csr_matrix.\n");
+
+    const size_t * c_ary = static_cast<size_t *>(array_data(np_ary));
+    const size_t n       = array_size(np_ary, 0);
+    size_t * one_based   = static_cast<size_t *>(daal::services::daal_malloc((n + 1) * sizeof(size_t)));
+    if (one_based)
+    {
+        for (size_t i = 0; i < n; ++i) one_based[i] = c_ary[i] + 1;
+    }
+    Py_DECREF(np_ary);
+    DAAL4PY_CHECK_MALLOC(one_based);
+    return daal::services::SharedPtr<size_t>(one_based, daal::services::ServiceDeleter());
+}
+
+static void get_csr_one_based_indices(PyObject * obj, PyObject * indcs, PyObject * roffs, daal::services::SharedPtr<size_t> & indcs_one_based,
+                                      daal::services::SharedPtr<size_t> & roffs_one_based)
+{
+    auto it                    = csr_index_cache.find(obj);
+    const bool is_same_indices = it != csr_index_cache.end() && is_csr_index_source(it->second.indcs, indcs) && is_csr_index_source(it->second.roffs, roffs);
+    if (is_same_indices && it->second.roffs_one_based.get())
+    {
+        indcs_one_based = it->second.indcs_one_based;
+        roffs_one_based = it->second.roffs_one_based;
+        return;
+    }
+
+    indcs_one_based = make_one_based(indcs);
+    roffs_one_based = make_one_based(roffs);
+
+    if (is_same_indices)
+    {
+        // second conversion of the same matrix: keep the copies from now on
+        it->second.indcs_one_based = indcs_one_based;
+        it->second.roffs_one_based = roffs_one_based;
+        return;
+    }
+    if (it != csr_index_cache.end())
+    {
+        // the matrix got new index arrays, the weakref is still valid
+        release_csr_index_sources(it->second);
+        it->second = { it->second.weakref, make_csr_index_source(indcs), make_csr_index_source(roffs) };
+        return;
+    }
+
+    PyObject * key      = PyLong_FromVoidPtr(obj);
+    PyObject * callback = key ? PyCFunction_New(&csr_index_cache_evict_def, key) : NULL;
+    Py_XDECREF(key);
+    PyObject * weakref = callback ? PyWeakref_NewRef(obj, callback) : NULL;
+    Py_XDECREF(callback);
+    if (!weakref)
+    {
+        // not weak-referenceable: convert without caching
+        PyErr_Clear();
+        return;
+    }
+    // a single conversion only records the index arrays, without copies
+    csr_index_cache[obj] = { weakref, make_csr_index_source(indcs), make_csr_index_source(roffs) };
+}
+
 // Try to convert given object to oneDAL Table without copying. Currently supports
 // * numpy contiguous, homogenous -> oneDAL HomogenNumericTable
 // * numpy non-contiguous, homogenous -> NpyNumericTable
 // * numpy structured, heterogenous -> NpyNumericTable
 // * list of arrays, heterogen -> oneDAL SOANumericTable
 // * scipy csr_matrix -> oneDAL CSRNumericTable
-//   As long as oneDAL CSR is only 0-based we need to copy indices/offsets
+//   As long as oneDAL CSR is only 1-based we need to copy indices/offsets,
+//   the copies are cached per matrix (see get_csr_one_based_indices)
 daal::data_management::NumericTablePtr make_nt(PyObject * obj)
 {
     if (PyErr_Occurred())
@@ -556,19 +683,6 @@ daal::data_management::NumericTablePtr make_nt(PyObject * obj)
                     throw std::runtime_error("Python Error");
                 }
 
-                // As long as oneDAL does not support 0-based indexing we have to copy the indices and add 1 to each
-                PyObject * np_indcs = PyArray_FROMANY(indcs, NPY_UINT64, 0, 0, NPY_ARRAY_CARRAY | NPY_ARRAY_ENSURECOPY | NPY_ARRAY_FORCECAST);
-                if (PyErr_Occurred())
-                {
-                    PyErr_Print();
-                    throw std::runtime_error("Python Error");
-                }
-                PyObject * np_roffs = PyArray_FROMANY(roffs, NPY_UINT64, 0, 0, NPY_ARRAY_CARRAY | NPY_ARRAY_ENSURECOPY | NPY_ARRAY_FORCECAST);
-                if (PyErr_Occurred())
-                {
-                    PyErr_Print();
-                    throw std::runtime_error("Python Error");
-                }
                 PyObject * np_vals = PyArray_FROMANY(vals, array_type(vals), 0, 0, NPY_ARRAY_CARRAY);
                 if (PyErr_Occurred())
                 {
@@ -589,18 +703,10 @@ daal::data_management::NumericTablePtr make_nt(PyObject * obj)
                     throw std::runtime_error("Python Error");
                 }
 
-                if (np_indcs && np_roffs && np_vals && nr && nc)
+                if (np_vals && nr && nc)
                 {
-                    size_t * c_indcs           = static_cast<size_t *>(array_data(np_indcs));
-                    size_t n                   = array_size(np_indcs, 0);
-                    size_t * c_indcs_one_based = static_cast<size_t *>(daal::services::daal_malloc(n * sizeof(size_t)));
-                    DAAL4PY_CHECK_MALLOC(c_indcs_one_based);
-                    for (size_t i = 0; i < n; ++i) c_indcs_one_based[i] = c_indcs[i] + 1;
-                    size_t * c_roffs           = static_cast<size_t *>(array_data(np_roffs));
-                    n                          = array_size(np_roffs, 0);
-                    size_t * c_roffs_one_based = static_cast<size_t *>(daal::services::daal_malloc((n + 1) * sizeof(size_t)));
-                    DAAL4PY_CHECK_MALLOC(c_roffs_one_based);
-                    for (size_t i = 0; i < n; ++i) c_roffs_one_based[i] = c_roffs[i] + 1;
+                    daal::services::SharedPtr<size_t> c_indcs_one_based, c_roffs_one_based;
+                    get_csr_one_based_indices(obj, indcs, roffs, c_indcs_one_based, c_roffs_one_based);
                     size_t c_nc = static_cast<size_t>(PyInt_AsSsize_t(nc));
                     if (PyErr_Occurred())
                     {
@@ -613,7 +719,7 @@ daal::data_management::NumericTablePtr make_nt(PyObject * obj)
                         PyErr_Print();
                         throw std::runtime_error("Python Error");
                     }
-#define MKCSR_(_T) ret = daal::data_management::CSRNumericTable::create(daal::services::SharedPtr<_T>(reinterpret_cast<_T *>(array_data(np_vals)), NumpyDeleter(reinterpret_cast<PyArrayObject *>(np_vals))), daal::services::SharedPtr<size_t>(c_indcs_one_based, daal::services::ServiceDeleter()), daal::services::SharedPtr<size_t>(c_roffs_one_based, daal::services::ServiceDeleter()), c_nc, c_nr)
+#define MKCSR_(_T) ret = daal::data_management::CSRNumericTable::create(daal::services::SharedPtr<_T>(reinterpret_cast<_T *>(array_data(np_vals)), NumpyDeleter(reinterpret_cast<PyArrayObject *>(np_vals))), c_indcs_one_based, c_roffs_one_based, c_nc, c_nr)
                     SET_NPY_FEATURE(array_type(np_vals), MKCSR_, throw std::invalid_argument("Found unsupported data type in csr_matrix"));
 #undef MKCSR_
                 }
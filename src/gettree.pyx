@@ -15,6 +15,7 @@
 #===============================================================================
 
 from cpython cimport Py_INCREF, PyTypeObject
+from libcpp.vector cimport vector
 import numpy as np
 cimport numpy as cnp
 
@@ -49,6 +50,7 @@ cdef extern from "tree_visitor.h":
 
     cdef TreeState _getTreeState[M](M * model, size_t i, size_t n_classes)
     cdef TreeState _getTreeState[M](M * model, size_t n_classes)
+    cdef vector[TreeState] _getTreeStates[M](M * model, size_t n_classes) nogil except +
 
 NODE_DTYPE = np.dtype({
     'names': ['left_child', 'right_child', 'feature', 'threshold', 'impurity',
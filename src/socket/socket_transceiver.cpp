@@ -0,0 +1,308 @@
+/*******************************************************************************
+* Copyright 2022 Intel Corporation
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+*     http://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+*******************************************************************************/
+
+#include "socket_transceiver.h"
+#include "daal4py_defines.h"
+#include <Python.h>
+#include <arpa/inet.h>
+#include <netinet/in.h>
+#include <netinet/tcp.h>
+#include <poll.h>
+#include <sys/socket.h>
+#include <unistd.h>
+#include <cerrno>
+#include <chrono>
+#include <cstdint>
+#include <cstdlib>
+#include <cstring>
+#include <string>
+#include <thread>
+
+namespace {
+
+// every message is preceded by this header
+struct message_header
+{
+    uint64_t tag;
+    uint64_t size;
+};
+
+// time to wait for all peers to show up in init
+const int CONNECT_TIMEOUT_SEC = 60;
+
+size_t env_size_t(const char * name, size_t dflt)
+{
+    const char * val = std::getenv(name);
+    if(val == NULL || *val == '\0') return dflt;
+    char * end = NULL;
+    unsigned long long res = std::strtoull(val, &end, 10);
+    if(*end != '\0') throw std::runtime_error(std::string("Invalid value of ") + name + ": " + val);
+    return static_cast<size_t>(res);
+}
+
+void throw_errno(const char * what)
+{
+    throw std::runtime_error(std::string("socket_transceiver: ") + what + ": " + std::strerror(errno));
+}
+
+sockaddr_in make_address(const char * host, size_t port)
+{
+    sockaddr_in addr;
+    std::memset(&addr, 0, sizeof(addr));
+    addr.sin_family = AF_INET;
+    addr.sin_port = htons(static_cast<uint16_t>(port));
+    if(inet_pton(AF_INET, host, &addr.sin_addr) != 1) {
+        throw std::runtime_error(std::string("socket_transceiver: invalid address ") + host);
+    }
+    return addr;
+}
+
+void set_nodelay(int fd)
+{
+    int one = 1;
+    setsockopt(fd, IPPROTO_TCP, TCP_NODELAY, &one, sizeof(one));
+}
+
+void write_all(int fd, const void * buff, size_t N)
+{
+    const char * ptr = static_cast<const char *>(buff);
+    while(N > 0) {
+        ssize_t n = ::send(fd, ptr, N, 0);
+        if(n < 0) {
+            if(errno == EINTR) continue;
+            throw_errno("send failed");
+        }
+        ptr += n;
+        N -= n;
+    }
+}
+
+void read_all(int fd, void * buff, size_t N)
+{
+    char * ptr = static_cast<char *>(buff);
+    while(N > 0) {
+        ssize_t n = ::recv(fd, ptr, N, 0);
+        if(n == 0) throw std::runtime_error("socket_transceiver: connection closed by peer");
+        if(n < 0) {
+            if(errno == EINTR) continue;
+            throw_errno("recv failed");
+        }
+        ptr += n;
+        N -= n;
+    }
+}
+
+} // namespace
+
+void socket_transceiver::init()
+{
+    if(m_initialized) return;
+
+    m_size = env_size_t("D4P_NPROCS", 1);
+    m_rank = env_size_t("D4P_RANK", 0);
+    DAAL4PY_CHECK(m_size > 0 && m_rank < m_size, "socket_transceiver: D4P_RANK must be in [0, D4P_NPROCS)");
+    const char * host = std::getenv("D4P_HOST");
+    if(host == NULL || *host == '\0') host = "127.0.0.1";
+    size_t port = env_size_t("D4P_PORT", 29400);
+    DAAL4PY_CHECK(port + m_size <= 65536, "socket_transceiver: D4P_PORT out of range");
+
+    m_sockets.assign(m_size, -1);
+    m_inboxes.assign(m_size, inbox());
+
+    if(m_size > 1) {
+        // listen first, peers with a higher rank connect to us
+        int listener = socket(AF_INET, SOCK_STREAM, 0);
+        if(listener < 0) throw_errno("socket failed");
+        int one = 1;
+        setsockopt(listener, SOL_SOCKET, SO_REUSEADDR, &one, sizeof(one));
+        sockaddr_in addr = make_address(host, port + m_rank);
+        if(bind(listener, reinterpret_cast<sockaddr *>(&addr), sizeof(addr)) < 0) throw_errno("bind failed");
+        if(listen(listener, static_cast<int>(m_size)) < 0) throw_errno("listen failed");
+
+        // connect to all lower ranks, retrying until they are listening
+        auto deadline = std::chrono::steady_clock::now() + std::chrono::seconds(CONNECT_TIMEOUT_SEC);
+        for(size_t peer = 0; peer < m_rank; ++peer) {
+            sockaddr_in peer_addr = make_address(host, port + peer);
+            int fd = -1;
+            while(true) {
+                fd = socket(AF_INET, SOCK_STREAM, 0);
+                if(fd < 0) throw_errno("socket failed");
+                if(connect(fd, reinterpret_cast<sockaddr *>(&peer_addr), sizeof(peer_addr)) == 0) break;
+                close(fd);
+                if(std::chrono::steady_clock::now() > deadline) throw_errno("could not connect to peer");
+                std::this_thread::sleep_for(std::chrono::milliseconds(50));
+            }
+            set_nodelay(fd);
+            uint64_t rank = m_rank;
+            write_all(fd, &rank, sizeof(rank));
+            m_sockets[peer] = fd;
+        }
+
+        // accept all higher ranks, they tell us who they are
+        for(size_t i = m_rank + 1; i < m_size; ++i) {
+            int fd = accept(listener, NULL, NULL);
+            if(fd < 0) {
+                if(errno == EINTR) { --i; continue; }
+                throw_errno("accept failed");
+            }
+            set_nodelay(fd);
+            uint64_t rank = 0;
+            read_all(fd, &rank, sizeof(rank));
+            DAAL4PY_CHECK(rank > m_rank && rank < m_size && m_sockets[rank] < 0,
+                          "socket_transceiver: unexpected peer, check D4P_RANK on all processes");
+            m_sockets[rank] = fd;
+        }
+        close(listener);
+    }
+
+    transceiver_impl::init();
+}
+
+void socket_transceiver::fini()
+{
+    for(size_t i = 0; i < m_sockets.size(); ++i) {
+        if(m_sockets[i] >= 0) close(m_sockets[i]);
+    }
+    m_sockets.clear();
+    m_inboxes.clear();
+}
+
+size_t socket_transceiver::nMembers()
+{
+    return m_size;
+}
+
+size_t socket_transceiver::me()
+{
+    return m_rank;
+}
+
+bool socket_transceiver::drain(size_t peer, bool block)
+{
+    inbox & box = m_inboxes[peer];
+    // drop consumed bytes before growing the buffer
+    if(box.pos > 0 && box.pos * 2 >= box.data.size()) {
+        box.data.erase(box.data.begin(), box.data.begin() + box.pos);
+        box.pos = 0;
+    }
+    const size_t chunk = 1 << 16;
+    size_t old_size = box.data.size();
+    box.data.resize(old_size + chunk);
+    ssize_t n;
+    do {
+        n = ::recv(m_sockets[peer], box.data.data() + old_size, chunk, block ? 0 : MSG_DONTWAIT);
+    } while(n < 0 && errno == EINTR);
+    if(n < 0) {
+        box.data.resize(old_size);
+        if(!block && (errno == EAGAIN || errno == EWOULDBLOCK)) return false;
+        throw_errno("recv failed");
+    }
+    if(n == 0) {
+        box.data.resize(old_size);
+        throw std::runtime_error("socket_transceiver: connection closed by peer");
+    }
+    box.data.resize(old_size + n);
+    return true;
+}
+
+void socket_transceiver::fill(size_t peer, size_t N)
+{
+    while(m_inboxes[peer].available() < N) {
+        DAAL4PY_CHECK(peer != m_rank, "socket_transceiver: recv from self without matching send");
+        drain(peer, true);
+    }
+}
+
+void socket_transceiver::take(size_t peer, void * buff, size_t N)
+{
+    inbox & box = m_inboxes[peer];
+    if(N > 0) std::memcpy(buff, box.data.data() + box.pos, N);
+    box.pos += N;
+}
+
+void socket_transceiver::send(const void* buff, size_t N, size_t recpnt, size_t tag)
+{
+    DAAL4PY_CHECK(recpnt < m_size, "socket_transceiver: invalid recipient");
+    message_header header = {static_cast<uint64_t>(tag), static_cast<uint64_t>(N)};
+
+    if(recpnt == m_rank) {
+        // messages to self are queued without going through the network
+        inbox & box = m_inboxes[m_rank];
+        const char * h = reinterpret_cast<const char *>(&header);
+        box.data.insert(box.data.end(), h, h + sizeof(header));
+        box.data.insert(box.data.end(), static_cast<const char *>(buff), static_cast<const char *>(buff) + N);
+        return;
+    }
+
+    // Both sides of a connection may send at the same time (e.g. pairwise
+    // exchanges). To not deadlock on full socket buffers incoming data is
+    // moved to the inbox whenever the socket is not writable.
+    int fd = m_sockets[recpnt];
+    const char * parts[2] = {reinterpret_cast<const char *>(&header), static_cast<const char *>(buff)};
+    size_t sizes[2] = {sizeof(header), N};
+    for(int p = 0; p < 2; ++p) {
+        const char * ptr = parts[p];
+        size_t left = sizes[p];
+        while(left > 0) {
+            ssize_t n = ::send(fd, ptr, left, MSG_DONTWAIT);
+            if(n >= 0) {
+                ptr += n;
+                left -= n;
+                continue;
+            }
+            if(errno == EINTR) continue;
+            if(errno != EAGAIN && errno != EWOULDBLOCK) throw_errno("send failed");
+            pollfd pfd = {fd, POLLIN | POLLOUT, 0};
+            if(poll(&pfd, 1, -1) < 0 && errno != EINTR) throw_errno("poll failed");
+            if(pfd.revents & POLLIN) {
+                while(drain(recpnt, false)) {}
+            }
+        }
+    }
+}
+
+size_t socket_transceiver::recv(void * buff, size_t N, int sender, int tag)
+{
+    DAAL4PY_CHECK(sender >= 0 && static_cast<size_t>(sender) < m_size, "socket_transceiver: invalid sender");
+    message_header header;
+    fill(sender, sizeof(header));
+    take(sender, &header, sizeof(header));
+    // messages between two processes arrive in order, collectives and
+    // algorithms never interleave tags on one connection
+    DAAL4PY_CHECK(header.tag == static_cast<uint64_t>(tag), "socket_transceiver: unexpected message tag");
+    DAAL4PY_CHECK(header.size <= N, "socket_transceiver: message larger than receive buffer");
+    fill(sender, header.size);
+    take(sender, buff, header.size);
+    return header.size;
+}
+
+// ************************************
+// ************************************
+
+extern "C" PyMODINIT_FUNC PyInit_socket_transceiver(void)
+{
+    // shared pointer, will GC transceiver when shutting down
+    static std::shared_ptr<socket_transceiver> s_sst;
+    PyObject *m;
+    static struct PyModuleDef moduledef = { PyModuleDef_HEAD_INIT, "daal4py.socket_transceiver", "No docs", -1, NULL, };
+    m = PyModule_Create(&moduledef);
+    if (m == NULL)
+        return NULL;
+
+    s_sst.reset(new socket_transceiver);
+    PyObject_SetAttrString(m, "transceiver", PyLong_FromVoidPtr((void*)(&s_sst)));
+    return m;
+}
@@ -0,0 +1,74 @@
+/*******************************************************************************
+* Copyright 2022 Intel Corporation
+*
+* Licensed under the Apache License, Version 2.0 (the "License");
+* you may not use this file except in compliance with the License.
+* You may obtain a copy of the License at
+*
+*     http://www.apache.org/licenses/LICENSE-2.0
+*
+* Unless required by applicable law or agreed to in writing, software
+* distributed under the License is distributed on an "AS IS" BASIS,
+* WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+* See the License for the specific language governing permissions and
+* limitations under the License.
+*******************************************************************************/
+
+#ifndef _SOCKET_TRANSCEIVER_INCLUDED_
+#define _SOCKET_TRANSCEIVER_INCLUDED_
+
+#include "transceiver.h"
+#include <vector>
+
+// implementation of transceiver_iface using TCP sockets, no MPI needed.
+// Processes are started by the user (or any process launcher) and find each
+// other through environment variables:
+//   D4P_RANK    id of the current process, 0..D4P_NPROCS-1
+//   D4P_NPROCS  number of processes
+//   D4P_HOST    address all processes listen on, defaults to 127.0.0.1
+//   D4P_PORT    base port, process i listens on D4P_PORT+i, defaults to 29400
+// Every pair of processes is connected once, collectives use the default
+// implementations from transceiver_impl.
+class socket_transceiver : public transceiver_impl
+{
+public:
+    socket_transceiver() : transceiver_impl(), m_rank(0), m_size(1) {}
+
+    virtual void init();
+
+    virtual void fini();
+
+    virtual size_t nMembers();
+
+    virtual size_t me();
+
+    virtual void send(const void* buff, size_t N, size_t recpnt, size_t tag);
+
+    virtual size_t recv(void * buff, size_t N, int sender, int tag);
+
+private:
+    // bytes received from a peer but not yet consumed by recv
+    struct inbox
+    {
+        std::vector<char> data;
+        size_t pos = 0;
+        size_t available() const { return data.size() - pos; }
+    };
+
+    // read whatever is available on the socket of peer into its inbox
+    // @return false if nothing could be read without blocking
+    bool drain(size_t peer, bool block);
+
+    // make sure at least N unconsumed bytes are in the inbox of peer
+    void fill(size_t peer, size_t N);
+
+    // move N bytes from the inbox of peer to buff
+    void take(size_t peer, void * buff, size_t N);
+
+    size_t m_rank;
+    size_t m_size;
+    std::vector<int> m_sockets;
+    std::vector<inbox> m_inboxes;
+};
+
+#endif // _SOCKET_TRANSCEIVER_INCLUDED_
@@ -32,6 +32,7 @@
 // package, such as MPI. It also allows us to select the communication layer at runtime.
 // The transceiver implementation can be selected by setting env var 'D4P_TRANSCEIVER' to the module name.
 // The current default is 'mpi_transceiver'.
+// 'socket_transceiver' is a dependency-free alternative for processes on one host.
 
 
 #ifndef _TRANSCEIVER_INCLUDED_
@@ -41,6 +42,8 @@
 #include <memory>
 #include <iostream>
 #include <cassert>
+#include <cstring>
+#include <stdexcept>
 #include "daal4py_defines.h"
 
 // Abstract class with minimal functionality needed for communicating between processes.
@@ -167,25 +170,184 @@ public:
 	}
     }
     
-    virtual void * gather(const void * ptr, size_t N, size_t root, const size_t * sizes, bool varying)
+    // Default collectives are built from point-to-point messages only:
+    // gather/bcast are linear over root, reduce_all is a reduce on root
+    // followed by a bcast and reduce_exscan is a chain along the ranks.
+    // Each rank talks to at most one peer at a time in all of them, so a
+    // transceiver with blocking send/recv cannot deadlock here.
+
+    virtual void * gather(const void * ptr, size_t N, size_t root, const size_t * sizes, bool varying=true)
     {
-        throw std::logic_error("transceiver_base::gather not yet implemented");
+        if(m_me != root) {
+            send(ptr, N, root, GATHER_TAG);
+            return NULL;
+        }
+        size_t tot_sz = 0;
+        for(size_t i = 0; i < m_nMembers; ++i) {
+            size_t sz = varying ? sizes[i] : N;
+            DAAL4PY_OVERFLOW_CHECK_BY_ADDING(size_t, tot_sz, sz);
+            tot_sz += sz;
+        }
+        char * buff = static_cast<char *>(daal::services::daal_malloc(tot_sz > 0 ? tot_sz : 1));
+        DAAL4PY_CHECK_MALLOC(buff);
+        size_t offset = 0;
+        for(size_t i = 0; i < m_nMembers; ++i) {
+            size_t sz = varying ? sizes[i] : N;
+            if(i == m_me) {
+                if(N > 0) memcpy(buff + offset, ptr, N);
+            } else {
+                recv(buff + offset, sz, i, GATHER_TAG);
+            }
+            offset += sz;
+        }
+        return buff;
     }
 
     virtual void bcast(void * ptr, size_t N, size_t root)
     {
-        throw std::logic_error("transceiver_base::bcast not yet implemented");
+        if(m_me == root) {
+            for(size_t i = 0; i < m_nMembers; ++i) {
+                if(i != root) send(ptr, N, i, BCAST_TAG);
+            }
+        } else {
+            recv(ptr, N, root, BCAST_TAG);
+        }
     }
 
     virtual void reduce_all(void * inout, type_type T, size_t N, operation_type op)
     {
-        throw std::logic_error("transceiver_base::reduce_all not yet implemented");
+        size_t nbytes = N * type_size(T);
+        if(m_me == 0) {
+            char * tmp = static_cast<char *>(daal::services::daal_malloc(nbytes > 0 ? nbytes : 1));
+            DAAL4PY_CHECK_MALLOC(tmp);
+            for(size_t i = 1; i < m_nMembers; ++i) {
+                recv(tmp, nbytes, i, REDUCE_TAG);
+                reduce(inout, tmp, T, N, op);
+            }
+            daal::services::daal_free(tmp);
+            tmp = NULL;
+        } else {
+            send(inout, nbytes, 0, REDUCE_TAG);
+        }
+        bcast(inout, nbytes, 0);
     }
 
     virtual void reduce_exscan(void * inout, type_type T, size_t N, operation_type op)
     {
-        throw std::logic_error("transceiver_base::reduce_exscan not yet implemented");
+        // rank i receives the reduction over [0:i[, forwards it combined
+        // with its own contribution and keeps the received one.
+        // As with MPI_Exscan the result on rank 0 is undefined (left unchanged).
+        size_t nbytes = N * type_size(T);
+        if(m_nMembers < 2) return;
+        if(m_me == 0) {
+            send(inout, nbytes, 1, EXSCAN_TAG);
+            return;
+        }
+        char * prefix = static_cast<char *>(daal::services::daal_malloc(nbytes > 0 ? nbytes : 1));
+        DAAL4PY_CHECK_MALLOC(prefix);
+        recv(prefix, nbytes, m_me - 1, EXSCAN_TAG);
+        if(m_me + 1 < m_nMembers) {
+            reduce(inout, prefix, T, N, op);
+            send(inout, nbytes, m_me + 1, EXSCAN_TAG);
+        }
+        if(nbytes > 0) memcpy(inout, prefix, nbytes);
+        daal::services::daal_free(prefix);
+        prefix = NULL;
+    }
+
+    // @return size in bytes of an element of given type
+    static size_t type_size(type_type T)
+    {
+        switch(T) {
+        case BOOL:   return sizeof(bool);
+        case INT8:   return sizeof(int8_t);
+        case UINT8:  return sizeof(uint8_t);
+        case INT32:  return sizeof(int32_t);
+        case UINT32: return sizeof(uint32_t);
+        case INT64:  return sizeof(int64_t);
+        case UINT64: return sizeof(uint64_t);
+        case FLOAT:  return sizeof(float);
+        case DOUBLE: return sizeof(double);
+        default: throw std::logic_error("unsupported data type");
+        }
+    }
+
+    // Element-wise inout = op(inout, in)
+    static void reduce(void * inout, const void * in, type_type T, size_t N, operation_type op)
+    {
+        switch(T) {
+        case BOOL:   reduce_bool(static_cast<bool *>(inout), static_cast<const bool *>(in), N, op); break;
+        case INT8:   reduce_typed(static_cast<int8_t *>(inout), static_cast<const int8_t *>(in), N, op); break;
+        case UINT8:  reduce_typed(static_cast<uint8_t *>(inout), static_cast<const uint8_t *>(in), N, op); break;
+        case INT32:  reduce_typed(static_cast<int32_t *>(inout), static_cast<const int32_t *>(in), N, op); break;
+        case UINT32: reduce_typed(static_cast<uint32_t *>(inout), static_cast<const uint32_t *>(in), N, op); break;
+        case INT64:  reduce_typed(static_cast<int64_t *>(inout), static_cast<const int64_t *>(in), N, op); break;
+        case UINT64: reduce_typed(static_cast<uint64_t *>(inout), static_cast<const uint64_t *>(in), N, op); break;
+        case FLOAT:  reduce_float(static_cast<float *>(inout), static_cast<const float *>(in), N, op); break;
+        case DOUBLE: reduce_float(static_cast<double *>(inout), static_cast<const double *>(in), N, op); break;
+        default: throw std::logic_error("unsupported data type");
+        }
     }
+
+protected:
+    // tags of the messages exchanged by the default collectives
+    enum collective_tag {
+        GATHER_TAG = 0x7ff0,
+        BCAST_TAG,
+        REDUCE_TAG,
+        EXSCAN_TAG
+    };
+
+    template<typename T>
+    static bool reduce_common(T * inout, const T * in, size_t N, operation_type op)
+    {
+        switch(op) {
+        case OP_MAX:  for(size_t i = 0; i < N; ++i) inout[i] = inout[i] < in[i] ? in[i] : inout[i]; return true;
+        case OP_MIN:  for(size_t i = 0; i < N; ++i) inout[i] = in[i] < inout[i] ? in[i] : inout[i]; return true;
+        case OP_SUM:  for(size_t i = 0; i < N; ++i) inout[i] = inout[i] + in[i]; return true;
+        case OP_PROD: for(size_t i = 0; i < N; ++i) inout[i] = inout[i] * in[i]; return true;
+        case OP_LAND: for(size_t i = 0; i < N; ++i) inout[i] = inout[i] && in[i]; return true;
+        case OP_LOR:  for(size_t i = 0; i < N; ++i) inout[i] = inout[i] || in[i]; return true;
+        case OP_LXOR: for(size_t i = 0; i < N; ++i) inout[i] = !inout[i] != !in[i]; return true;
+        default: return false;
+        }
+    }
+
+    template<typename T>
+    static void reduce_typed(T * inout, const T * in, size_t N, operation_type op)
+    {
+        if(reduce_common(inout, in, N, op)) return;
+        switch(op) {
+        case OP_BAND: for(size_t i = 0; i < N; ++i) inout[i] = inout[i] & in[i]; break;
+        case OP_BOR:  for(size_t i = 0; i < N; ++i) inout[i] = inout[i] | in[i]; break;
+        case OP_BXOR: for(size_t i = 0; i < N; ++i) inout[i] = inout[i] ^ in[i]; break;
+        default: throw std::logic_error("unsupported operation type");
+        }
+    }
+
+    static void reduce_bool(bool * inout, const bool * in, size_t N, operation_type op)
+    {
+        switch(op) {
+        case OP_MAX:
+        case OP_SUM:
+        case OP_LOR:
+        case OP_BOR:  for(size_t i = 0; i < N; ++i) inout[i] = inout[i] || in[i]; break;
+        case OP_MIN:
+        case OP_PROD:
+        case OP_LAND:
+        case OP_BAND: for(size_t i = 0; i < N; ++i) inout[i] = inout[i] && in[i]; break;
+        case OP_LXOR:
+        case OP_BXOR: for(size_t i = 0; i < N; ++i) inout[i] = inout[i] != in[i]; break;
+        default: throw std::logic_error("unsupported operation type");
+        }
+    }
+
+    template<typename T>
+    static void reduce_float(T * inout, const T * in, size_t N, operation_type op)
+    {
+        if(!reduce_common(inout, in, N, op)) throw std::logic_error("unsupported operation type");
+    }
+
 protected:
     bool m_initialized;
     size_t m_me;        // result of me()
@@ -22,6 +22,8 @@
 #include <daal.h>
 #include <vector>
 #include <algorithm>
+#include <thread>
+#include <exception>
 
 #define TERMINAL_NODE -1
 #define NO_FEATURE -2
@@ -102,8 +104,8 @@ std::vector<T> arange(T start, T stop, T step = 1) {
 // We only expose the minimum information to cython
 struct TreeState
 {
-    skl_tree_node *node_ar;
-    double        *value_ar;
+    skl_tree_node *node_ar = nullptr;
+    double        *value_ar = nullptr;
     size_t         max_depth;
     size_t         node_count;
     size_t         leaf_count;
@@ -147,6 +149,48 @@ TreeState _getTreeState(M * model, size_t iTree, size_t n_classes)
     return TreeState(tsv);
 }
 
+// This is the function for getting the states of all trees of a forest at once which we use in cython
+// Trees are independent, so they are converted by a pool of threads; the model is only read.
+// The pool is limited to the number of threads oneDAL may use (see daalinit).
+// Note: the caller will own the memory of the 2 arrays of every returned state!
+template<typename M>
+std::vector<TreeState> _getTreeStates(M * model, size_t n_classes)
+{
+    const size_t n_trees = (*model)->numberOfTrees();
+    std::vector<TreeState> states(n_trees);
+    const size_t max_threads = daal::services::Environment::getInstance()->getNumberOfThreads();
+    const size_t n_threads = std::max<size_t>(1, std::min<size_t>(max_threads, n_trees));
+    std::vector<std::exception_ptr> errors(n_threads);
+
+    auto convert = [&](size_t thread_id) {
+        try {
+            for(size_t i = thread_id; i < n_trees; i += n_threads) {
+                states[i] = _getTreeState(model, i, n_classes);
+            }
+        } catch(...) {
+            errors[thread_id] = std::current_exception();
+        }
+    };
+
+    std::vector<std::thread> workers;
+    workers.reserve(n_threads - 1);
+    for(size_t t = 1; t < n_threads; ++t) workers.emplace_back(convert, t);
+    convert(0);
+    for(auto & worker : workers) worker.join();
+
+    for(auto & error : errors) {
+        if(error) {
+            // trees that were converted before the failure would leak otherwise
+            for(auto & state : states) {
+                delete [] state.node_ar;
+                delete [] state.value_ar;
+            }
+            std::rethrow_exception(error);
+        }
+    }
+    return states;
+}
+
 // This is the function for getting the tree state frmo a tree which we use in cython
 // we will have different model types, so it's a template
 // Note: the caller will own the memory of the 2 returned arrays!
@@ -128,6 +128,46 @@ if d4p.__has_dist__:
                         left == right
                     )
 
+        def test_kmeans_estimator_spmd(self):
+            from daal4py.sklearn.cluster import KMeans
+
+            data = np.loadtxt("./data/distributed/kmeans_dense.csv", delimiter=',')
+            rpp = int(data.shape[0] / d4p.num_procs())
+            node_stride = rpp * d4p.my_procid()
+            node_data = data[node_stride:node_stride + rpp, :]
+            init = data[:10]
+
+            batch = KMeans(n_clusters=10, init=init, n_init=1,
+                           max_iter=25).fit(data[:rpp * d4p.num_procs()])
+            spmd = KMeans(n_clusters=10, init=init, n_init=1, max_iter=25,
+                          distributed=True).fit(node_data)
+
+            self.assertTrue(np.allclose(batch.cluster_centers_, spmd.cluster_centers_))
+            self.assertTrue(np.allclose(batch.inertia_, spmd.inertia_))
+            self.assertTrue(np.array_equal(
+                batch.labels_[node_stride:node_stride + rpp], spmd.labels_))
+
+        def test_dbscan_estimator_spmd(self):
+            from daal4py.sklearn.cluster import DBSCAN
+
+            data = np_read_csv(os.path.join(".", 'data', 'batch', 'dbscan_dense.csv'))
+            rpp = int(data.shape[0] / d4p.num_procs())
+            node_stride = rpp * d4p.my_procid()
+            node_data = data[node_stride:node_stride + rpp, :]
+
+            batch = DBSCAN(eps=0.04, min_samples=45).fit(data)
+            spmd = DBSCAN(eps=0.04, min_samples=45, distributed=True).fit(node_data)
+
+            # cluster ids may differ between batch and spmd and border points
+            # may be assigned differently, core points must agree
+            self.assertEqual(spmd.labels_.shape, (rpp,))
+            cluster_index_dict = {}
+            for i in batch.core_sample_indices_:
+                if node_stride <= i < node_stride + rpp:
+                    right = spmd.labels_[i - node_stride]
+                    left = cluster_index_dict.setdefault(batch.labels_[i], right)
+                    self.assertEqual(left, right)
+
     gen_examples = [
         ('covariance_spmd', 'covariance.csv', 'covariance'),
         ('low_order_moms_spmd', 'low_order_moms_dense_batch.csv',
@@ -0,0 +1,103 @@
+#===============================================================================
+# Copyright 2014-2022 Intel Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#===============================================================================
+
+import importlib.util
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import unittest
+import numpy as np
+import daal4py as d4p
+
+N_PROCS = 4
+
+# Every rank computes on its chunk of the same data and saves the results
+RANK_SCRIPT = '''
+import sys
+import numpy as np
+import daal4py as d4p
+
+d4p.daalinit()
+rank, n_procs = d4p.my_procid(), d4p.num_procs()
+assert n_procs == {n_procs}, n_procs
+data = np.random.RandomState(0).rand(400, 5)
+chunk = np.array_split(data, n_procs)[rank]
+
+cov = d4p.covariance(distributed=True).compute(chunk)
+moments = d4p.low_order_moments(distributed=True).compute(chunk)
+kmeans = d4p.kmeans(nClusters=4, maxIterations=10,
+                    distributed=True).compute(chunk, data[:4])
+np.savez(sys.argv[1], rank=rank, covariance=cov.covariance, mean=cov.mean,
+         variance=moments.variance, centroids=kmeans.centroids)
+d4p.daalfini()
+'''
+
+
+def _free_port_range(n_ports):
+    """First of n_ports consecutive ports that are free on localhost"""
+    for _ in range(100):
+        base = random.randint(20000, 60000 - n_ports)
+        try:
+            for port in range(base, base + n_ports):
+                with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+                    s.bind(('127.0.0.1', port))
+        except OSError:
+            continue
+        return base
+    raise RuntimeError('No free port range found')
+
+
+@unittest.skipUnless(importlib.util.find_spec('daal4py.socket_transceiver'),
+                     'daal4py is built without the socket transceiver')
+class Test(unittest.TestCase):
+    def test_spmd_matches_batch(self):
+        port = _free_port_range(N_PROCS)
+        with tempfile.TemporaryDirectory() as tmp:
+            outputs = [os.path.join(tmp, f'rank{i}.npz') for i in range(N_PROCS)]
+            procs = []
+            for rank, output in enumerate(outputs):
+                env = dict(os.environ,
+                           D4P_TRANSCEIVER='daal4py.socket_transceiver',
+                           D4P_NPROCS=str(N_PROCS), D4P_RANK=str(rank),
+                           D4P_PORT=str(port))
+                procs.append(subprocess.Popen(
+                    [sys.executable, '-c', RANK_SCRIPT.format(n_procs=N_PROCS),
+                     output], env=env))
+            try:
+                for proc in procs:
+                    self.assertEqual(proc.wait(timeout=300), 0)
+            finally:
+                for proc in procs:
+                    proc.kill()
+            results = [dict(np.load(output)) for output in outputs]
+
+        data = np.random.RandomState(0).rand(400, 5)
+        cov = d4p.covariance().compute(data)
+        moments = d4p.low_order_moments().compute(data)
+        kmeans = d4p.kmeans(nClusters=4, maxIterations=10).compute(data, data[:4])
+        for rank, result in enumerate(results):
+            self.assertEqual(result['rank'], rank)
+            self.assertTrue(np.allclose(result['covariance'], cov.covariance))
+            self.assertTrue(np.allclose(result['mean'], cov.mean))
+            self.assertTrue(np.allclose(result['variance'], moments.variance))
+            self.assertTrue(np.allclose(result['centroids'], kmeans.centroids))
+
+
+if __name__ == '__main__':
+    unittest.main()